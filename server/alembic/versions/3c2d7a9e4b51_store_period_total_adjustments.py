@@ -0,0 +1,43 @@
+"""store period total adjustments
+
+Revision ID: 3c2d7a9e4b51
+Revises: f809e983d724
+Create Date: 2026-10-17 11:24:08.913502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c2d7a9e4b51'
+down_revision: Union[str, Sequence[str], None] = 'f809e983d724'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('budget_periods', sa.Column('total_adjustments', sa.DECIMAL(precision=12, scale=2), nullable=True))
+
+    # Backfill from existing adjustment transactions
+    op.execute(
+        """
+        UPDATE budget_periods
+        SET total_adjustments = coalesce(
+            (
+                SELECT sum(transactions.amount)
+                FROM transactions
+                WHERE transactions.budget_period_id = budget_periods.id AND transactions.type = 'adjustment'
+            ),
+            0
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('budget_periods', 'total_adjustments')
@@ -0,0 +1,42 @@
+"""add recurring transaction indexes
+
+Revision ID: 7e4f1b2c9d83
+Revises: 3c2d7a9e4b51
+Create Date: 2026-10-17 15:02:41.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e4f1b2c9d83'
+down_revision: Union[str, Sequence[str], None] = '3c2d7a9e4b51'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_recurring_transactions_user_id_active',
+        'recurring_transactions',
+        ['user_id', 'id'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+    op.create_index(
+        'ix_recurring_transactions_next_due_date_active',
+        'recurring_transactions',
+        ['next_due_date'],
+        unique=False,
+        postgresql_where=sa.text('is_active'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_recurring_transactions_next_due_date_active', table_name='recurring_transactions', postgresql_where=sa.text('is_active'))
+    op.drop_index('ix_recurring_transactions_user_id_active', table_name='recurring_transactions', postgresql_where=sa.text('is_active'))
@@ -0,0 +1,61 @@
+"""add transaction rollups
+
+Revision ID: b934a0d3a114
+Revises: 813f0b17389d
+Create Date: 2026-10-17 09:12:41.205318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b934a0d3a114'
+down_revision: Union[str, Sequence[str], None] = '813f0b17389d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('transaction_rollups',
+    sa.Column('user_id', sa.UUID(), nullable=False),
+    sa.Column('budget_period_id', sa.UUID(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Integer(), nullable=False),
+    sa.Column('category_id', sa.UUID(), nullable=False),
+    sa.Column('type', sa.String(length=20), nullable=False),
+    sa.Column('total_amount', sa.DECIMAL(precision=14, scale=2), nullable=False),
+    sa.Column('transaction_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['budget_period_id'], ['budget_periods.id'], name=op.f('fk_transaction_rollups_budget_period_id_budget_periods'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['category_id'], ['categories.id'], name=op.f('fk_transaction_rollups_category_id_categories'), ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], name=op.f('fk_transaction_rollups_user_id_users'), ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'budget_period_id', 'year', 'month', 'category_id', 'type', name=op.f('pk_transaction_rollups'))
+    )
+
+    # Backfill the rollups from existing transactions
+    op.execute(
+        """
+        INSERT INTO transaction_rollups
+            (user_id, budget_period_id, year, month, category_id, type, total_amount, transaction_count)
+        SELECT
+            user_id,
+            budget_period_id,
+            extract(year FROM transacted_at AT TIME ZONE 'UTC'),
+            extract(month FROM transacted_at AT TIME ZONE 'UTC'),
+            category_id,
+            type,
+            sum(amount),
+            count(id)
+        FROM transactions
+        GROUP BY 1, 2, 3, 4, 5, 6
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('transaction_rollups')
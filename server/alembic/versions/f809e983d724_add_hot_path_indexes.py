@@ -0,0 +1,50 @@
+"""add hot path indexes
+
+Revision ID: f809e983d724
+Revises: b934a0d3a114
+Create Date: 2026-10-17 10:02:17.481920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f809e983d724'
+down_revision: Union[str, Sequence[str], None] = 'b934a0d3a114'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_transactions_user_id_transacted_at', 'transactions', ['user_id', 'transacted_at', 'id'], unique=False)
+    op.create_index('ix_transactions_budget_period_id_type', 'transactions', ['budget_period_id', 'type'], unique=False)
+    op.create_index('ix_transactions_category_id', 'transactions', ['category_id'], unique=False)
+    op.create_index('ix_budget_periods_user_id_started_at', 'budget_periods', ['user_id', 'started_at'], unique=False)
+    op.create_index('ix_budget_periods_user_id_ended_at', 'budget_periods', ['user_id', 'ended_at'], unique=False)
+    op.create_index(
+        'ix_budget_periods_user_id_active',
+        'budget_periods',
+        ['user_id', 'started_at'],
+        unique=False,
+        postgresql_where=sa.text("status = 'active' AND ended_at IS NULL"),
+    )
+    op.create_index('ix_categories_user_id', 'categories', ['user_id'], unique=False)
+    op.create_index('ix_financial_goals_user_id_target_date', 'financial_goals', ['user_id', 'target_date'], unique=False)
+    op.create_index('ix_transaction_rollups_user_id_year_month', 'transaction_rollups', ['user_id', 'year', 'month'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_transaction_rollups_user_id_year_month', table_name='transaction_rollups')
+    op.drop_index('ix_financial_goals_user_id_target_date', table_name='financial_goals')
+    op.drop_index('ix_categories_user_id', table_name='categories')
+    op.drop_index('ix_budget_periods_user_id_active', table_name='budget_periods', postgresql_where=sa.text("status = 'active' AND ended_at IS NULL"))
+    op.drop_index('ix_budget_periods_user_id_ended_at', table_name='budget_periods')
+    op.drop_index('ix_budget_periods_user_id_started_at', table_name='budget_periods')
+    op.drop_index('ix_transactions_category_id', table_name='transactions')
+    op.drop_index('ix_transactions_budget_period_id_type', table_name='transactions')
+    op.drop_index('ix_transactions_user_id_transacted_at', table_name='transactions')
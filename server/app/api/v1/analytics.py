@@ -1,13 +1,24 @@
+from datetime import date
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.models import User
-from app.schemas import ApiResponse, CategoryBreakdown, DashboardSummary, SpendTrend, YearlySummary
+from app.schemas import (
+    ApiResponse,
+    CategoryBreakdown,
+    DashboardSummary,
+    NetWorthPoint,
+    PeriodForecast,
+    SpendTrend,
+    YearlySummary,
+)
 from app.services.analytics_service import AnalyticsService
+from app.services.forecast_service import ForecastService
+from app.utils.analytics_cache import cached_analytics
 
 router = APIRouter()
 
@@ -16,7 +27,9 @@ router = APIRouter()
 async def get_dashboard_summary(current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)):
     """Get dashboard summary with current period overview"""
     service = AnalyticsService(db)
-    summary = await service.get_dashboard_summary(current_user.id)
+    summary = await cached_analytics(
+        current_user.id, "dashboard", lambda: service.get_dashboard_summary(current_user.id)
+    )
     return ApiResponse(result=summary)
 
 
@@ -26,7 +39,9 @@ async def get_yearly_summary(
 ):
     """Get yearly financial summary"""
     service = AnalyticsService(db)
-    summary = await service.get_yearly_summary(current_user.id, year)
+    summary = await cached_analytics(
+        current_user.id, "yearly", lambda: service.get_yearly_summary(current_user.id, year), year
+    )
     return ApiResponse(result=summary)
 
 
@@ -38,7 +53,9 @@ async def get_spending_trends(
 ):
     """Get spending trends over time"""
     service = AnalyticsService(db)
-    trends = await service.get_spending_trends(current_user.id, months)
+    trends = await cached_analytics(
+        current_user.id, "trends", lambda: service.get_spending_trends(current_user.id, months), months
+    )
     return ApiResponse(result=trends)
 
 
@@ -50,5 +67,46 @@ async def get_category_breakdown(
 ):
     """Get category breakdown for a specific period or current period"""
     service = AnalyticsService(db)
-    breakdown = await service.get_category_breakdown(current_user.id, period_id)
+    breakdown = await cached_analytics(
+        current_user.id,
+        "categories",
+        lambda: service.get_category_breakdown(current_user.id, period_id),
+        period_id or "current",
+    )
     return ApiResponse(result=breakdown)
+
+
+@router.get("/forecast", response_model=ApiResponse[List[PeriodForecast]])
+async def get_forecast(
+    periods: int = Query(6, ge=3, le=12),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Project totals and carry forward for the next budget periods"""
+    service = ForecastService(db)
+    try:
+        forecast = await cached_analytics(
+            current_user.id, "forecast", lambda: service.forecast_periods(current_user.id, periods), periods
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return ApiResponse(result=forecast)
+
+
+@router.get("/net-worth", response_model=ApiResponse[List[NetWorthPoint]])
+async def get_net_worth_series(
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Get cumulative net worth per budget period as a time series"""
+    service = AnalyticsService(db)
+    series = await cached_analytics(
+        current_user.id,
+        "net_worth",
+        lambda: service.get_net_worth_series(current_user.id, start_date, end_date),
+        start_date or "start",
+        end_date or "end",
+    )
+    return ApiResponse(result=series)
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db
@@ -18,6 +18,7 @@ from app.schemas.budget_period_schemas import (
     CompletePeriodRequest,
 )
 from app.services.budget_service import BudgetService
+from app.utils.job_queue import job_queue
 
 router = APIRouter()
 
@@ -46,7 +47,7 @@ async def get_current_period(current_user: User = Depends(get_current_user), db:
             status_code=status.HTTP_404_NOT_FOUND,
             detail="No active budget period found. Please create a new budget period.",
         )
-    summary = await service.get_period_summary(period.id, current_user.id)
+    summary = await service.build_period_summary(period)
     return ApiResponse(result=summary)
 
 
@@ -70,10 +71,9 @@ async def get_budget_period(
 ):
     """Get specific budget period with summary"""
     service = BudgetService(db)
-    period = await service.get_budget_period(period_id, current_user.id)
-    if not period:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Budget period not found")
     summary = await service.get_period_summary(period_id, current_user.id)
+    if not summary:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Budget period not found")
     return ApiResponse(result=summary)
 
 
@@ -105,13 +105,50 @@ async def complete_budget_period(
     return ApiResponse(result=completed_period)
 
 
+@router.get("/{period_id}/verify", response_model=ApiResponse[dict])
+async def verify_budget_period_totals(
+    period_id: UUID,
+    repair: bool = Query(False, description="Recalculate the totals from transactions if they have drifted"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Check a budget period's running totals against its transactions"""
+    service = BudgetService(db)
+    period = await service.get_budget_period(period_id, current_user.id)
+    if not period:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Budget period not found")
+
+    drift = await service.verify_period_totals(period_id)
+    if drift and repair:
+        await service.recalculate_period_totals(period_id)
+
+    return ApiResponse(
+        result={"period_id": str(period_id), "in_sync": not drift, "repaired": bool(drift and repair), "drift": drift}
+    )
+
+
 @router.post("/rebuild", response_model=ApiResponse[List[BudgetPeriodResponse]])
 async def rebuild_budget_periods(
     period_ids: BulkRebuildRequest,
+    response: Response,
+    background: bool = Query(False, description="Queue the rebuild for the background worker and return at once"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     """Rebuild budget periods from a list of IDs"""
+    if background:
+        job_id = await job_queue.enqueue(
+            "rebuild_period_chain",
+            {"user_id": str(current_user.id), "period_ids": [str(period_id) for period_id in period_ids.period_ids]},
+        )
+        # Without Redis the rebuild runs in the request as before
+        if job_id is not None:
+            response.status_code = status.HTTP_202_ACCEPTED
+            return ApiResponse(
+                result=[],
+                meta=ResponseMeta(message=f"Queued rebuild of {len(period_ids.period_ids)} budget periods as job {job_id}"),
+            )
+
     service = BudgetService(db)
     rebuilt_periods = await service.rebuild_budget_periods(period_ids.period_ids, current_user.id)
     return ApiResponse(
@@ -1,11 +1,13 @@
 from datetime import date
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.database import get_db
+from app.config import settings
+from app.database import AsyncSessionLocal, get_db
 from app.dependencies import get_current_user
 from app.models.user_models import User
 from app.schemas import (
@@ -15,12 +17,17 @@ from app.schemas import (
     ResponseMeta,
 )
 from app.schemas.transaction_schemas import (
+    StatementImportResult,
     TransactionCreate,
     TransactionResponse,
     TransactionUpdate,
     TransactionWithCategory,
 )
+from app.services.export_service import EXPORT_FORMATS, TransactionExportService
+from app.services.statement_import_service import StatementImportService, read_chunks
 from app.services.transaction_service import TransactionService
+from app.utils.pagination import Cursor, decode_cursor, encode_cursor, filters_key
+from app.utils.serialization import FastJSONResponse, paginated_content, transaction_rows_content
 
 router = APIRouter()
 
@@ -34,19 +41,19 @@ async def get_transactions(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     period_id: Optional[UUID] = None,
+    cursor: Optional[str] = Query(None, description="Cursor from meta.next_cursor; takes precedence over page"),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get user transactions with filters and pagination"""
-    service = TransactionService(db)
+    """Get user transactions with filters and pagination.
 
-    # Calculate skip from page
-    skip = (page - 1) * limit
+    Every page returns a next_cursor in its meta. Following it pages by (transacted_at, id) keyset
+    instead of offset, and reuses the total counted on the first page, so deep pages cost the same
+    as the first one.
+    """
+    service = TransactionService(db)
 
-    # Get transactions and total count
-    transactions = await service.get_transactions(
-        user_id=current_user.id,
-        skip=skip,
+    filters = filters_key(
         limit=limit,
         category_id=category_id,
         transaction_type=transaction_type,
@@ -54,22 +61,93 @@ async def get_transactions(
         end_date=end_date,
         period_id=period_id,
     )
+    position = None
+    if cursor:
+        try:
+            position = decode_cursor(cursor, filters)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+        page = position.page
 
-    # Get total count for pagination
-    total = await service.count_transactions(
+    # Fetch one extra row to know whether there is a next page
+    fetch = service.get_transaction_rows if settings.FAST_SERIALIZATION else service.get_transactions
+    transactions = await fetch(
         user_id=current_user.id,
+        skip=0 if position else (page - 1) * limit,
+        limit=limit + 1,
         category_id=category_id,
         transaction_type=transaction_type,
         start_date=start_date,
         end_date=end_date,
         period_id=period_id,
+        after=(position.transacted_at, position.id) if position else None,
     )
+    has_next = len(transactions) > limit
+    transactions = transactions[:limit]
 
+    # The total is counted once and then carried in the cursor
+    if position:
+        total = position.total
+    else:
+        total = await service.count_transactions(
+            user_id=current_user.id,
+            category_id=category_id,
+            transaction_type=transaction_type,
+            start_date=start_date,
+            end_date=end_date,
+            period_id=period_id,
+        )
+
+    next_cursor = None
+    if has_next:
+        last = transactions[-1]
+        next_cursor = encode_cursor(Cursor(last.transacted_at, last.id, page + 1, total, filters))
+
+    if settings.FAST_SERIALIZATION:
+        return FastJSONResponse(
+            paginated_content(
+                transaction_rows_content(transactions),
+                page=page,
+                limit=limit,
+                total=total,
+                next_cursor=next_cursor,
+            )
+        )
     return PaginatedApiResponse.create(
         items=transactions,
         page=page,
         limit=limit,
         total=total,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/export")
+async def export_transactions(
+    export_format: Literal["csv", "ndjson", "parquet"] = Query("csv", alias="format"),
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    current_user: User = Depends(get_current_user),
+):
+    """Export all of the user's transactions as CSV, NDJSON or Parquet.
+
+    Rows are streamed from a server-side cursor and encoded as they arrive, so exports of any size run
+    in constant memory.
+    """
+    user_id = current_user.id
+
+    # The request's session is closed before the body is sent, so the stream owns its own
+    async def stream():
+        async with AsyncSessionLocal() as db:
+            service = TransactionExportService(db)
+            async for chunk in service.export_transactions(user_id, export_format, start_date, end_date):
+                yield chunk
+
+    media_type, extension = EXPORT_FORMATS[export_format]
+    return StreamingResponse(
+        stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="transactions.{extension}"'},
     )
 
 
@@ -145,3 +223,41 @@ async def bulk_create_transactions(
         result=created_transactions,
         meta=ResponseMeta(message=f"Successfully created {len(created_transactions)} transactions"),
     )
+
+
+@router.post("/import", response_model=ApiResponse[StatementImportResult])
+async def import_transactions(
+    file: UploadFile = File(..., description="CSV (date, amount, category, ...) or OFX/QFX statement"),
+    default_category_id: Optional[UUID] = Form(None, description="Category for debits without one, e.g. OFX"),
+    default_income_category_id: Optional[UUID] = Form(None, description="Category for credits without one"),
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Import a bank statement.
+
+    The file is parsed chunk by chunk and written in batches, so large statements import with flat
+    memory use. Invalid rows are skipped and reported. An error that stops the file part-way returns the
+    batches already committed with the error, rather than failing the request.
+    """
+    if file.size is not None and file.size > settings.MAX_FILE_SIZE:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="File too large")
+
+    filename = (file.filename or "").lower()
+    file_format = "ofx" if filename.endswith((".ofx", ".qfx")) else "csv"
+
+    service = StatementImportService(db)
+    try:
+        result = await service.import_statement(
+            current_user.id,
+            read_chunks(file, settings.MAX_FILE_SIZE),
+            file_format,
+            default_category_id=default_category_id,
+            default_income_category_id=default_income_category_id,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    message = f"Imported {result.imported} of {result.rows_processed} rows in {len(result.batches)} batches"
+    if result.error:
+        message += f", then stopped: {result.error}"
+    return ApiResponse(result=result, meta=ResponseMeta(message=message))
@@ -48,7 +48,7 @@ async def get_current_user(
         )
 
     user_service = UserService(db)
-    user = await user_service.get_user_by_id(user_id)
+    user = await user_service.get_authenticated_user(user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
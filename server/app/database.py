@@ -1,6 +1,13 @@
+import json
+import time
+from decimal import Decimal
+from functools import partial
+
 from sqlalchemy import MetaData
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.config import settings
 
@@ -15,11 +22,58 @@ naming_convention = {
 
 metadata = MetaData(naming_convention=naming_convention)
 
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long checkouts wait for a connection and how often they time out"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            self.checkouts += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+
+    def stats(self) -> dict:
+        return {
+            "pool_size": self.size(),
+            "max_overflow": self._max_overflow,
+            "checked_out": self.checkedout(),
+            "checked_in": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait / self.checkouts * 1000, 3) if self.checkouts else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 3),
+        }
+
+
 engine = create_async_engine(
     # settings.DATABASE_URL, echo=True if settings.ENV != "prod" else False, future=True
     settings.DATABASE_URL,
     echo=False,
     future=True,
+    poolclass=InstrumentedQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args={"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
+    # Keep money values exact when aggregating rows into JSON
+    json_deserializer=partial(json.loads, parse_float=Decimal),
 )  # Set to False in production
 
 AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
@@ -4,7 +4,7 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 from app.api.v1 import (
     analytics,
@@ -17,6 +17,9 @@ from app.api.v1 import (
     users,
 )
 from app.config import settings
+from app.database import engine
+from app.utils.metrics import MetricsMiddleware, install_query_hooks, render_metrics
+from app.utils.trading import trading212_client
 
 logger = logging.getLogger(__name__)
 
@@ -27,9 +30,11 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up...")
+    await trading212_client.start()
     yield
     # Shutdown
     logger.info("Shutting down...")
+    await trading212_client.close()
 
 
 app = FastAPI(
@@ -41,6 +46,9 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
+install_query_hooks(engine)
+app.add_middleware(MetricsMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -71,6 +79,22 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/db-pool")
+async def db_pool_stats():
+    """Connection pool usage for this process, for sizing DB_POOL_SIZE against Postgres' connection limit"""
+    return engine.pool.stats()
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus metrics for this process"""
+    pool_gauges = {
+        f"db_pool_{name.removeprefix('pool_')}": (f"Connection pool {name.replace('_', ' ')}", value)
+        for name, value in engine.pool.stats().items()
+    }
+    return PlainTextResponse(render_metrics(pool_gauges), media_type="text/plain; version=0.0.4")
+
+
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
     if isinstance(exc, HTTPException):
@@ -4,6 +4,7 @@ from app.models.financial_goal_models import FinancialGoal
 from app.models.recurring_transaction_models import RecurringTransaction
 from app.models.reference_models import AppLog, AppSetting, Currency, PaymentMethod
 from app.models.transaction_models import Transaction
+from app.models.transaction_rollup_models import TransactionRollup
 from app.models.user_models import User
 
 __all__ = [
@@ -11,6 +12,7 @@ __all__ = [
     "Category",
     "BudgetPeriod",
     "Transaction",
+    "TransactionRollup",
     "FinancialGoal",
     "RecurringTransaction",
     "Currency",
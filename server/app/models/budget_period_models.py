@@ -2,10 +2,10 @@ import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import DECIMAL, Column, DateTime, ForeignKey, String
+from sqlalchemy import DECIMAL, Column, DateTime, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import column_property, object_session, relationship
-from sqlalchemy.sql import and_, func, select, text
+from sqlalchemy.orm import object_session, relationship
+from sqlalchemy.sql import func, text
 
 from app.database import Base
 
@@ -22,22 +22,31 @@ class BudgetPeriod(Base):
     total_expenses = Column(DECIMAL(12, 2), default=0)
     total_savings = Column(DECIMAL(12, 2), default=0)
     total_investments = Column(DECIMAL(12, 2), default=0)
+    total_adjustments = Column(DECIMAL(12, 2), default=0)
     brought_forward = Column(DECIMAL(12, 2), default=0)  # Money brought IN from previous period
     carried_forward = Column(DECIMAL(12, 2), default=0)  # Money carried OUT to next period (calculated when completed)
     status = Column(String(20), default="active")  # active, completed, projected
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
-    total_adjustments = column_property(
-        select(func.coalesce(func.sum(text("amount")), 0))
-        .select_from(text("transactions"))
-        .where(text("budget_period_id = budget_periods.id AND type = 'adjustment'"))
-        .scalar_subquery()
-    )
 
     # Add next and previous period for easier navigation
     next_period_id = Column(UUID(as_uuid=True), ForeignKey("budget_periods.id"), nullable=True)
     previous_period_id = Column(UUID(as_uuid=True), ForeignKey("budget_periods.id"), nullable=True)
 
+    __table_args__ = (
+        # Period listing and date lookups
+        Index("ix_budget_periods_user_id_started_at", "user_id", "started_at"),
+        # Brought forward lookups
+        Index("ix_budget_periods_user_id_ended_at", "user_id", "ended_at"),
+        # Current period lookups
+        Index(
+            "ix_budget_periods_user_id_active",
+            "user_id",
+            "started_at",
+            postgresql_where=text("status = 'active' AND ended_at IS NULL"),
+        ),
+    )
+
     # Relationships
     user = relationship("User", back_populates="budget_periods")
     transactions = relationship("Transaction", back_populates="budget_period", cascade="all, delete-orphan")
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import DECIMAL, Boolean, Column, Date, DateTime, ForeignKey, String
+from sqlalchemy import DECIMAL, Boolean, Column, Date, DateTime, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -22,5 +22,7 @@ class FinancialGoal(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (Index("ix_financial_goals_user_id_target_date", "user_id", "target_date"),)
+
     # Relationships
     user = relationship("User", back_populates="financial_goals")
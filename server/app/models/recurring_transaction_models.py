@@ -1,9 +1,9 @@
 import uuid
 
-from sqlalchemy import DECIMAL, Boolean, Column, Date, DateTime, ForeignKey, String, Text
+from sqlalchemy import DECIMAL, Boolean, Column, Date, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from sqlalchemy.sql import func
+from sqlalchemy.sql import func, text
 
 from app.database import Base
 
@@ -25,6 +25,13 @@ class RecurringTransaction(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        # Upcoming bill projections, which expand each rule in id order
+        Index("ix_recurring_transactions_user_id_active", "user_id", "id", postgresql_where=text("is_active")),
+        # Materialization of due occurrences
+        Index("ix_recurring_transactions_next_due_date_active", "next_due_date", postgresql_where=text("is_active")),
+    )
+
     # Relationships
     user = relationship("User")
     category = relationship("Category")
@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import DECIMAL, Boolean, Column, Date, DateTime, ForeignKey, String, Text
+from sqlalchemy import DECIMAL, Boolean, Column, Date, DateTime, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -27,6 +27,14 @@ class Transaction(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    __table_args__ = (
+        # Listing, recent transactions and date-range filters per user
+        Index("ix_transactions_user_id_transacted_at", "user_id", "transacted_at", "id"),
+        # Period totals, expenses by category and top expenses
+        Index("ix_transactions_budget_period_id_type", "budget_period_id", "type"),
+        Index("ix_transactions_category_id", "category_id"),
+    )
+
     # Relationships
     user = relationship("User", back_populates="transactions")
     budget_period = relationship("BudgetPeriod", back_populates="transactions")
@@ -0,0 +1,28 @@
+"""Per-user, per-month, per-category transaction totals, maintained on transaction writes"""
+
+from sqlalchemy import DECIMAL, Column, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.database import Base
+
+
+class TransactionRollup(Base):
+    __tablename__ = "transaction_rollups"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    budget_period_id = Column(
+        UUID(as_uuid=True), ForeignKey("budget_periods.id", ondelete="CASCADE"), primary_key=True
+    )
+    year = Column(Integer, primary_key=True)
+    month = Column(Integer, primary_key=True)
+    category_id = Column(UUID(as_uuid=True), ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True)
+    type = Column(String(20), primary_key=True)  # income, expense, saving, investment, adjustment
+    total_amount = Column(DECIMAL(14, 2), nullable=False, default=0)
+    transaction_count = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        # Monthly trends and yearly breakdowns
+        Index("ix_transaction_rollups_user_id_year_month", "user_id", "year", "month"),
+    )
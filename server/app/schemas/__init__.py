@@ -6,6 +6,10 @@ from app.schemas.analytics_schemas import (
     YearlySummary,
     Trading212AccountData,
     InvestmentPerformance,
+    UpcomingBill,
+    CategoryForecast,
+    PeriodForecast,
+    NetWorthPoint,
 )
 from app.schemas.auth_schemas import OAuthCallback, Token, TokenData
 from app.schemas.budget_period_schemas import BudgetPeriodCreate, BudgetPeriodResponse, BudgetPeriodUpdate
@@ -50,6 +54,10 @@ __all__ = [
     "SpendTrend",
     "Trading212AccountData",
     "InvestmentPerformance",
+    "UpcomingBill",
+    "CategoryForecast",
+    "PeriodForecast",
+    "NetWorthPoint",
     # Response wrappers
     "ApiResponse",
     "PaginatedApiResponse",
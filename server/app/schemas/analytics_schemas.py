@@ -1,5 +1,7 @@
+from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
+from uuid import UUID
 
 from pydantic import BaseModel
 
@@ -32,6 +34,15 @@ class PeriodTrend(BaseModel):
     net_worth: Decimal
 
 
+class NetWorthPoint(BaseModel):
+    period_id: UUID
+    period_name: str
+    started_at: datetime
+    ended_at: Optional[datetime] = None
+    change: Decimal
+    net_worth: Decimal
+
+
 class YearlySummary(BaseModel):
     year: int
     total_income: Decimal
@@ -45,6 +56,41 @@ class YearlySummary(BaseModel):
     category_breakdown: List[CategoryBreakdown]
 
 
+class UpcomingBill(BaseModel):
+    recurring_transaction_id: UUID
+    description: Optional[str] = None
+    amount: Decimal
+    type: str
+    frequency: str
+    due_date: date
+    category_id: UUID
+    category_name: str
+    category_color: Optional[str] = None
+    category_icon: Optional[str] = None
+
+
+class CategoryForecast(BaseModel):
+    category_id: UUID
+    category_name: str
+    category_type: str
+    amount: Decimal
+
+
+class PeriodForecast(BaseModel):
+    started_at: datetime
+    ended_at: datetime
+    status: str = "projected"
+    expected_income: Decimal
+    actual_income: Decimal
+    total_expenses: Decimal
+    total_savings: Decimal
+    total_investments: Decimal
+    total_adjustments: Decimal
+    brought_forward: Decimal
+    carried_forward: Decimal
+    categories: List[CategoryForecast]
+
+
 class InvestmentPerformance(BaseModel):
     total_invested: Decimal
     current_value: Decimal
@@ -65,7 +111,7 @@ class DashboardSummary(BaseModel):
     savings_rate: float
     top_expense_categories: List[CategoryBreakdown]
     recent_transactions: List[TransactionResponse]
-    upcoming_bills: List[Dict[str, Any]]
+    upcoming_bills: List[UpcomingBill]
     financial_goals_progress: List[FinancialGoalResponse]
 
 
@@ -1,4 +1,4 @@
-from datetime import date, datetime, time, timedelta, timezone
+from datetime import date, datetime, time, timezone
 from decimal import Decimal
 from typing import List, Optional
 from uuid import UUID
@@ -6,6 +6,7 @@ from uuid import UUID
 from pydantic import BaseModel, Field, computed_field, field_validator
 
 from app.schemas.transaction_schemas import TransactionResponse
+from app.utils.date_utils import format_period_name
 
 
 class BudgetPeriodBase(BaseModel):
@@ -19,10 +20,7 @@ class BudgetPeriodBase(BaseModel):
 
     @computed_field
     def period_name(self) -> str:
-        # Format period name as "Month Name - Year" of the next month
-        next_month = self.started_at + timedelta(days=28)
-        # format the month and year
-        return next_month.strftime("%B, %Y")
+        return format_period_name(self.started_at)
 
 
 class BudgetPeriodCreate(BudgetPeriodBase):
@@ -73,10 +71,7 @@ class BudgetPeriodResponse(BaseModel):
 
     @computed_field
     def period_name(self) -> str:
-        # Format period name as "Month Name - Year" of the next month
-        next_month = self.started_at + timedelta(days=28)
-        # format the month and year
-        return next_month.strftime("%B, %Y")
+        return format_period_name(self.started_at)
 
 
 class BudgetPeriodSummary(BudgetPeriodResponse):
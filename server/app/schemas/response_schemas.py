@@ -49,6 +49,7 @@ class ResponseMeta(BaseModel):
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Response timestamp (UTC)")
     pagination: Optional[PaginationMeta] = Field(None, description="Pagination info if applicable")
     message: Optional[str] = Field(None, description="Optional message")
+    next_cursor: Optional[str] = Field(None, description="Opaque cursor for the next page, if there is one")
     request_id: Optional[str] = Field(None, description="Request tracking ID")
 
     class Config:
@@ -82,6 +83,7 @@ class ApiResponse(BaseModel, Generic[T]):
                     "timestamp": "2024-01-01T12:00:00",
                     "pagination": None,
                     "message": None,
+                    "next_cursor": None,
                     "request_id": None,
                 },
             }
@@ -115,6 +117,7 @@ class PaginatedApiResponse(BaseModel, Generic[T]):
         limit: int,
         total: int,
         message: Optional[str] = None,
+        next_cursor: Optional[str] = None,
     ) -> "PaginatedApiResponse[T]":
         """Create a paginated response with auto-generated pagination metadata"""
         return cls(
@@ -122,6 +125,7 @@ class PaginatedApiResponse(BaseModel, Generic[T]):
             meta=ResponseMeta(
                 pagination=PaginationMeta.create(page=page, limit=limit, total=total),
                 message=message,
+                next_cursor=next_cursor,
             ),
         )
 
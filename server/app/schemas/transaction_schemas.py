@@ -1,4 +1,4 @@
-from datetime import date, datetime, time, timedelta, timezone
+from datetime import date, datetime, time, timezone
 from decimal import Decimal
 from enum import Enum
 from typing import List, Optional
@@ -7,6 +7,7 @@ from uuid import UUID
 from pydantic import BaseModel, Field, computed_field, field_validator, model_validator
 
 from app.schemas.category_schemas import CategoryResponse
+from app.utils.date_utils import format_period_name
 
 
 class TransactionType(str, Enum):
@@ -81,9 +82,7 @@ class TransactionWithCategory(TransactionResponse):
     def extract_period_name(cls, data):
         """Extract period_name from the budget_period relationship"""
         if hasattr(data, "budget_period") and data.budget_period:
-            # Calculate period name from budget period's started_at
-            next_month = data.budget_period.started_at + timedelta(days=28)
-            period_name = next_month.strftime("%B, %Y")
+            period_name = format_period_name(data.budget_period.started_at)
             # If data is a model instance, convert to dict
             if hasattr(data, "__dict__"):
                 data_dict = {key: getattr(data, key) for key in data.__dict__ if not key.startswith("_")}
@@ -92,3 +91,24 @@ class TransactionWithCategory(TransactionResponse):
             else:
                 data["period_name"] = period_name
         return data
+
+
+class ImportRowError(BaseModel):
+    row: int  # CSV line number or OFX transaction number
+    error: str
+
+
+class ImportBatchProgress(BaseModel):
+    batch: int
+    imported: int
+    rows_processed: int
+
+
+class StatementImportResult(BaseModel):
+    format: str
+    rows_processed: int = 0
+    imported: int = 0
+    failed: int = 0
+    batches: List[ImportBatchProgress] = []
+    errors: List[ImportRowError] = []
+    error: Optional[str] = None  # Why the import stopped early; the batches listed are committed
@@ -1,15 +1,16 @@
+import asyncio
 import logging
 from datetime import date, datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from uuid import UUID
 
 from dateutil.relativedelta import relativedelta
-from sqlalchemy import and_, asc, desc, extract, func, or_, select
+from sqlalchemy import JSON, Row, and_, asc, desc, func, or_, select, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
 
-from app.models import BudgetPeriod, Category, FinancialGoal, Transaction
+from app.models import BudgetPeriod, Category, FinancialGoal, Transaction, TransactionRollup
 from app.schemas import (
     CategoryBreakdown,
     DashboardSummary,
@@ -18,11 +19,21 @@ from app.schemas import (
     YearlySummary,
     Trading212AccountData,
     InvestmentPerformance,
+    NetWorthPoint,
 )
+from app.services.recurring_transaction_service import RecurringTransactionService
+from app.utils.date_utils import format_period_name
 from app.utils.trading import get_trading_212_account_data
 
 logger = logging.getLogger(__name__)
 
+# What a period adds to net worth: its savings and investments, less adjustments
+PERIOD_NET_WORTH_CHANGE = (
+    func.abs(BudgetPeriod.total_savings)
+    + func.abs(BudgetPeriod.total_investments)
+    - func.abs(BudgetPeriod.total_adjustments)
+)
+
 
 class AnalyticsService:
     def __init__(self, db: AsyncSession):
@@ -30,48 +41,33 @@ class AnalyticsService:
 
     async def get_dashboard_summary(self, user_id: UUID) -> DashboardSummary:
         """Get comprehensive dashboard summary"""
-        # Get current period
-        current_period = await self._get_current_period(user_id)
-
-        # Calculate total balance
-        net_worth = await self._calculate_total_balance(user_id)
-
-        # Get this month's totals
-        month_totals = await self._get_month_totals(user_id)
+        # Fetch Trading212 data concurrently with the database work
+        (dashboard_data, upcoming_bills), trading_data = await asyncio.gather(
+            self._get_dashboard_data_and_bills(user_id),
+            self._get_trading_212_account_data(user_id),
+        )
 
-        # Get all-time totals
-        all_time_totals = await self._get_all_time_totals(user_id)
+        current_period = dashboard_data["current_period"]
+        month_totals = dashboard_data["month_totals"]
 
         # Calculate savings rate
         savings_rate = self._calculate_savings_rate(
             month_totals["income"], abs(month_totals["savings"]) + abs(month_totals["investments"])
         )
 
-        # Get top expense categories
-        top_categories = await self._get_top_expense_categories(user_id, current_period.id if current_period else None)
-
-        # Get recent transactions
-        recent_transactions = await self._get_recent_transactions(user_id, limit=10)
-
-        # Get financial goals progress
-        goals_progress = await self._get_financial_goals_progress(user_id)
-
-        # Get Trading212 account data
-        trading_data = await self._get_trading_212_account_data(user_id)
-
         return DashboardSummary(
             current_period=current_period,
-            net_worth=net_worth + trading_data.pnl,
-            all_time_income=all_time_totals["income"],
-            all_time_expenses=all_time_totals["expenses"],
+            net_worth=dashboard_data["net_worth"] + trading_data.pnl,
+            all_time_income=dashboard_data["all_time_income"],
+            all_time_expenses=dashboard_data["all_time_expenses"],
             this_month_income=month_totals["income"],
             this_month_expenses=month_totals["expenses"],
             this_month_savings=abs(month_totals["savings"]) - abs(month_totals["adjustments"]),
             savings_rate=savings_rate,
-            top_expense_categories=top_categories,
-            recent_transactions=recent_transactions,
-            upcoming_bills=[],  # TODO: Implement recurring transactions
-            financial_goals_progress=goals_progress,
+            top_expense_categories=dashboard_data["top_expense_categories"],
+            recent_transactions=dashboard_data["recent_transactions"],
+            upcoming_bills=upcoming_bills,
+            financial_goals_progress=dashboard_data["financial_goals_progress"],
             investment_performance=InvestmentPerformance(
                 total_invested=trading_data.invested,
                 current_value=trading_data.pnl,
@@ -83,32 +79,16 @@ class AnalyticsService:
         )
 
     async def get_yearly_summary(self, user_id: UUID, year: int) -> YearlySummary:
-        """Get yearly financial summary"""
-        # Get all periods for the year
-        start_date = datetime(year, 1, 1)
-        end_date = datetime(year, 12, 31, 23, 59, 59)
-
-        query = (
-            select(BudgetPeriod)
-            .options(selectinload(BudgetPeriod.transactions))
-            .where(
-                and_(
-                    BudgetPeriod.user_id == user_id,
-                    or_(
-                        BudgetPeriod.ended_at.is_(None),
-                        and_(
-                            BudgetPeriod.ended_at >= start_date,
-                            BudgetPeriod.ended_at <= end_date,
-                        ),
-                    ),
-                )
-            )
-            .order_by(BudgetPeriod.started_at)
+        """Get yearly financial summary.
+
+        The year's periods and its category breakdown are independent, so they are read concurrently,
+        each on its own pooled connection; the periods feed both the totals and the trends.
+        """
+        periods, category_breakdown = await asyncio.gather(
+            self._in_own_session(lambda service: service._get_year_periods(user_id, year)),
+            self._in_own_session(lambda service: service._get_yearly_category_breakdown(user_id, year)),
         )
 
-        result = await self.db.execute(query)
-        periods = result.scalars().all()
-
         # Calculate totals
         total_income = sum(p.actual_income for p in periods)
         total_expenses = sum(p.total_expenses for p in periods)
@@ -119,12 +99,6 @@ class AnalyticsService:
         net_savings = abs(total_savings) + abs(total_investments) - abs(total_adjustments)
         savings_rate = self._calculate_savings_rate(total_income, net_savings)
 
-        # Get monthly trends
-        period_trends = await self._get_period_trends(user_id, year)
-
-        # Get category breakdown
-        category_breakdown = await self._get_yearly_category_breakdown(user_id, year)
-
         return YearlySummary(
             year=year,
             total_income=total_income,
@@ -134,35 +108,74 @@ class AnalyticsService:
             net_savings=net_savings,
             savings_rate=savings_rate,
             periods_count=len(periods),
-            period_trends=period_trends,
+            period_trends=self._build_period_trends(periods),
             category_breakdown=category_breakdown,
         )
 
+    async def get_net_worth_series(
+        self, user_id: UUID, start_date: Optional[date] = None, end_date: Optional[date] = None
+    ) -> List[NetWorthPoint]:
+        """Cumulative net worth after each period, oldest first, from one indexed read with a window sum.
+
+        The running total covers every earlier period, also when the series is cut to a date range.
+        Trading212 gains are live figures, so unlike the dashboard's net worth they are not included.
+        """
+        change = func.coalesce(PERIOD_NET_WORTH_CHANGE, 0)
+        series = (
+            select(
+                BudgetPeriod.id.label("period_id"),
+                BudgetPeriod.started_at,
+                BudgetPeriod.ended_at,
+                change.label("change"),
+                func.sum(change)
+                .over(order_by=(BudgetPeriod.started_at, BudgetPeriod.id), rows=(None, 0))
+                .label("net_worth"),
+            )
+            .where(BudgetPeriod.user_id == user_id)
+            .subquery()
+        )
+        query = select(series).order_by(series.c.started_at, series.c.period_id)
+        if start_date:
+            query = query.where(series.c.started_at >= start_date)
+        if end_date:
+            query = query.where(series.c.started_at <= datetime.combine(end_date, datetime.max.time()))
+
+        result = await self.db.execute(query)
+        return [
+            NetWorthPoint(
+                period_id=row.period_id,
+                period_name=format_period_name(row.started_at),
+                started_at=row.started_at,
+                ended_at=row.ended_at,
+                change=row.change,
+                net_worth=row.net_worth,
+            )
+            for row in result
+        ]
+
     async def get_spending_trends(self, user_id: UUID, months: int) -> List[SpendTrend]:
         """Get spending trends over specified number of months"""
         end_date = date.today()
         start_date = end_date - relativedelta(months=months)
 
+        # Month index (year * 12 + month) lets the rollup table be range-filtered by month
+        month_index = TransactionRollup.year * 12 + TransactionRollup.month
         query = (
             select(
-                extract("year", Transaction.transacted_at).label("year"),
-                extract("month", Transaction.transacted_at).label("month"),
-                func.sum(Transaction.amount).label("total_amount"),
-                Transaction.type,
+                TransactionRollup.year,
+                TransactionRollup.month,
+                func.sum(TransactionRollup.total_amount).label("total_amount"),
+                TransactionRollup.type,
             )
             .where(
                 and_(
-                    Transaction.user_id == user_id,
-                    Transaction.transacted_at >= start_date,
-                    Transaction.transacted_at <= end_date,
+                    TransactionRollup.user_id == user_id,
+                    month_index >= start_date.year * 12 + start_date.month,
+                    month_index <= end_date.year * 12 + end_date.month,
                 )
             )
-            .group_by(
-                extract("year", Transaction.transacted_at),
-                extract("month", Transaction.transacted_at),
-                Transaction.type,
-            )
-            .order_by("year", "month")
+            .group_by(TransactionRollup.year, TransactionRollup.month, TransactionRollup.type)
+            .order_by(TransactionRollup.year, TransactionRollup.month)
         )
 
         result = await self.db.execute(query)
@@ -185,23 +198,23 @@ class AnalyticsService:
     async def get_category_breakdown(self, user_id: UUID, period_id: Optional[UUID] = None) -> List[CategoryBreakdown]:
         """Get category breakdown for a specific period or current period"""
         if period_id:
-            period_filter = Transaction.budget_period_id == period_id
+            period_filter = TransactionRollup.budget_period_id == period_id
         else:
             # Get current period
             current_period = await self._get_current_period(user_id)
             if not current_period:
                 return []
-            period_filter = Transaction.budget_period_id == current_period.id
+            period_filter = TransactionRollup.budget_period_id == current_period.id
 
         query = (
             select(
                 Category.name.label("category_name"),
                 Category.type.label("category_type"),
-                func.sum(Transaction.amount).label("amount"),
-                func.count(Transaction.id).label("transaction_count"),
+                func.sum(TransactionRollup.total_amount).label("amount"),
+                func.sum(TransactionRollup.transaction_count).label("transaction_count"),
             )
-            .join(Category)
-            .where(and_(Transaction.user_id == user_id, period_filter))
+            .join(Category, TransactionRollup.category_id == Category.id)
+            .where(and_(TransactionRollup.user_id == user_id, period_filter))
             .group_by(Category.name, Category.type)
         )
 
@@ -257,173 +270,191 @@ class AnalyticsService:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
-    async def _calculate_total_balance(self, user_id: UUID) -> Decimal:
-        """Calculate total balance across all periods"""
-        # Get all budget periods
-        query = (
-            select(BudgetPeriod)
-            .where(and_(BudgetPeriod.user_id == user_id))
-            .order_by(BudgetPeriod.total_adjustments.desc())
-        )
-
-        result = await self.db.execute(query)
-        periods = result.scalars().all()
-
-        total_balance = Decimal("0")
-        for period in periods:
-            period_balance = abs(period.total_savings) + abs(period.total_investments) - abs(period.total_adjustments)
-            total_balance += period_balance
-
-        return total_balance
-
-    async def _get_month_totals(self, user_id: UUID) -> Dict[str, Decimal]:
-        """Get current month's totals"""
-        current_period = await self._get_current_period(user_id)
-
-        if not current_period:
-            return {
-                "income": Decimal("0"),
-                "expenses": Decimal("0"),
-                "savings": Decimal("0"),
-                "investments": Decimal("0"),
-                "adjustments": Decimal("0"),
-            }
+    async def _get_dashboard_data_and_bills(self, user_id: UUID):
+        # Both use this session, so they run one after the other
+        dashboard_data = await self._get_dashboard_data(user_id)
+        upcoming_bills = await RecurringTransactionService(self.db).get_upcoming_bills(user_id)
+        return dashboard_data, upcoming_bills
 
-        return {
-            "income": current_period.actual_income,
-            "expenses": current_period.total_expenses,
-            "savings": current_period.total_savings,
-            "investments": current_period.total_investments,
-            "adjustments": current_period.total_adjustments,
-        }
+    async def _get_dashboard_data(self, user_id: UUID) -> Dict[str, Any]:
+        """Fetch every SQL-side dashboard figure in a single CTE-based statement"""
+        today = datetime.now(timezone.utc)
 
-    async def _get_all_time_totals(self, user_id: UUID) -> Dict[str, Decimal]:
-        """Get all-time income and expense totals"""
-        query = (
-            select(
-                Transaction.type,
-                func.sum(Transaction.amount).label("total_amount"),
-            )
+        # Current active period
+        current_period = (
+            select(*BudgetPeriod.__table__.columns)
             .where(
                 and_(
-                    Transaction.user_id == user_id,
-                    Transaction.type.in_(["income", "expense"]),
+                    BudgetPeriod.user_id == user_id,
+                    BudgetPeriod.started_at <= today,
+                    BudgetPeriod.ended_at.is_(None),
+                    BudgetPeriod.status == "active",
                 )
             )
-            .group_by(Transaction.type)
+            .order_by(desc(BudgetPeriod.started_at))
+            .limit(1)
+            .cte("current_period")
         )
+        current_period_id = select(current_period.c.id).scalar_subquery()
 
-        result = await self.db.execute(query)
-        totals = result.fetchall()
-
-        all_time_income = Decimal("0")
-        all_time_expenses = Decimal("0")
-
-        for row in totals:
-            if row.type == "income":
-                all_time_income = Decimal(str(row.total_amount))
-            elif row.type == "expense":
-                all_time_expenses = abs(Decimal(str(row.total_amount)))
-
-        return {
-            "income": all_time_income,
-            "expenses": all_time_expenses,
-        }
+        # Net worth: savings and investments across all periods, less adjustments
+        net_worth = (
+            select(
+                func.coalesce(func.sum(PERIOD_NET_WORTH_CHANGE), 0)
+            )
+            .where(BudgetPeriod.user_id == user_id)
+            .scalar_subquery()
+        )
 
-    async def _get_top_expense_categories(self, user_id: UUID, period_id: Optional[UUID]) -> List[CategoryBreakdown]:
-        """Get top expense categories for a period"""
-        if not period_id:
-            return []
+        all_time_amount = func.sum(TransactionRollup.total_amount)
+        all_time_totals = (
+            select(
+                func.coalesce(all_time_amount.filter(TransactionRollup.type == "income"), 0).label("all_time_income"),
+                func.coalesce(all_time_amount.filter(TransactionRollup.type == "expense"), 0).label(
+                    "all_time_expenses"
+                ),
+            )
+            .where(TransactionRollup.user_id == user_id)
+            .cte("all_time_totals")
+        )
 
-        query = (
+        # Expenses by category for the current period
+        period_expenses = (
             select(
                 Category.name.label("category_name"),
                 Category.type.label("category_type"),
-                func.sum(Transaction.amount).label("amount"),
-                func.count(Transaction.id).label("transaction_count"),
+                func.sum(TransactionRollup.total_amount).label("amount"),
+                func.sum(TransactionRollup.transaction_count).label("transaction_count"),
             )
-            .join(Category)
+            .join(Category, TransactionRollup.category_id == Category.id)
             .where(
                 and_(
-                    Transaction.user_id == user_id,
-                    Transaction.budget_period_id == period_id,
-                    Transaction.type == "expense",
+                    TransactionRollup.user_id == user_id,
+                    TransactionRollup.budget_period_id == current_period_id,
+                    TransactionRollup.type == "expense",
                 )
             )
             .group_by(Category.name, Category.type)
-            .order_by(asc(func.sum(Transaction.amount)))
-            .limit(5)
+            .cte("period_expenses")
         )
-
-        result = await self.db.execute(query)
-        top_expenses = result.fetchall()
-
-        # Calculate total expenses for percentages
-        total_query = select(func.sum(Transaction.amount)).where(
-            and_(
-                Transaction.user_id == user_id,
-                Transaction.budget_period_id == period_id,
-                Transaction.type == "expense",
-            )
+        period_expense_total = select(func.sum(period_expenses.c.amount)).scalar_subquery()
+        top_categories = (
+            select(period_expenses).order_by(asc(period_expenses.c.amount)).limit(5).subquery("top_categories")
         )
-        total_result = await self.db.execute(total_query)
-        total_expenses = total_result.scalar() or Decimal("0")
 
-        categories = []
-        for expense in top_expenses:
-            percentage = float((expense.amount / total_expenses) * 100) if total_expenses > 0 else 0
-            categories.append(
-                CategoryBreakdown(
-                    category_name=expense.category_name,
-                    category_type=expense.category_type,
-                    amount=expense.amount,
-                    percentage=percentage,
-                    transaction_count=expense.transaction_count,
-                )
-            )
-
-        return categories
-
-    async def _get_recent_transactions(self, user_id: UUID, limit: int = 10) -> List[Transaction]:
-        """Get recent transactions"""
-        query = (
-            select(Transaction)
-            .options(joinedload(Transaction.category))
+        recent_transactions = (
+            select(*Transaction.__table__.columns)
             .where(Transaction.user_id == user_id)
             .order_by(desc(Transaction.transacted_at), desc(Transaction.created_at))
-            .limit(limit)
+            .limit(10)
+            .subquery("recent_transactions")
         )
 
-        result = await self.db.execute(query)
-        return result.scalars().all()
-
-    async def _get_financial_goals_progress(self, user_id: UUID) -> List[FinancialGoal]:
-        """Get financial goals with progress"""
-        query = (
-            select(FinancialGoal)
+        goals = (
+            select(*FinancialGoal.__table__.columns)
             .where(and_(FinancialGoal.user_id == user_id, FinancialGoal.is_active))
-            .order_by(FinancialGoal.target_date.asc().nullslast())
+            .subquery("financial_goals")
         )
 
+        query = select(
+            *current_period.c,
+            net_worth.label("net_worth"),
+            all_time_totals.c.all_time_income,
+            all_time_totals.c.all_time_expenses,
+            period_expense_total.label("period_expense_total"),
+            self._json_rows(top_categories, asc(top_categories.c.amount)).label("top_categories"),
+            self._json_rows(
+                recent_transactions,
+                desc(recent_transactions.c.transacted_at),
+                desc(recent_transactions.c.created_at),
+            ).label("recent_transactions"),
+            self._json_rows(goals, goals.c.target_date.asc().nullslast()).label("financial_goals"),
+        ).select_from(all_time_totals.outerjoin(current_period, true()))
+
         result = await self.db.execute(query)
-        goals = result.scalars().all()
+        row = result.one()
+
+        period = None
+        month_totals = {
+            "income": Decimal("0"),
+            "expenses": Decimal("0"),
+            "savings": Decimal("0"),
+            "investments": Decimal("0"),
+            "adjustments": Decimal("0"),
+        }
+        if row.id is not None:
+            period = {column.key: getattr(row, column.key) for column in current_period.c}
+            month_totals = {
+                "income": row.actual_income,
+                "expenses": row.total_expenses,
+                "savings": row.total_savings,
+                "investments": row.total_investments,
+                "adjustments": row.total_adjustments,
+            }
 
-        # Add calculated fields
-        for goal in goals:
-            goal.progress_percentage = self._calculate_progress_percentage(goal)
-            goal.days_remaining = self._calculate_days_remaining(goal)
+        # Calculate percentages against the total expenses of the period
+        total_expenses = row.period_expense_total or Decimal("0")
+        top_expense_categories = []
+        for expense in row.top_categories or []:
+            amount = Decimal(str(expense["amount"]))
+            top_expense_categories.append(
+                CategoryBreakdown(
+                    category_name=expense["category_name"],
+                    category_type=expense["category_type"],
+                    amount=amount,
+                    percentage=float((amount / total_expenses) * 100) if total_expenses > 0 else 0,
+                    transaction_count=expense["transaction_count"],
+                )
+            )
+
+        # Add calculated fields to the goals
+        goals_progress = row.financial_goals or []
+        for goal in goals_progress:
+            target_date = date.fromisoformat(goal["target_date"]) if goal["target_date"] else None
+            goal["progress_percentage"] = self._calculate_progress_percentage(
+                Decimal(str(goal["current_amount"] or 0)), Decimal(str(goal["target_amount"]))
+            )
+            goal["days_remaining"] = self._calculate_days_remaining(target_date)
 
-        return goals
+        return {
+            "current_period": period,
+            "month_totals": month_totals,
+            "net_worth": row.net_worth,
+            "all_time_income": row.all_time_income,
+            "all_time_expenses": abs(row.all_time_expenses),
+            "top_expense_categories": top_expense_categories,
+            "recent_transactions": row.recent_transactions or [],
+            "financial_goals_progress": goals_progress,
+        }
 
-    async def _get_period_trends(self, user_id: UUID, year: int) -> List[PeriodTrend]:
-        """Get budget period trends for a year"""
-        # Get all budget periods for the year
+    @staticmethod
+    def _json_rows(subquery, *order_by):
+        """Aggregate every row of a subquery into an ordered JSON array"""
+        return (
+            select(func.json_agg(aggregate_order_by(subquery.table_valued(), *order_by), type_=JSON))
+            .select_from(subquery)
+            .scalar_subquery()
+        )
+
+    async def _in_own_session(self, query: Callable[["AnalyticsService"], Awaitable[Any]]) -> Any:
+        """Run a read on a new session from the same engine, so it can run alongside reads on other sessions"""
+        async with AsyncSession(self.db.bind, expire_on_commit=False) as db:
+            return await query(AnalyticsService(db))
+
+    async def _get_year_periods(self, user_id: UUID, year: int) -> List[Row]:
+        """Totals of the periods ending in a year, and of the open period, oldest first"""
         start_date = datetime(year, 1, 1)
         end_date = datetime(year, 12, 31, 23, 59, 59)
 
         query = (
-            select(BudgetPeriod)
-            .options(selectinload(BudgetPeriod.transactions))
+            select(
+                BudgetPeriod.started_at,
+                BudgetPeriod.actual_income,
+                BudgetPeriod.total_expenses,
+                BudgetPeriod.total_savings,
+                BudgetPeriod.total_investments,
+                BudgetPeriod.total_adjustments,
+            )
             .where(
                 and_(
                     BudgetPeriod.user_id == user_id,
@@ -440,47 +471,34 @@ class AnalyticsService:
         )
 
         result = await self.db.execute(query)
-        periods = result.scalars().all()
-
-        trends = []
-        for period in periods:
-            # Calculate period name from budget period's started_at
-            next_month = period.started_at + relativedelta(days=28)
-            period_name = next_month.strftime("%B, %Y")
-
-            trends.append(
-                PeriodTrend(
-                    month=period_name,
-                    income=period.actual_income,
-                    expenses=period.total_expenses,
-                    savings=period.total_savings,
-                    investments=period.total_investments,
-                    net_worth=period.actual_income - abs(period.total_expenses),
-                )
+        return result.all()
+
+    @staticmethod
+    def _build_period_trends(periods: List[Row]) -> List[PeriodTrend]:
+        """Get budget period trends from a year's period totals"""
+        return [
+            PeriodTrend(
+                month=format_period_name(period.started_at),
+                income=period.actual_income,
+                expenses=period.total_expenses,
+                savings=period.total_savings,
+                investments=period.total_investments,
+                net_worth=period.actual_income - abs(period.total_expenses),
             )
-
-        return trends
+            for period in periods
+        ]
 
     async def _get_yearly_category_breakdown(self, user_id: UUID, year: int) -> List[CategoryBreakdown]:
         """Get category breakdown for entire year"""
-        start_date = date(year, 1, 1)
-        end_date = date(year, 12, 31)
-
         query = (
             select(
                 Category.name.label("category_name"),
                 Category.type.label("category_type"),
-                func.sum(Transaction.amount).label("amount"),
-                func.count(Transaction.id).label("transaction_count"),
-            )
-            .join(Category)
-            .where(
-                and_(
-                    Transaction.user_id == user_id,
-                    Transaction.transacted_at >= start_date,
-                    Transaction.transacted_at <= end_date,
-                )
+                func.sum(TransactionRollup.total_amount).label("amount"),
+                func.sum(TransactionRollup.transaction_count).label("transaction_count"),
             )
+            .join(Category, TransactionRollup.category_id == Category.id)
+            .where(and_(TransactionRollup.user_id == user_id, TransactionRollup.year == year))
             .group_by(Category.name, Category.type)
         )
 
@@ -511,16 +529,16 @@ class AnalyticsService:
             return 0.0
         return float((savings / income) * 100)
 
-    def _calculate_progress_percentage(self, goal: FinancialGoal) -> float:
+    def _calculate_progress_percentage(self, current_amount: Decimal, target_amount: Decimal) -> float:
         """Calculate progress percentage for a financial goal"""
-        if goal.target_amount <= 0:
+        if target_amount <= 0:
             return 0.0
-        return min(float((goal.current_amount / goal.target_amount) * 100), 100.0)
+        return min(float((current_amount / target_amount) * 100), 100.0)
 
-    def _calculate_days_remaining(self, goal: FinancialGoal) -> Optional[int]:
+    def _calculate_days_remaining(self, target_date: Optional[date]) -> Optional[int]:
         """Calculate days remaining until target date"""
-        if not goal.target_date:
+        if not target_date:
             return None
 
-        days_left = (goal.target_date - date.today()).days
+        days_left = (target_date - date.today()).days
         return max(days_left, 0)
@@ -12,6 +12,7 @@ from app.config import settings
 from app.models.category_models import Category
 from app.models.user_models import User
 from app.schemas.auth_schemas import Token
+from app.utils.user_cache import invalidate_cached_user
 
 
 class AuthService:
@@ -105,6 +106,7 @@ class AuthService:
                 existing_user.avatar_url = user_data["avatar_url"]
             existing_user.updated_at = datetime.now(timezone.utc)
             await self.db.commit()
+            await invalidate_cached_user(existing_user.id)
             await self.db.refresh(existing_user)
             return existing_user
 
@@ -1,13 +1,30 @@
 # app/services/budget_service.py
 import logging
-from datetime import date, datetime, timezone
+from bisect import bisect_right
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from uuid import UUID
 
 from dateutil.relativedelta import relativedelta
 from fastapi import HTTPException
-from sqlalchemy import and_, asc, desc, func, or_, select
+from sqlalchemy import (
+    DECIMAL,
+    DateTime,
+    Integer,
+    and_,
+    asc,
+    case,
+    column,
+    desc,
+    func,
+    or_,
+    select,
+    true,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,14 +32,88 @@ from app.models.budget_period_models import BudgetPeriod
 from app.models.transaction_models import Transaction
 from app.models.user_models import User
 from app.schemas.budget_period_schemas import BudgetPeriodCreate, BudgetPeriodSummary, BudgetPeriodUpdate
-from app.utils.date_utils import calculate_salary_period
+from app.services.rollup_service import RollupService
+from app.utils.analytics_cache import invalidate_user_analytics
+from app.utils.date_utils import calculate_salary_period, latest_salary_date
 
 logger = logging.getLogger(__name__)
 
+# Transaction type -> BudgetPeriod column holding its running total
+PERIOD_TOTAL_COLUMNS = {
+    "income": "actual_income",
+    "expense": "total_expenses",
+    "saving": "total_savings",
+    "investment": "total_investments",
+    "adjustment": "total_adjustments",
+}
+
+# Latest transactions embedded in a period summary
+SUMMARY_TRANSACTION_LIMIT = 50
+
+
+def _as_utc(value: date) -> datetime:
+    """Compare dates and naive datetimes as UTC datetimes, the way the timestamptz columns store them"""
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, datetime.min.time())
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+class PeriodBoundaries:
+    """A user's period date ranges sorted by start, for bisect lookups by date and overlap checks.
+
+    Ranges may overlap (older chains can), so a lookup walks back from the latest period starting
+    before the date; in a well-formed chain the first candidate matches.
+    """
+
+    def __init__(self, boundaries: Iterable[Tuple[UUID, datetime, Optional[datetime]]] = ()):
+        self._boundaries = sorted(boundaries, key=lambda boundary: boundary[1])
+        self._index()
+
+    def _index(self):
+        self._starts = [started_at for _, started_at, _ in self._boundaries]
+        # Latest end among closed periods up to each position, to answer overlap checks from a prefix
+        self._max_ends: List[Optional[datetime]] = []
+        latest = None
+        for _, _, ended_at in self._boundaries:
+            if ended_at is not None and (latest is None or ended_at > latest):
+                latest = ended_at
+            self._max_ends.append(latest)
+
+    def add(self, period_id: UUID, started_at: datetime, ended_at: Optional[datetime]):
+        index = bisect_right(self._starts, started_at)
+        self._boundaries.insert(index, (period_id, started_at, ended_at))
+        self._starts.insert(index, started_at)
+
+        latest = self._max_ends[index - 1] if index else None
+        if ended_at is not None and (latest is None or ended_at > latest):
+            latest = ended_at
+        self._max_ends.insert(index, latest)
+        # Later prefixes only change until one already ends at or after the new period
+        if ended_at is not None:
+            for position in range(index + 1, len(self._max_ends)):
+                if self._max_ends[position] is not None and self._max_ends[position] >= ended_at:
+                    break
+                self._max_ends[position] = ended_at
+
+    def find(self, moment: datetime) -> Optional[UUID]:
+        """Id of the latest-starting period containing a date, open-ended periods cover every later date"""
+        for position in range(bisect_right(self._starts, moment) - 1, -1, -1):
+            period_id, _, ended_at = self._boundaries[position]
+            if ended_at is None or ended_at >= moment:
+                return period_id
+        return None
+
+    def overlaps(self, started_at: datetime, ended_at: datetime) -> bool:
+        """Whether a closed period overlaps the range; open-ended periods are left to be completed"""
+        index = bisect_right(self._starts, ended_at)
+        latest_end = self._max_ends[index - 1] if index else None
+        return latest_end is not None and latest_end >= started_at
+
 
 class BudgetService:
     def __init__(self, db: AsyncSession):
         self.db = db
+        self._period_boundaries: Dict[UUID, PeriodBoundaries] = {}
 
     async def get_budget_periods(
         self, user_id: UUID, skip: int = 0, limit: int = 20, status: Optional[str] = None
@@ -72,6 +163,8 @@ class BudgetService:
 
         self.db.add(period)
         await self.db.commit()
+        self._period_boundaries.pop(user_id, None)
+        await invalidate_user_analytics(user_id)
         await self.db.refresh(period)
 
         return period
@@ -115,17 +208,19 @@ class BudgetService:
 
         self.db.add(period)
         await self.db.commit()
+        self._period_boundaries.pop(user_id, None)
+        await invalidate_user_analytics(user_id)
         await self.db.refresh(period)
 
         return period
 
-    async def get_budget_period(self, period_id: UUID, user_id: UUID) -> Optional[BudgetPeriod]:
-        """Get specific budget period"""
-        query = (
-            select(BudgetPeriod)
-            .options(selectinload(BudgetPeriod.transactions))
-            .where(and_(BudgetPeriod.id == period_id, BudgetPeriod.user_id == user_id))
-        )
+    async def get_budget_period(
+        self, period_id: UUID, user_id: UUID, with_transactions: bool = False
+    ) -> Optional[BudgetPeriod]:
+        """Get specific budget period, with its transactions eagerly loaded only when asked for"""
+        query = select(BudgetPeriod).where(and_(BudgetPeriod.id == period_id, BudgetPeriod.user_id == user_id))
+        if with_transactions:
+            query = query.options(selectinload(BudgetPeriod.transactions))
 
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
@@ -147,6 +242,8 @@ class BudgetService:
             period.mark_completed(update_data.ended_at)
 
         await self.db.commit()
+        self._period_boundaries.pop(user_id, None)
+        await invalidate_user_analytics(user_id)
         await self.db.refresh(period)
 
         return period
@@ -169,6 +266,8 @@ class BudgetService:
         period.mark_completed(ended_at=ended_at)
 
         await self.db.commit()
+        self._period_boundaries.pop(user_id, None)
+        await invalidate_user_analytics(user_id)
         await self.db.refresh(period)
 
         # Create next period automatically if this was the current period
@@ -177,33 +276,43 @@ class BudgetService:
         await self.db.refresh(period)
         return period
 
-    async def get_period_summary(self, period_id: UUID, user_id: UUID) -> Optional[BudgetPeriodSummary]:
+    async def get_period_summary(
+        self, period_id: UUID, user_id: UUID, transaction_limit: int = SUMMARY_TRANSACTION_LIMIT
+    ) -> Optional[BudgetPeriodSummary]:
         """Get budget period with summary information"""
         period = await self.get_budget_period(period_id, user_id)
         if not period:
             return None
+        return await self.build_period_summary(period, transaction_limit)
+
+    async def build_period_summary(
+        self, period: BudgetPeriod, transaction_limit: int = SUMMARY_TRANSACTION_LIMIT
+    ) -> BudgetPeriodSummary:
+        """Summarise an already loaded period with its latest transactions.
 
-        # Get additional summary data
-        expense_by_category = await self._get_expense_by_category(period_id)
-        top_expenses = await self._get_top_expenses(period_id, limit=5)
-        # get priod transactions
-        transactions = period.transactions
+        Older transactions are paged through GET /transactions?period_id=... rather than loaded here.
+        """
+        expense_by_category = await self._get_expense_by_category(period.id)
+        top_expenses = await self._get_top_expenses(period.id, limit=5)
+        transactions = await self.get_transactions_for_period(period.id, limit=transaction_limit)
 
         return BudgetPeriodSummary.from_budget_period(
             period, expense_by_category=expense_by_category, top_expenses=top_expenses, transactions=transactions
         )
 
-    async def get_transactions_for_period(self, period_id: UUID) -> List[Transaction]:
-        """Get transactions for a specific budget period"""
+    async def get_transactions_for_period(self, period_id: UUID, limit: Optional[int] = None) -> List[Transaction]:
+        """Get transactions for a specific budget period, newest first"""
         query = select(Transaction).where(and_(Transaction.budget_period_id == period_id))
-        # Optionally filter by type
-        query = query.order_by(desc(Transaction.transacted_at))
+        query = query.order_by(desc(Transaction.transacted_at), desc(Transaction.id))
+        if limit is not None:
+            query = query.limit(limit)
         result = await self.db.execute(query)
         return result.scalars().all()
 
     async def get_or_create_period_for_date(self, user_id: UUID, transacted_at: date) -> BudgetPeriod:
         """Get or create budget period for a specific date"""
-        # Find existing period that contains this date
+        # Walk the (user_id, started_at) index backwards from the date; the first period still open
+        # at that date wins, which also holds when older periods overlap
         query = (
             select(BudgetPeriod)
             .where(
@@ -211,7 +320,8 @@ class BudgetService:
                 BudgetPeriod.started_at <= transacted_at,
                 or_(BudgetPeriod.ended_at >= transacted_at, BudgetPeriod.ended_at.is_(None)),
             )
-            .order_by(BudgetPeriod.started_at)
+            .order_by(desc(BudgetPeriod.started_at))
+            .limit(1)
         )
 
         result = await self.db.execute(query)
@@ -221,26 +331,114 @@ class BudgetService:
             return period
 
         # Create new period for this date
-        user = await self.db.get(User, user_id)
-        # start_date, end_date = calculate_salary_period(user.salary_day, transacted_at)
+        period = await self._create_period_for_date(user_id, transacted_at)
+        await self.db.commit()
+        await invalidate_user_analytics(user_id)
+        await self.db.refresh(period)
 
-        brought_forward = await self._get_brought_forward_amount(user_id, transacted_at)
+        return period
 
-        period = BudgetPeriod(
-            user_id=user_id,
-            started_at=transacted_at,
-            brought_forward=brought_forward,
-            status="active",
+    async def resolve_periods_for_dates(self, user_id: UUID, dates: Iterable[datetime]) -> Dict[datetime, UUID]:
+        """Map many dates to their budget period ids with a single query.
+
+        Loads the user's period boundaries once per service, sorted by start, and bisects each date into them.
+        Dates not covered by any period get a new open-ended period starting at the earliest of
+        them (flushed, not committed), which covers every later date as well.
+        """
+        dates = sorted(set(dates))
+        if not dates:
+            return {}
+
+        boundaries = await self._get_period_boundaries(user_id)
+
+        resolved = {}
+        for transacted_at in dates:
+            period_id = boundaries.find(_as_utc(transacted_at))
+            if period_id is None:
+                period = await self._create_period_for_date(user_id, transacted_at)
+                period_id = period.id
+            resolved[transacted_at] = period_id
+
+        return resolved
+
+    async def apply_bulk_transaction_deltas(self, period_deltas: Dict[UUID, Dict[str, Decimal]]):
+        """Apply signed amount changes for many periods in a single UPDATE ... FROM (VALUES ...)"""
+        if not period_deltas:
+            return
+
+        deltas = values(
+            column("id", PG_UUID(as_uuid=True)),
+            *(column(transaction_type, DECIMAL(14, 2)) for transaction_type in PERIOD_TOTAL_COLUMNS),
+            name="deltas",
+        ).data(
+            [
+                (period_id, *(amounts.get(transaction_type, Decimal("0")) for transaction_type in PERIOD_TOTAL_COLUMNS))
+                for period_id, amounts in period_deltas.items()
+            ]
         )
 
-        self.db.add(period)
-        await self.db.commit()
-        await self.db.refresh(period)
+        update_values = self._total_delta_values(
+            {column_name: deltas.c[transaction_type] for transaction_type, column_name in PERIOD_TOTAL_COLUMNS.items()}
+        )
+        query = (
+            update(BudgetPeriod)
+            .where(BudgetPeriod.id == deltas.c.id)
+            .values(**update_values)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(query)
+
+    async def apply_transaction_deltas(self, period_id: UUID, deltas: Dict[str, Decimal]) -> Optional[BudgetPeriod]:
+        """Apply signed amount changes (keyed by transaction type) to a period's running totals.
+
+        Runs a single UPDATE ... RETURNING without committing, so the caller can persist the
+        totals in the same database transaction as the transaction rows themselves.
+        """
+        column_deltas = {
+            PERIOD_TOTAL_COLUMNS[transaction_type]: amount
+            for transaction_type, amount in deltas.items()
+            if transaction_type in PERIOD_TOTAL_COLUMNS and amount
+        }
+        if not column_deltas:
+            return None
 
-        return period
+        query = (
+            update(BudgetPeriod)
+            .where(BudgetPeriod.id == period_id)
+            .values(**self._total_delta_values(column_deltas))
+            .returning(BudgetPeriod)
+        )
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def verify_period_totals(self, period_id: UUID) -> Dict[str, dict]:
+        """Compare stored period totals against a full aggregation of its transactions.
+
+        Returns the columns that have drifted, mapped to their stored and actual values.
+        """
+        query = (
+            select(Transaction.type, func.sum(Transaction.amount).label("total"))
+            .where(Transaction.budget_period_id == period_id)
+            .group_by(Transaction.type)
+        )
+        result = await self.db.execute(query)
+        totals = {row.type: row.total for row in result}
+
+        period = await self.db.get(BudgetPeriod, period_id)
+        if not period:
+            return {}
+
+        drift = {}
+        for transaction_type, column_name in PERIOD_TOTAL_COLUMNS.items():
+            stored = Decimal(getattr(period, column_name) or 0)
+            actual = Decimal(totals.get(transaction_type) or 0)
+            if stored != actual:
+                drift[column_name] = {"stored": stored, "actual": actual}
+
+        return drift
 
     async def recalculate_period_totals(self, period_id: UUID):
-        """Recalculate budget period totals from transactions"""
+        """Recalculate budget period totals from transactions (full repair of the running totals)"""
         # Get totals by transaction type
         query = (
             select(Transaction.type, func.sum(Transaction.amount).label("total"))
@@ -258,6 +456,7 @@ class BudgetService:
             period.total_expenses = totals.get("expense", 0)
             period.total_savings = totals.get("saving", 0)
             period.total_investments = totals.get("investment", 0)
+            period.total_adjustments = totals.get("adjustment", 0)
             period.updated_at = datetime.now(timezone.utc)
 
             # If period is completed, recalculate carry forward
@@ -265,8 +464,64 @@ class BudgetService:
                 period.carried_forward = period.calculate_carried_forward()
 
             await self.db.commit()
+            await invalidate_user_analytics(period.user_id)
 
     # Helper methods
+    @staticmethod
+    def _total_delta_values(column_deltas: Dict[str, Any]) -> dict:
+        """Build UPDATE values adding each delta to its running total column"""
+
+        def new_total(column_name: str):
+            total = func.coalesce(getattr(BudgetPeriod, column_name), 0)
+            if column_name in column_deltas:
+                return total + column_deltas[column_name]
+            return total
+
+        update_values = {column_name: new_total(column_name) for column_name in column_deltas}
+
+        # Completed periods keep carried_forward in sync, mirroring BudgetPeriod.calculate_carried_forward
+        carried_forward = (
+            new_total("actual_income")
+            + func.coalesce(BudgetPeriod.brought_forward, 0)
+            + new_total("total_expenses")
+            + new_total("total_savings")
+            + new_total("total_investments")
+        )
+        update_values["carried_forward"] = case(
+            (BudgetPeriod.status == "completed", func.greatest(carried_forward, 0)),
+            else_=BudgetPeriod.carried_forward,
+        )
+        update_values["updated_at"] = datetime.now(timezone.utc)
+        return update_values
+
+    async def _get_period_boundaries(self, user_id: UUID) -> PeriodBoundaries:
+        """Load a user's period boundaries, kept for the life of the service"""
+        boundaries = self._period_boundaries.get(user_id)
+        if boundaries is None:
+            query = select(BudgetPeriod.id, BudgetPeriod.started_at, BudgetPeriod.ended_at).where(
+                BudgetPeriod.user_id == user_id
+            )
+            result = await self.db.execute(query)
+            boundaries = self._period_boundaries[user_id] = PeriodBoundaries(tuple(row) for row in result)
+        return boundaries
+
+    async def _create_period_for_date(self, user_id: UUID, transacted_at: datetime) -> BudgetPeriod:
+        """Add an open-ended period starting at a date, without committing"""
+        brought_forward = await self._get_brought_forward_amount(user_id, transacted_at)
+
+        period = BudgetPeriod(
+            user_id=user_id,
+            started_at=transacted_at,
+            brought_forward=brought_forward,
+            status="active",
+        )
+
+        self.db.add(period)
+        await self.db.flush()
+        if user_id in self._period_boundaries:
+            self._period_boundaries[user_id].add(period.id, _as_utc(period.started_at), period.ended_at)
+        return period
+
     async def _get_brought_forward_amount(self, user_id: UUID, current_start_date: datetime) -> Decimal:
         """Get amount to bring forward from previous period"""
         query = (
@@ -291,17 +546,8 @@ class BudgetService:
 
     async def _check_overlapping_periods(self, user_id: UUID, started_at: datetime, ended_at: datetime) -> bool:
         """Check if date range overlaps with existing periods"""
-        query = select(BudgetPeriod).where(
-            and_(
-                BudgetPeriod.user_id == user_id,
-                BudgetPeriod.started_at <= ended_at,
-                BudgetPeriod.ended_at >= started_at,
-            )
-        )
-
-        result = await self.db.execute(query)
-
-        return result.scalar_one_or_none() is not None
+        boundaries = await self._get_period_boundaries(user_id)
+        return boundaries.overlaps(_as_utc(started_at), _as_utc(ended_at))
 
     async def _create_next_period_if_needed(self, user_id: UUID, completed_period: BudgetPeriod):
         """Create next period if we're at the end of current period"""
@@ -313,6 +559,8 @@ class BudgetService:
         #     return
         completed_period_id = completed_period.id
         completed_period = await self.db.get(BudgetPeriod, completed_period_id)
+        if completed_period.next_period_id is not None:
+            return  # Already created, by an earlier run of the job
         next_period = BudgetPeriod(
             user_id=user_id,
             started_at=next_start_date,
@@ -327,6 +575,92 @@ class BudgetService:
         completed_period.next_period_id = next_period.id
 
         await self.db.commit()
+        self._period_boundaries.pop(user_id, None)
+        await invalidate_user_analytics(user_id)
+
+    async def roll_over_due_periods(self, today: Optional[date] = None, batch_size: int = 500) -> int:
+        """Roll over open periods whose user's salary day has come round since they started.
+
+        The latest salary date is worked out for each possible salary_day and joined against users, so
+        one query finds every due period. Returns how many periods were rolled over.
+        """
+        today = today or datetime.now(timezone.utc).date()
+        salary_starts = values(
+            column("salary_day", Integer), column("started_at", DateTime(timezone=True)), name="salary_starts"
+        ).data([(day, _as_utc(latest_salary_date(day, today))) for day in range(1, 32)])
+        query = (
+            select(BudgetPeriod.id, BudgetPeriod.user_id, salary_starts.c.started_at)
+            .join(User, User.id == BudgetPeriod.user_id)
+            .join(salary_starts, salary_starts.c.salary_day == User.salary_day)
+            .where(
+                BudgetPeriod.status == "active",
+                BudgetPeriod.ended_at.is_(None),
+                BudgetPeriod.started_at < salary_starts.c.started_at,
+            )
+            .order_by(BudgetPeriod.started_at)
+            .limit(batch_size)
+        )
+        due = (await self.db.execute(query)).all()
+
+        rolled_over = 0
+        for period_id, user_id, started_at in due:
+            if await self.roll_over_period(period_id, user_id, started_at):
+                rolled_over += 1
+        return rolled_over
+
+    async def roll_over_period(self, period_id: UUID, user_id: UUID, started_at: datetime) -> Optional[BudgetPeriod]:
+        """Complete an open period just before started_at and open the next period from it.
+
+        Transactions dated from started_at move to the new period, and both periods are rebuilt in the
+        same commit. Returns None when the period is already rolled over or locked by another worker,
+        so running it twice is harmless.
+        """
+        result = await self.db.execute(
+            select(BudgetPeriod)
+            .where(
+                BudgetPeriod.id == period_id,
+                BudgetPeriod.status == "active",
+                BudgetPeriod.ended_at.is_(None),
+                BudgetPeriod.next_period_id.is_(None),
+                BudgetPeriod.started_at < started_at,
+            )
+            .with_for_update(skip_locked=True)
+        )
+        period = result.scalar_one_or_none()
+        if period is None:
+            await self.db.rollback()
+            return None
+
+        period.mark_completed(ended_at=started_at - timedelta(microseconds=1))
+        next_period = BudgetPeriod(
+            user_id=user_id,
+            started_at=started_at,
+            brought_forward=Decimal("0"),
+            status="active",
+            previous_period_id=period.id,
+        )
+        self.db.add(next_period)
+        await self.db.flush()
+        period.next_period_id = next_period.id
+
+        result = await self.db.scalars(
+            update(Transaction)
+            .where(Transaction.budget_period_id == period.id, Transaction.transacted_at >= started_at)
+            .values(budget_period_id=next_period.id)
+            .returning(Transaction)
+            .execution_options(synchronize_session=False)
+        )
+        moved = RollupService.collect_deltas(result.all())
+        if moved:
+            # Rollups are bucketed by period, so the moved amounts leave the old period's buckets
+            deltas = {(period.id, *key[1:]): (-amount, -count) for key, (amount, count) in moved.items()}
+            await RollupService(self.db).apply_deltas(user_id, {**deltas, **moved})
+
+        # Recalculates both periods' totals and carries the completed period forward, then commits
+        await self.rebuild_period_chain(user_id, [period.id, next_period.id])
+        self._period_boundaries.pop(user_id, None)
+        logger.info("Rolled over budget period %s for user %s", period.id, user_id)
+        return next_period
 
     async def _get_expense_by_category(self, period_id: UUID) -> dict:
         """Get expenses grouped by category for a period"""
@@ -361,42 +695,95 @@ class BudgetService:
 
     async def rebuild_budget_period(self, period_id: UUID, user_id: UUID) -> Optional[BudgetPeriod]:
         """Rebuild a budget period: recalculate all totals and update carry forward."""
-        period = await self.get_budget_period(period_id, user_id)
-        if not period:
-            return None
+        periods = await self.rebuild_period_chain(user_id, [period_id])
+        return periods[0] if periods else None
 
-        # Recalculate totals from transactions
+    async def rebuild_budget_periods(self, period_ids: List[UUID], user_id: UUID) -> List[BudgetPeriod]:
+        """Rebuild multiple budget periods by recalculating totals and updating carry forward."""
+        periods = {period.id: period for period in await self.rebuild_period_chain(user_id, period_ids)}
+        return [periods[period_id] for period_id in reversed(period_ids) if period_id in periods]
+
+    async def rebuild_period_chain(self, user_id: UUID, period_ids: Optional[List[UUID]] = None) -> List[BudgetPeriod]:
+        """Recalculate totals, brought forward and carry forward for a user's periods, oldest first.
+
+        One query aggregates the transactions of every period being rebuilt, the chain is walked in
+        memory so each rebuilt carry forward feeds the next period, and all periods are written with a
+        single UPDATE ... FROM (VALUES ...) in one commit. Without period_ids the whole chain is rebuilt.
+        """
+        rebuild = BudgetPeriod.id.in_(period_ids) if period_ids is not None else true()
+        amount = func.sum(Transaction.amount)
+        totals = (
+            select(
+                Transaction.budget_period_id,
+                *(
+                    func.coalesce(amount.filter(Transaction.type == transaction_type), 0).label(column_name)
+                    for transaction_type, column_name in PERIOD_TOTAL_COLUMNS.items()
+                ),
+            )
+            .join(BudgetPeriod, Transaction.budget_period_id == BudgetPeriod.id)
+            .where(and_(BudgetPeriod.user_id == user_id, rebuild))
+            .group_by(Transaction.budget_period_id)
+            .subquery()
+        )
+        # Every period is read for its carry forward, only the ones being rebuilt get their totals aggregated
         query = (
-            select(Transaction.type, func.sum(Transaction.amount).label("total"))
-            .where(Transaction.budget_period_id == period_id)
-            .group_by(Transaction.type)
+            select(
+                BudgetPeriod.id,
+                BudgetPeriod.previous_period_id,
+                BudgetPeriod.status,
+                BudgetPeriod.brought_forward,
+                BudgetPeriod.carried_forward,
+                rebuild.label("rebuild"),
+                *(totals.c[column_name] for column_name in PERIOD_TOTAL_COLUMNS.values()),
+            )
+            .outerjoin(totals, totals.c.budget_period_id == BudgetPeriod.id)
+            .where(BudgetPeriod.user_id == user_id)
+            .order_by(BudgetPeriod.started_at)
         )
         result = await self.db.execute(query)
-        totals = {row.type: row.total for row in result}
-
-        prv_period = period.previous_period
-        period.brought_forward = prv_period.carried_forward if prv_period else period.brought_forward
-        period.actual_income = totals.get("income", Decimal("0"))
-        period.total_expenses = totals.get("expense", Decimal("0"))
-        period.total_investments = totals.get("investment", Decimal("0"))
-        period.total_savings = totals.get("saving", Decimal("0"))
-
-        # Recalculate carry forward if completed
-        if period.status == "completed":
-            period.carried_forward = period.calculate_carried_forward()
 
-        period.updated_at = datetime.now(timezone.utc)
+        carried_forward: Dict[UUID, Decimal] = {}
+        rows = []
+        for period in result:
+            if not period.rebuild:
+                carried_forward[period.id] = period.carried_forward
+                continue
+
+            period_totals = {
+                column_name: Decimal(getattr(period, column_name) or 0) for column_name in PERIOD_TOTAL_COLUMNS.values()
+            }
+            brought_forward = carried_forward.get(period.previous_period_id, period.brought_forward)
+            # Completed periods carry forward what is left, mirroring BudgetPeriod.calculate_carried_forward
+            if period.status == "completed":
+                available = period_totals["actual_income"] + Decimal(brought_forward or 0)
+                used = period_totals["total_expenses"] + period_totals["total_savings"] + period_totals["total_investments"]
+                carried_forward[period.id] = max(available + used, Decimal("0"))
+            else:
+                carried_forward[period.id] = period.carried_forward
+            rows.append((period.id, *period_totals.values(), brought_forward, carried_forward[period.id]))
+
+        if not rows:
+            return []
+
+        column_names = [*PERIOD_TOTAL_COLUMNS.values(), "brought_forward", "carried_forward"]
+        rebuilt = values(
+            column("id", PG_UUID(as_uuid=True)),
+            *(column(column_name, DECIMAL(14, 2)) for column_name in column_names),
+            name="rebuilt",
+        ).data(rows)
+        query = (
+            update(BudgetPeriod)
+            .where(BudgetPeriod.id == rebuilt.c.id)
+            .values(
+                **{column_name: rebuilt.c[column_name] for column_name in column_names},
+                updated_at=datetime.now(timezone.utc),
+            )
+            .returning(BudgetPeriod)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.db.execute(query)
+        periods = result.scalars().all()
 
         await self.db.commit()
-        await self.db.refresh(period)
-        return period
-
-    async def rebuild_budget_periods(self, period_ids: List[UUID], user_id: UUID) -> List[BudgetPeriod]:
-        """Rebuild multiple budget periods by recalculating totals and updating carry forward."""
-        updated_periods = []
-        for period_id in period_ids:
-            period = await self.rebuild_budget_period(period_id, user_id)
-            if period:
-                updated_periods.append(period)
-        updated_periods.reverse()
-        return updated_periods
+        await invalidate_user_analytics(user_id)
+        return sorted(periods, key=lambda period: period.started_at)
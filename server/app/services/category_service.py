@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.category_models import Category
 from app.schemas.category_schemas import CategoryCreate, CategoryUpdate
+from app.utils.analytics_cache import invalidate_user_analytics
 
 
 class CategoryService:
@@ -65,6 +66,8 @@ class CategoryService:
             setattr(category, field, value)
 
         await self.db.commit()
+        # Category names and colours appear in the cached analytics
+        await invalidate_user_analytics(user_id)
         await self.db.refresh(category)
 
         return category
@@ -0,0 +1,162 @@
+import csv
+import io
+import json
+from datetime import date
+from typing import AsyncIterator, List, Optional, Sequence
+from uuid import UUID
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.category_models import Category
+from app.models.transaction_models import Transaction
+
+# Rows fetched per server-side cursor round trip, and encoded into one output chunk
+EXPORT_PARTITION_SIZE = 2000
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+EXPORT_COLUMNS = [
+    Transaction.id,
+    Transaction.transacted_at,
+    Transaction.amount,
+    Transaction.type,
+    Category.name.label("category"),
+    Transaction.description,
+    Transaction.payment_method,
+    Transaction.is_recurring,
+    Transaction.recurring_frequency,
+    Transaction.tags,
+    Transaction.budget_period_id,
+    Transaction.category_id,
+    Transaction.created_at,
+]
+EXPORT_FIELDS = [column.key for column in EXPORT_COLUMNS]
+
+
+class _ChunkSink:
+    """Write-only file that hands out what was written since the last drain, keeping the logical offset for tell()"""
+
+    closed = False
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class TransactionExportService:
+    """Stream a user's transactions through a server-side cursor, encoding each partition of rows as it arrives.
+
+    Rows are selected as plain column tuples, so no ORM objects or Pydantic models are built and memory
+    holds one partition at a time whatever the size of the history.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def export_transactions(
+        self,
+        user_id: UUID,
+        export_format: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        partition_size: int = EXPORT_PARTITION_SIZE,
+    ) -> AsyncIterator[bytes]:
+        """Yield the encoded export in chunks, oldest transaction first"""
+        encoders = {"csv": self._encode_csv, "ndjson": self._encode_ndjson, "parquet": self._encode_parquet}
+
+        query = (
+            select(*EXPORT_COLUMNS)
+            .join(Category, Transaction.category_id == Category.id)
+            .where(Transaction.user_id == user_id)
+            .order_by(Transaction.transacted_at, Transaction.id)
+            .execution_options(yield_per=partition_size)
+        )
+        if start_date:
+            query = query.where(Transaction.transacted_at >= start_date)
+        if end_date:
+            query = query.where(Transaction.transacted_at <= end_date)
+
+        result = await self.db.stream(query)
+        async for chunk in encoders[export_format](result.partitions()):
+            yield chunk
+
+    @staticmethod
+    async def _encode_csv(partitions: AsyncIterator[Sequence[Row]]) -> AsyncIterator[bytes]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_FIELDS)
+        async for rows in partitions:
+            for row in rows:
+                writer.writerow([";".join(value) if isinstance(value, list) else value for value in row])
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    @staticmethod
+    async def _encode_ndjson(partitions: AsyncIterator[Sequence[Row]]) -> AsyncIterator[bytes]:
+        async for rows in partitions:
+            lines = [json.dumps(dict(zip(EXPORT_FIELDS, row)), default=str) for row in rows]
+            yield ("\n".join(lines) + "\n").encode()
+
+    @staticmethod
+    async def _encode_parquet(partitions: AsyncIterator[Sequence[Row]]) -> AsyncIterator[bytes]:
+        """Write each partition as a Parquet row group and flush it, the footer comes last"""
+        schema = pa.schema(
+            [
+                ("id", pa.string()),
+                ("transacted_at", pa.timestamp("us", tz="UTC")),
+                ("amount", pa.decimal128(12, 2)),
+                ("type", pa.string()),
+                ("category", pa.string()),
+                ("description", pa.string()),
+                ("payment_method", pa.string()),
+                ("is_recurring", pa.bool_()),
+                ("recurring_frequency", pa.string()),
+                ("tags", pa.list_(pa.string())),
+                ("budget_period_id", pa.string()),
+                ("category_id", pa.string()),
+                ("created_at", pa.timestamp("us", tz="UTC")),
+            ]
+        )
+        uuid_fields = {"id", "budget_period_id", "category_id"}
+
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema)
+        async for rows in partitions:
+            columns: List[list] = [list(values) for values in zip(*rows)]
+            arrays = [
+                pa.array([str(value) for value in values] if name in uuid_fields else values, type=field.type)
+                for name, field, values in zip(EXPORT_FIELDS, schema, columns)
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            yield sink.drain()
+        writer.close()
+        yield sink.drain()
@@ -8,6 +8,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.financial_goal_models import FinancialGoal
 from app.schemas.financial_goal_schemas import FinancialGoalCreate, FinancialGoalUpdate
+from app.utils.analytics_cache import invalidate_user_analytics
 
 
 class FinancialGoalService:
@@ -52,6 +53,7 @@ class FinancialGoalService:
 
         self.db.add(goal)
         await self.db.commit()
+        await invalidate_user_analytics(user_id)
         await self.db.refresh(goal)
 
         # Add calculated fields
@@ -73,6 +75,7 @@ class FinancialGoalService:
             setattr(goal, field, value)
 
         await self.db.commit()
+        await invalidate_user_analytics(user_id)
         await self.db.refresh(goal)
 
         # Add calculated fields
@@ -89,6 +92,7 @@ class FinancialGoalService:
 
         await self.db.delete(goal)
         await self.db.commit()
+        await invalidate_user_analytics(user_id)
 
         return True
 
@@ -105,6 +109,7 @@ class FinancialGoalService:
             goal.is_active = False
 
         await self.db.commit()
+        await invalidate_user_analytics(user_id)
         await self.db.refresh(goal)
 
         # Add calculated fields
@@ -0,0 +1,208 @@
+import logging
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import and_, desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import BudgetPeriod, Category, TransactionRollup, User
+from app.schemas import CategoryForecast, PeriodForecast
+from app.services.budget_service import PERIOD_TOTAL_COLUMNS, _as_utc
+from app.services.recurring_transaction_service import RecurringTransactionService
+from app.utils.date_utils import latest_salary_date
+
+logger = logging.getLogger(__name__)
+
+# Full months of rollups the category baselines are estimated from, and how fast older months fade
+FORECAST_HISTORY_MONTHS = 12
+FORECAST_HALF_LIFE_MONTHS = 3.0
+AVERAGE_MONTH_DAYS = 365.25 / 12
+
+TRANSACTION_TYPES = list(PERIOD_TOTAL_COLUMNS)
+
+
+def ewma_baseline(history: np.ndarray, half_life: float = FORECAST_HALF_LIFE_MONTHS) -> np.ndarray:
+    """Exponentially weighted monthly mean of each column of a months x categories array, oldest month first"""
+    if not len(history):
+        return np.zeros(history.shape[1])
+    ages = np.arange(len(history) - 1, -1, -1)
+    weights = 0.5 ** (ages / half_life)
+    return weights @ history / weights.sum()
+
+
+def carry_forward(brought_forward: float, net: np.ndarray) -> np.ndarray:
+    """Carry forward of consecutive periods, each max(brought forward + net, 0) as in calculate_carried_forward.
+
+    Solved without a loop: the running balance, less the deepest shortfall reached so far.
+    """
+    balance = brought_forward + np.cumsum(net)
+    return balance - np.minimum(np.minimum.accumulate(balance), 0)
+
+
+def _money(value: float) -> Decimal:
+    # Adding zero normalises -0.00
+    return Decimal(f"{value:.2f}") + 0
+
+
+def _naive_utc(moment: datetime) -> datetime:
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class ForecastService:
+    """Project the totals and carry forward of a user's next budget periods.
+
+    Each category's monthly baseline is an exponentially weighted mean of its recent rollups, less the
+    part its recurring rules explain; the rules' scheduled occurrences are then added to the period they
+    fall in. Everything after loading runs as array operations over periods x categories.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def forecast_periods(self, user_id: UUID, periods: int = 6) -> List[PeriodForecast]:
+        now = datetime.now(timezone.utc)
+        today = now.date()
+        current, salary_day = await self._get_current_period(user_id)
+
+        # Boundaries of the current period and the projected ones, which start on the user's salary days
+        latest_salary = latest_salary_date(salary_day, today)
+        boundaries = [_as_utc(current.started_at) if current else _as_utc(latest_salary)]
+        boundaries += [_as_utc(latest_salary + relativedelta(months=k, day=salary_day)) for k in range(1, periods + 2)]
+        edges = np.array([_naive_utc(boundary) for boundary in boundaries], dtype="datetime64[us]")
+        lengths = np.diff(edges) / np.timedelta64(1, "D")
+        # Only the rest of the current period is still to come
+        lengths[0] = max((edges[1] - np.datetime64(_naive_utc(now), "us")) / np.timedelta64(1, "D"), 0)
+        months = lengths / AVERAGE_MONTH_DAYS
+
+        categories = await self._get_categories(user_id)
+        index = {category.id: position for position, category in enumerate(categories)}
+        category_types = np.array([TRANSACTION_TYPES.index(category.type) for category in categories], dtype=int)
+
+        baseline = ewma_baseline(await self._get_monthly_history(user_id, today, index))
+
+        # Scheduled recurring occurrences, summed per period and category
+        horizon = boundaries[-1].date() - timedelta(days=1)
+        occurrences = await RecurringTransactionService(self.db).project_occurrences(
+            user_id, (horizon - today).days + 1, until=horizon
+        )
+        scheduled = np.zeros((len(months), len(categories)))
+        occurrences = [occurrence for occurrence in occurrences if occurrence.category_id in index]
+        if occurrences:
+            due_dates = np.array([occurrence.due_date for occurrence in occurrences], dtype="datetime64[us]")
+            period_index = np.searchsorted(edges, due_dates, side="right") - 1
+            category_index = np.array([index[occurrence.category_id] for occurrence in occurrences])
+            amounts = np.array([float(occurrence.amount) for occurrence in occurrences])
+            valid = (period_index >= 0) & (period_index < len(months))
+            np.add.at(scheduled, (period_index[valid], category_index[valid]), amounts[valid])
+
+        # History already includes materialized recurring transactions, so only the rest is extrapolated
+        recurring_rate = scheduled[1:].sum(axis=0) / months[1:].sum()
+        discretionary = baseline - recurring_rate
+        discretionary = np.where(baseline < 0, np.minimum(discretionary, 0), np.maximum(discretionary, 0))
+        projected = np.outer(months, discretionary) + scheduled
+
+        # Period totals per transaction type, with what the current period has already recorded
+        by_type = np.zeros((len(categories), len(TRANSACTION_TYPES)))
+        by_type[np.arange(len(categories)), category_types] = 1
+        totals = projected @ by_type
+        income = TRANSACTION_TYPES.index("income")
+        expected_income = float(current.expected_income or 0) if current else 0.0
+        if current:
+            totals[0] += [float(getattr(current, column) or 0) for column in PERIOD_TOTAL_COLUMNS.values()]
+        if expected_income > 0:
+            totals[1:, income] = expected_income
+            totals[0, income] = max(totals[0, income], expected_income)
+
+        used = [TRANSACTION_TYPES.index(name) for name in ("expense", "saving", "investment")]
+        net = totals[:, income] + totals[:, used].sum(axis=1)
+        brought_forward = float(current.brought_forward or 0) if current else 0.0
+        carried = carry_forward(brought_forward, net)
+        brought = np.concatenate(([brought_forward], carried[:-1]))
+
+        forecasts = []
+        for k in range(1, len(months)):
+            breakdown = [
+                CategoryForecast(
+                    category_id=category.id,
+                    category_name=category.name,
+                    category_type=category.type,
+                    amount=_money(projected[k, j]),
+                )
+                for j, category in enumerate(categories)
+                if category.type != "income" and abs(projected[k, j]) >= 0.005
+            ]
+            forecasts.append(
+                PeriodForecast(
+                    started_at=boundaries[k],
+                    ended_at=boundaries[k + 1] - timedelta(microseconds=1),
+                    expected_income=_money(expected_income),
+                    **{column: _money(totals[k, t]) for t, column in enumerate(PERIOD_TOTAL_COLUMNS.values())},
+                    brought_forward=_money(brought[k]),
+                    carried_forward=_money(carried[k]),
+                    categories=sorted(breakdown, key=lambda item: item.amount),
+                )
+            )
+        return forecasts
+
+    async def _get_current_period(self, user_id: UUID) -> Tuple[Optional[BudgetPeriod], int]:
+        """The user's open period, if any, and their salary day"""
+        query = (
+            select(BudgetPeriod, User.salary_day)
+            .select_from(User)
+            .outerjoin(
+                BudgetPeriod,
+                and_(
+                    BudgetPeriod.user_id == User.id,
+                    BudgetPeriod.status == "active",
+                    BudgetPeriod.ended_at.is_(None),
+                ),
+            )
+            .where(User.id == user_id)
+            .order_by(desc(BudgetPeriod.started_at))
+            .limit(1)
+        )
+        row = (await self.db.execute(query)).first()
+        if row is None:
+            raise ValueError("User not found")
+        return row[0], row[1] or 1
+
+    async def _get_categories(self, user_id: UUID) -> List[Category]:
+        query = (
+            select(Category)
+            .where(Category.user_id == user_id, Category.type.in_(TRANSACTION_TYPES))
+            .order_by(Category.name)
+        )
+        return (await self.db.execute(query)).scalars().all()
+
+    async def _get_monthly_history(self, user_id: UUID, today: date, index: dict) -> np.ndarray:
+        """Months x categories totals of the full months before today, from the first month with any activity"""
+        current_month = today.year * 12 + today.month - 1
+        first_month = current_month - FORECAST_HISTORY_MONTHS
+        month_index = TransactionRollup.year * 12 + TransactionRollup.month - 1
+        query = (
+            select(month_index.label("month_index"), TransactionRollup.category_id, func.sum(TransactionRollup.total_amount))
+            .where(
+                TransactionRollup.user_id == user_id,
+                TransactionRollup.year >= first_month // 12,
+                month_index >= first_month,
+                month_index < current_month,
+            )
+            .group_by(month_index, TransactionRollup.category_id)
+        )
+        rows = [row for row in await self.db.execute(query) if row.category_id in index]
+        if not rows:
+            return np.zeros((0, len(index)))
+
+        month_numbers = np.array([row.month_index for row in rows])
+        start = month_numbers.min()
+        history = np.zeros((current_month - start, len(index)))
+        np.add.at(
+            history,
+            (month_numbers - start, np.array([index[row.category_id] for row in rows])),
+            np.array([float(row[2]) for row in rows]),
+        )
+        return history
@@ -0,0 +1,236 @@
+import logging
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import Date, Integer, and_, case, cast, extract, func, or_, over, select, true
+from sqlalchemy.dialects.postgresql import INTERVAL
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.category_models import Category
+from app.models.recurring_transaction_models import RecurringTransaction
+from app.schemas.analytics_schemas import UpcomingBill
+from app.schemas.transaction_schemas import TransactionCreate
+from app.services.transaction_service import TransactionService
+from app.utils.redis import redis_service
+
+logger = logging.getLogger(__name__)
+
+FREQUENCY_STEPS = {
+    "daily": relativedelta(days=1),
+    "weekly": relativedelta(weeks=1),
+    "monthly": relativedelta(months=1),
+    "yearly": relativedelta(years=1),
+}
+
+# Occurrences caught up per recurring transaction and run, so a long-paused schedule cannot flood one batch
+MAX_OCCURRENCES_PER_RUN = 366
+
+# Upcoming bills shown on the dashboard: occurrences per rule, and how far ahead
+UPCOMING_BILL_OCCURRENCES = 3
+UPCOMING_BILLS_DAYS = 31
+# Projections are keyed by day and the user's recurring version, so this only bounds how long stale days linger
+UPCOMING_BILLS_CACHE_TTL = 86400
+
+
+def next_occurrence(start_date: date, due_date: date, frequency: str) -> date:
+    """The occurrence after due_date, counted from start_date so month ends do not drift (31st -> 28th -> 28th)"""
+    step = FREQUENCY_STEPS.get(frequency)
+    if step is None:
+        raise ValueError(f"Unsupported recurring frequency: {frequency}")
+
+    if frequency in ("monthly", "yearly"):
+        months = (due_date.year - start_date.year) * 12 + due_date.month - start_date.month
+        count = months if frequency == "monthly" else months // 12
+        candidate = start_date + step * count
+        while candidate <= due_date:
+            count += 1
+            candidate = start_date + step * count
+        return candidate
+    return due_date + step
+
+
+def _version_key(user_id: UUID) -> str:
+    return f"recurring:version:{user_id}"
+
+
+async def invalidate_recurring_projections(user_id: UUID):
+    """Make the user's cached upcoming-bill projections stale; call after committing a recurring rule change"""
+    await redis_service.incr(_version_key(user_id))
+
+
+class RecurringTransactionService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.transaction_service = TransactionService(db)
+
+    async def materialize_due(self, today: Optional[date] = None, batch_size: int = 500) -> int:
+        """Create the transactions of recurring schedules that are due, one database transaction per user.
+
+        Each user's schedules are locked with FOR UPDATE SKIP LOCKED and their next_due_date advanced in the
+        same commit as the created transactions, so concurrent or repeated runs never create an occurrence twice.
+        Returns how many transactions were created.
+        """
+        today = today or date.today()
+        due = await self.db.execute(
+            select(RecurringTransaction.user_id, RecurringTransaction.id)
+            .where(self._is_due(today))
+            .order_by(RecurringTransaction.next_due_date)
+            .limit(batch_size)
+        )
+        ids_by_user: Dict[UUID, List[UUID]] = defaultdict(list)
+        for user_id, recurring_id in due:
+            ids_by_user[user_id].append(recurring_id)
+
+        created = 0
+        for user_id, recurring_ids in ids_by_user.items():
+            created += await self._materialize_user(user_id, recurring_ids, today)
+        return created
+
+    async def _materialize_user(self, user_id: UUID, recurring_ids: List[UUID], today: date) -> int:
+        result = await self.db.execute(
+            select(RecurringTransaction)
+            .where(and_(RecurringTransaction.id.in_(recurring_ids), self._is_due(today)))
+            .with_for_update(skip_locked=True)
+        )
+        schedules = result.scalars().all()
+
+        transactions = []
+        for schedule in schedules:
+            due_date = schedule.next_due_date
+            for _ in range(MAX_OCCURRENCES_PER_RUN):
+                if due_date > today or (schedule.end_date and due_date > schedule.end_date):
+                    break
+                transactions.append(
+                    TransactionCreate(
+                        amount=schedule.amount,
+                        description=schedule.description,
+                        transacted_at=datetime.combine(due_date, time.min, tzinfo=timezone.utc),
+                        type=schedule.type,
+                        category_id=schedule.category_id,
+                        is_recurring=True,
+                        recurring_frequency=schedule.frequency,
+                    )
+                )
+                due_date = next_occurrence(schedule.start_date, due_date, schedule.frequency)
+
+            schedule.next_due_date = due_date
+            if schedule.end_date and due_date > schedule.end_date:
+                schedule.is_active = False
+
+        if not transactions:
+            await self.db.commit()
+            return 0
+
+        # Commits the advanced schedules together with the new transactions and their period totals
+        await self.transaction_service.bulk_create_transactions(user_id, transactions)
+        await invalidate_recurring_projections(user_id)
+        logger.info("Materialized %d recurring transactions for user %s", len(transactions), user_id)
+        return len(transactions)
+
+    async def get_upcoming_bills(
+        self, user_id: UUID, days: int = UPCOMING_BILLS_DAYS, occurrences: int = UPCOMING_BILL_OCCURRENCES
+    ) -> List[UpcomingBill]:
+        """Upcoming bills for the dashboard, cached per user and day until a recurring rule changes"""
+        today = date.today()
+        key_prefix = f"upcoming_bills:{user_id}:{today.isoformat()}:{days}:{occurrences}"
+        version, cached = await redis_service.get_versioned(_version_key(user_id), key_prefix)
+        if cached is not None:
+            return [UpcomingBill.model_validate(bill) for bill in cached]
+
+        bills = await self.project_occurrences(
+            user_id, occurrences, until=today + timedelta(days=days), include_income=False
+        )
+        if version is not None:
+            payload = [bill.model_dump(mode="json") for bill in bills]
+            await redis_service.setex(f"{key_prefix}:{version}", UPCOMING_BILLS_CACHE_TTL, payload)
+        return bills
+
+    async def project_occurrences(
+        self, user_id: UUID, occurrences: int, until: Optional[date] = None, include_income: bool = True
+    ) -> List[UpcomingBill]:
+        """Expand a user's active recurring rules into their next occurrences, soonest first, in one query.
+
+        Postgres generates each rule's date series: occurrence n is start_date + n steps, counted from the
+        rule's start so month ends do not drift, and the series starts at the step of next_due_date.
+        """
+        rule = RecurringTransaction
+        frequency = rule.frequency
+        next_due, start = rule.next_due_date, rule.start_date
+        months_between = (extract("year", next_due) - extract("year", start)) * 12 + (
+            extract("month", next_due) - extract("month", start)
+        )
+        # Steps from start_date to next_due_date, one short so a clamped month end is not skipped
+        first_step = func.greatest(
+            cast(
+                case(
+                    (frequency == "daily", next_due - start),
+                    (frequency == "weekly", (next_due - start) / 7),
+                    (frequency == "monthly", months_between),
+                    else_=months_between / 12,
+                ),
+                Integer,
+            )
+            - 1,
+            0,
+        )
+        series = func.generate_series(first_step, first_step + occurrences).table_valued("step").render_derived(name="series").lateral()
+        step = series.c.step
+
+        def steps_of(name):
+            return case((frequency == name, step), else_=0)
+
+        interval = func.make_interval(
+            steps_of("yearly"), steps_of("monthly"), steps_of("weekly"), steps_of("daily"), type_=INTERVAL
+        )
+        due_date = cast(start + interval, Date)
+
+        conditions = [
+            rule.user_id == user_id,
+            rule.is_active,
+            frequency.in_(FREQUENCY_STEPS),
+            due_date >= next_due,
+            or_(rule.end_date.is_(None), due_date <= rule.end_date),
+        ]
+        if until is not None:
+            conditions.append(due_date <= until)
+        if not include_income:
+            conditions.append(rule.type != "income")
+
+        projected = (
+            select(
+                rule.id.label("recurring_transaction_id"),
+                rule.description,
+                case((rule.type == "income", func.abs(rule.amount)), else_=-func.abs(rule.amount)).label("amount"),
+                rule.type,
+                frequency.label("frequency"),
+                due_date.label("due_date"),
+                rule.category_id,
+                Category.name.label("category_name"),
+                Category.color.label("category_color"),
+                Category.icon.label("category_icon"),
+                over(func.row_number(), partition_by=rule.id, order_by=step).label("occurrence"),
+            )
+            .select_from(rule)
+            .join(series, true())
+            .join(Category, Category.id == rule.category_id)
+            .where(and_(*conditions))
+            .subquery()
+        )
+        query = (
+            select(*(column for column in projected.c if column.name != "occurrence"))
+            .where(projected.c.occurrence <= occurrences)
+            .order_by(projected.c.due_date, projected.c.description)
+        )
+        result = await self.db.execute(query)
+        return [UpcomingBill.model_validate(row, from_attributes=True) for row in result]
+
+    @staticmethod
+    def _is_due(today: date):
+        return and_(
+            RecurringTransaction.is_active,
+            RecurringTransaction.next_due_date <= today,
+            or_(RecurringTransaction.end_date.is_(None), RecurringTransaction.next_due_date <= RecurringTransaction.end_date),
+        )
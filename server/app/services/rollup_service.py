@@ -0,0 +1,133 @@
+from collections import defaultdict
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Dict, Iterable, Tuple
+from uuid import UUID
+
+from sqlalchemy import delete, extract, func, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.transaction_models import Transaction
+from app.models.transaction_rollup_models import TransactionRollup
+from app.utils.analytics_cache import invalidate_user_analytics
+
+# (budget_period_id, year, month, category_id, type)
+RollupKey = Tuple[UUID, int, int, UUID, str]
+
+
+class RollupService:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @staticmethod
+    def key_for(transaction: Transaction) -> RollupKey:
+        """Get the rollup bucket a transaction belongs to"""
+        transacted_at = transaction.transacted_at
+        if isinstance(transacted_at, datetime) and transacted_at.tzinfo:
+            transacted_at = transacted_at.astimezone(timezone.utc)
+
+        transaction_type = getattr(transaction.type, "value", transaction.type)
+        return (
+            transaction.budget_period_id,
+            transacted_at.year,
+            transacted_at.month,
+            transaction.category_id,
+            transaction_type,
+        )
+
+    @classmethod
+    def collect_deltas(cls, transactions: Iterable[Transaction]) -> Dict[RollupKey, Tuple[Decimal, int]]:
+        """Sum the amount and count of new transactions per rollup bucket"""
+        deltas = defaultdict(lambda: [Decimal("0"), 0])
+        for transaction in transactions:
+            delta = deltas[cls.key_for(transaction)]
+            delta[0] += transaction.amount
+            delta[1] += 1
+        return {key: (amount, count) for key, (amount, count) in deltas.items()}
+
+    async def apply_deltas(self, user_id: UUID, deltas: Dict[RollupKey, Tuple[Decimal, int]]):
+        """Upsert amount and count changes into the rollup table without committing"""
+        if not deltas:
+            return
+
+        rows = [
+            {
+                "user_id": user_id,
+                "budget_period_id": period_id,
+                "year": year,
+                "month": month,
+                "category_id": category_id,
+                "type": transaction_type,
+                "total_amount": amount,
+                "transaction_count": count,
+            }
+            for (period_id, year, month, category_id, transaction_type), (amount, count) in deltas.items()
+        ]
+
+        primary_key = list(TransactionRollup.__table__.primary_key.columns)
+        query = insert(TransactionRollup).values(rows)
+        query = query.on_conflict_do_update(
+            index_elements=[c.name for c in primary_key],
+            set_={
+                "total_amount": TransactionRollup.total_amount + query.excluded.total_amount,
+                "transaction_count": TransactionRollup.transaction_count + query.excluded.transaction_count,
+                "updated_at": func.now(),
+            },
+        )
+        if not any(count < 0 for _, count in deltas.values()):
+            await self.db.execute(query)
+            return
+
+        # Drop the buckets this upsert emptied, by primary key, rather than scanning all of the user's rollups
+        result = await self.db.execute(query.returning(*primary_key, TransactionRollup.transaction_count))
+        emptied = [tuple(row[:-1]) for row in result if row.transaction_count <= 0]
+        if emptied:
+            await self.db.execute(delete(TransactionRollup).where(tuple_(*primary_key).in_(emptied)))
+
+    async def rebuild_user_rollups(self, user_id: UUID):
+        """Rebuild a user's rollups from their transactions (repair mode)"""
+        transacted_at = func.timezone("UTC", Transaction.transacted_at)
+        year = extract("year", transacted_at)
+        month = extract("month", transacted_at)
+
+        aggregate = (
+            select(
+                Transaction.user_id,
+                Transaction.budget_period_id,
+                year,
+                month,
+                Transaction.category_id,
+                Transaction.type,
+                func.sum(Transaction.amount),
+                func.count(Transaction.id),
+            )
+            .where(Transaction.user_id == user_id)
+            .group_by(
+                Transaction.user_id,
+                Transaction.budget_period_id,
+                year,
+                month,
+                Transaction.category_id,
+                Transaction.type,
+            )
+        )
+
+        await self.db.execute(delete(TransactionRollup).where(TransactionRollup.user_id == user_id))
+        await self.db.execute(
+            insert(TransactionRollup).from_select(
+                [
+                    "user_id",
+                    "budget_period_id",
+                    "year",
+                    "month",
+                    "category_id",
+                    "type",
+                    "total_amount",
+                    "transaction_count",
+                ],
+                aggregate,
+            )
+        )
+        await self.db.commit()
+        await invalidate_user_analytics(user_id)
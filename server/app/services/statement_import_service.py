@@ -0,0 +1,341 @@
+import codecs
+import csv
+import logging
+import re
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import AsyncIterator, Dict, List, NamedTuple, Optional, Tuple
+from uuid import UUID
+
+from fastapi import UploadFile
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.category_models import Category
+from app.schemas.transaction_schemas import (
+    ImportBatchProgress,
+    ImportRowError,
+    StatementImportResult,
+    TransactionCreate,
+    TransactionType,
+)
+from app.services.transaction_service import TransactionService
+from app.utils.date_parser import parse_date_string
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 100
+
+# Accepted CSV header -> TransactionCreate field
+CSV_COLUMNS = {
+    "date": "transacted_at",
+    "transacted_at": "transacted_at",
+    "amount": "amount",
+    "category": "category",
+    "description": "description",
+    "type": "type",
+    "payment_method": "payment_method",
+}
+
+# Optional sign, digits with optional comma thousands groups, optional dot decimals
+AMOUNT_PATTERN = re.compile(r"^[+-]?(\d{1,3}(,\d{3})+|\d+)(\.\d+)?$")
+
+# A parsed statement row: (CSV line number or OFX transaction number, raw field values)
+Record = Tuple[int, Dict[str, str]]
+
+
+class DefaultCategories(NamedTuple):
+    """(id, type) of the categories used for rows without one, picked by the sign of the amount"""
+
+    outgoing: Optional[Tuple[UUID, str]] = None
+    income: Optional[Tuple[UUID, str]] = None
+
+    def for_amount(self, credit: bool) -> Optional[Tuple[UUID, str]]:
+        preferred, fallback = (self.income, self.outgoing) if credit else (self.outgoing, self.income)
+        return preferred or fallback
+
+
+async def read_chunks(file: UploadFile, max_size: int, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Read an upload in fixed-size chunks, refusing to go past max_size bytes"""
+    read = 0
+    while chunk := await file.read(chunk_size):
+        read += len(chunk)
+        if read > max_size:
+            raise ValueError(f"File exceeds the maximum upload size of {max_size} bytes")
+        yield chunk
+
+
+class StatementImportService:
+    """Import CSV/OFX bank statements through a chunk -> record -> transaction -> batch pipeline.
+
+    Only one chunk, one batch and the user's category map are held in memory at a time, and every batch
+    is committed on its own, so memory stays flat regardless of statement size.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.transaction_service = TransactionService(db)
+
+    async def import_statement(
+        self,
+        user_id: UUID,
+        chunks: AsyncIterator[bytes],
+        file_format: str,
+        default_category_id: Optional[UUID] = None,
+        batch_size: int = BATCH_SIZE,
+        default_income_category_id: Optional[UUID] = None,
+    ) -> StatementImportResult:
+        """Import a statement and return the per-batch progress and row errors.
+
+        An error that stops the stream, like an oversized upload or a broken CSV, raises ValueError when
+        nothing was written yet, and is otherwise returned in the result's error next to the committed batches.
+
+        Rows without a category use default_income_category_id for credits and default_category_id for
+        debits, falling back to whichever of the two was given.
+        """
+        if file_format not in ("csv", "ofx"):
+            raise ValueError(f"Unsupported statement format: {file_format}")
+
+        categories = await self._load_categories(user_id)
+        defaults = DefaultCategories(
+            outgoing=self._find_category(categories, default_category_id),
+            income=self._find_category(categories, default_income_category_id),
+        )
+
+        result = StatementImportResult(format=file_format)
+        records = self._csv_records(chunks) if file_format == "csv" else self._ofx_records(chunks)
+        transactions = self._transactions(records, categories, defaults, result)
+
+        try:
+            async for batch in self._batches(transactions, batch_size):
+                created = await self.transaction_service.bulk_create_transactions(user_id, batch)
+                result.imported += len(created)
+                result.batches.append(
+                    ImportBatchProgress(
+                        batch=len(result.batches) + 1,
+                        imported=len(created),
+                        rows_processed=result.rows_processed,
+                    )
+                )
+                logger.info(
+                    "Statement import for user %s: batch %d, %d rows processed, %d imported",
+                    user_id,
+                    len(result.batches),
+                    result.rows_processed,
+                    result.imported,
+                )
+        except ValueError as e:
+            # Nothing written yet: fail the whole import. Otherwise report what the committed batches hold.
+            if not result.batches:
+                raise
+            result.error = str(e)
+            logger.warning("Statement import for user %s stopped after %d batches: %s", user_id, len(result.batches), e)
+
+        return result
+
+    async def _load_categories(self, user_id: UUID) -> Dict[str, List[Tuple[UUID, str]]]:
+        """Map lower-cased category names to their (id, type) pairs, loaded once per import"""
+        rows = await self.db.execute(select(Category.id, Category.name, Category.type).where(Category.user_id == user_id))
+        categories: Dict[str, List[Tuple[UUID, str]]] = {}
+        for category_id, name, category_type in rows:
+            categories.setdefault(name.strip().lower(), []).append((category_id, category_type))
+        return categories
+
+    @staticmethod
+    def _find_category(
+        categories: Dict[str, List[Tuple[UUID, str]]], category_id: Optional[UUID]
+    ) -> Optional[Tuple[UUID, str]]:
+        if not category_id:
+            return None
+        category = next(
+            (match for matches in categories.values() for match in matches if match[0] == category_id), None
+        )
+        if not category:
+            raise ValueError("Default category not found")
+        return category
+
+    @staticmethod
+    async def _decode(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+        """Decode byte chunks incrementally, so multi-byte characters split across chunks survive"""
+        decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+        async for chunk in chunks:
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    @classmethod
+    async def _lines(cls, chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+        """Split decoded chunks into lines, keeping only the unfinished line between chunks"""
+        pending = ""
+        async for text in cls._decode(chunks):
+            pending += text
+            *lines, pending = pending.splitlines(keepends=True)
+            for line in lines:
+                yield line
+        if pending:
+            yield pending
+
+    @classmethod
+    async def _csv_records(cls, chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+        """Parse CSV rows keyed by their lower-cased header"""
+        header = None
+        buffer = ""
+        line_number = 0
+        start_line = 0
+        async for line in cls._lines(chunks):
+            line_number += 1
+            if not buffer:
+                start_line = line_number
+            buffer += line
+            # A quoted field can span lines; wait until its closing quote arrives
+            if buffer.count('"') % 2:
+                continue
+
+            row = next(csv.reader([buffer]), [])
+            buffer = ""
+            if not any(value.strip() for value in row):
+                continue
+            if header is None:
+                header = [CSV_COLUMNS.get(name.strip().lower(), name.strip().lower()) for name in row]
+                continue
+            yield start_line, {name: value.strip() for name, value in zip(header, row)}
+
+        if buffer:
+            raise ValueError(f"Unterminated quoted field starting on line {start_line}")
+
+    @classmethod
+    async def _ofx_records(cls, chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+        """Parse <STMTTRN> blocks from OFX/QFX, tolerating both SGML (unclosed) and XML tags"""
+        record: Optional[Dict[str, str]] = None
+        number = 0
+        pending = ""
+        async for text in cls._decode(chunks):
+            pending += text
+            *elements, pending = pending.split("<")
+            for element in elements:
+                tag, _, value = element.partition(">")
+                tag = tag.strip().upper()
+                if tag == "STMTTRN":
+                    number += 1
+                    record = {}
+                elif tag == "/STMTTRN" and record is not None:
+                    yield number, cls._ofx_to_fields(record)
+                    record = None
+                elif record is not None and tag and not tag.startswith("/"):
+                    record[tag] = value.strip()
+
+    @staticmethod
+    def _ofx_to_fields(record: Dict[str, str]) -> Dict[str, str]:
+        """Translate OFX transaction tags into the CSV field names"""
+        description = " - ".join(part for part in (record.get("NAME"), record.get("MEMO")) if part)
+        return {
+            "transacted_at": record.get("DTPOSTED", ""),
+            "amount": record.get("TRNAMT", ""),
+            "description": description,
+            "payment_method": record.get("TRNTYPE", "").lower(),
+        }
+
+    async def _transactions(
+        self,
+        records: AsyncIterator[Record],
+        categories: Dict[str, List[Tuple[UUID, str]]],
+        defaults: DefaultCategories,
+        result: StatementImportResult,
+    ) -> AsyncIterator[TransactionCreate]:
+        """Validate records into TransactionCreate, recording rejected rows on the result"""
+        async for row, fields in records:
+            result.rows_processed += 1
+            try:
+                yield self._to_transaction(fields, categories, defaults)
+            except (ValueError, ValidationError) as e:
+                result.failed += 1
+                if len(result.errors) < MAX_REPORTED_ERRORS:
+                    result.errors.append(ImportRowError(row=row, error=str(e)))
+
+    def _to_transaction(
+        self,
+        fields: Dict[str, str],
+        categories: Dict[str, List[Tuple[UUID, str]]],
+        defaults: DefaultCategories,
+    ) -> TransactionCreate:
+        amount = self._parse_amount(fields.get("amount", ""))
+        credit = amount > 0
+
+        requested_type = fields.get("type", "").lower() or None
+        if requested_type:
+            requested_type = TransactionType(requested_type).value
+
+        name = fields.get("category", "").lower()
+        if name:
+            matches = categories.get(name)
+            if not matches:
+                raise ValueError(f"Unknown category: {fields['category']}")
+            # Same name can exist under several types; prefer the one matching the row
+            wanted = requested_type or ("income" if credit else "expense")
+            category = next((match for match in matches if match[1] == wanted), matches[0])
+        else:
+            category = defaults.for_amount(credit)
+            if not category:
+                raise ValueError("Row has no category and no default category was given")
+
+        transaction_type = requested_type
+        if not transaction_type:
+            # Without a type column the sign decides: credits, refunds included, are income and debits go out
+            # under the category's own type
+            transaction_type = "income" if credit else ("expense" if category[1] == "income" else category[1])
+        return TransactionCreate(
+            amount=abs(amount),
+            description=fields.get("description") or None,
+            transacted_at=self._parse_date(fields.get("transacted_at", "")),
+            type=transaction_type,
+            payment_method=fields.get("payment_method") or None,
+            category_id=category[0],
+        )
+
+    @staticmethod
+    def _parse_amount(value: str) -> Decimal:
+        """Parse a signed or parenthesised amount, with optional comma thousands and a dot decimal separator.
+
+        Amounts whose separators could be read either way, like 1.234,56 or 12,50, are rejected rather than guessed.
+        """
+        text = re.sub(r"[^\d.,()+\-]", "", value)
+        negative = text.startswith("(") and text.endswith(")")
+        if negative:
+            text = text[1:-1]
+        if not AMOUNT_PATTERN.match(text) or (negative and text[0] in "+-"):
+            raise ValueError(f"Invalid or ambiguous amount: {value!r}")
+        amount = Decimal(text.replace(",", ""))
+        return -amount if negative else amount
+
+    @staticmethod
+    def _parse_date(value: str) -> datetime:
+        """Accept OFX timestamps (YYYYMMDD[HHMMSS]), ISO datetimes and the app's date formats"""
+        value = value.strip()
+        if re.match(r"^\d{8}", value):
+            digits = re.match(r"^\d{8}(\d{6})?", value).group(0)
+            parsed = datetime.strptime(digits, "%Y%m%d%H%M%S" if len(digits) == 14 else "%Y%m%d")
+            return parsed.replace(tzinfo=timezone.utc)
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            parsed = datetime.combine(parse_date_string(value.replace("/", "-")), datetime.min.time())
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+    @staticmethod
+    async def _batches(
+        transactions: AsyncIterator[TransactionCreate], batch_size: int
+    ) -> AsyncIterator[List[TransactionCreate]]:
+        batch = []
+        async for transaction in transactions:
+            batch.append(transaction)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
@@ -1,21 +1,28 @@
-from datetime import date
-from typing import List, Optional
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, desc, select, func
+from sqlalchemy import Row, and_, desc, insert, select, func, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, selectinload
 
+from app.models.budget_period_models import BudgetPeriod
 from app.models.category_models import Category
 from app.models.transaction_models import Transaction
 from app.schemas.transaction_schemas import TransactionCreate, TransactionType, TransactionUpdate
 from app.services.budget_service import BudgetService
+from app.services.rollup_service import RollupService
+from app.utils.analytics_cache import invalidate_user_analytics
+from app.utils.serialization import CATEGORY_ROW_FIELDS, TRANSACTION_ROW_FIELDS
 
 
 class TransactionService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.budget_service = BudgetService(db)
+        self.rollup_service = RollupService(db)
 
     async def get_transactions(
         self,
@@ -27,34 +34,64 @@ class TransactionService:
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         period_id: Optional[UUID] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
     ) -> List[Transaction]:
-        """Get transactions with filters"""
+        """Get transactions with filters, newest first.
+
+        Pass ``after`` as the (transacted_at, id) of the last row already seen to page by keyset
+        instead of offset.
+        """
         query = select(Transaction).options(
             joinedload(Transaction.category),
             selectinload(Transaction.budget_period)
         )
+        filters = self._transaction_filters(
+            user_id, category_id, transaction_type, start_date, end_date, period_id, after
+        )
 
-        # Base filter for user
-        filters = [Transaction.user_id == user_id]
+        query = query.where(and_(*filters))
+        query = query.order_by(desc(Transaction.transacted_at), desc(Transaction.id))
+        query = query.offset(skip).limit(limit)
 
-        # Apply additional filters
-        if category_id:
-            filters.append(Transaction.category_id == category_id)
-        if transaction_type:
-            filters.append(Transaction.type == transaction_type)
-        if start_date:
-            filters.append(Transaction.transacted_at >= start_date)
-        if end_date:
-            filters.append(Transaction.transacted_at <= end_date)
-        if period_id:
-            filters.append(Transaction.budget_period_id == period_id)
+        result = await self.db.execute(query)
+        return result.scalars().all()
+
+    async def get_transaction_rows(
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 100,
+        category_id: Optional[UUID] = None,
+        transaction_type: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        period_id: Optional[UUID] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> List[Row]:
+        """Same page as get_transactions, as flat rows shaped for TransactionWithCategory.
+
+        Category columns are labelled category_<field> and the period start period_started_at, so rows
+        can be serialized without building ORM objects or Pydantic models.
+        """
+        query = (
+            select(
+                *(getattr(Transaction, field) for field in TRANSACTION_ROW_FIELDS),
+                *(getattr(Category, field).label(f"category_{field}") for field in CATEGORY_ROW_FIELDS),
+                BudgetPeriod.started_at.label("period_started_at"),
+            )
+            .join(Category, Transaction.category_id == Category.id)
+            .outerjoin(BudgetPeriod, Transaction.budget_period_id == BudgetPeriod.id)
+        )
+        filters = self._transaction_filters(
+            user_id, category_id, transaction_type, start_date, end_date, period_id, after
+        )
 
         query = query.where(and_(*filters))
-        query = query.order_by(desc(Transaction.transacted_at))
+        query = query.order_by(desc(Transaction.transacted_at), desc(Transaction.id))
         query = query.offset(skip).limit(limit)
 
         result = await self.db.execute(query)
-        return result.scalars().all()
+        return result.all()
 
     async def count_transactions(
         self,
@@ -67,7 +104,24 @@ class TransactionService:
     ) -> int:
         """Count transactions with filters"""
         query = select(func.count(Transaction.id))
+        filters = self._transaction_filters(user_id, category_id, transaction_type, start_date, end_date, period_id)
+
+        query = query.where(and_(*filters))
 
+        result = await self.db.execute(query)
+        return result.scalar() or 0
+
+    @staticmethod
+    def _transaction_filters(
+        user_id: UUID,
+        category_id: Optional[UUID] = None,
+        transaction_type: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        period_id: Optional[UUID] = None,
+        after: Optional[Tuple[datetime, UUID]] = None,
+    ) -> list:
+        """Build the WHERE clauses shared by the transaction listing and count queries"""
         # Base filter for user
         filters = [Transaction.user_id == user_id]
 
@@ -82,11 +136,9 @@ class TransactionService:
             filters.append(Transaction.transacted_at <= end_date)
         if period_id:
             filters.append(Transaction.budget_period_id == period_id)
-
-        query = query.where(and_(*filters))
-
-        result = await self.db.execute(query)
-        return result.scalar() or 0
+        if after:
+            filters.append(tuple_(Transaction.transacted_at, Transaction.id) < tuple_(*after))
+        return filters
 
     async def create_transaction(self, user_id: UUID, transaction_data: TransactionCreate) -> Transaction:
         """Create a new transaction"""
@@ -103,12 +155,19 @@ class TransactionService:
             )
 
             self.db.add(transaction)
+
+            # Update budget period totals in the same database transaction
+            await self.budget_service.apply_transaction_deltas(
+                budget_period.id, {transaction.type: transaction.amount}
+            )
+            await self.rollup_service.apply_deltas(
+                user_id, {RollupService.key_for(transaction): (transaction.amount, 1)}
+            )
+
             await self.db.commit()
+            await invalidate_user_analytics(user_id)
             await self.db.refresh(transaction)
 
-            # Update budget period totals
-            await self.budget_service.recalculate_period_totals(budget_period.id)
-
             return transaction
         except Exception as e:
             await self.db.rollback()
@@ -134,6 +193,9 @@ class TransactionService:
             return None
 
         old_period_id = transaction.budget_period_id
+        old_amount = transaction.amount
+        old_type = transaction.type
+        old_rollup_key = RollupService.key_for(transaction)
 
         # Update fields
         for field, value in update_data.model_dump(exclude_unset=True).items():
@@ -144,14 +206,28 @@ class TransactionService:
             new_period = await self.budget_service.get_or_create_period_for_date(user_id, update_data.transacted_at)
             transaction.budget_period_id = new_period.id
 
+        # Move the amount between period totals instead of re-aggregating them
+        if old_period_id == transaction.budget_period_id:
+            deltas = {old_type: -old_amount}
+            deltas[transaction.type] = deltas.get(transaction.type, 0) + transaction.amount
+            await self.budget_service.apply_transaction_deltas(old_period_id, deltas)
+        else:
+            await self.budget_service.apply_transaction_deltas(old_period_id, {old_type: -old_amount})
+            await self.budget_service.apply_transaction_deltas(
+                transaction.budget_period_id, {transaction.type: transaction.amount}
+            )
+
+        new_rollup_key = RollupService.key_for(transaction)
+        if new_rollup_key == old_rollup_key:
+            rollup_deltas = {new_rollup_key: (transaction.amount - old_amount, 0)}
+        else:
+            rollup_deltas = {old_rollup_key: (-old_amount, -1), new_rollup_key: (transaction.amount, 1)}
+        await self.rollup_service.apply_deltas(user_id, rollup_deltas)
+
         await self.db.commit()
+        await invalidate_user_analytics(user_id)
         await self.db.refresh(transaction)
 
-        # Recalculate totals for affected periods
-        await self.budget_service.recalculate_period_totals(old_period_id)
-        if old_period_id != transaction.budget_period_id:
-            await self.budget_service.recalculate_period_totals(transaction.budget_period_id)
-
         return transaction
 
     async def delete_transaction(self, transaction_id: UUID, user_id: UUID) -> bool:
@@ -160,44 +236,57 @@ class TransactionService:
         if not transaction:
             return False
 
-        period_id = transaction.budget_period_id
+        await self.budget_service.apply_transaction_deltas(
+            transaction.budget_period_id, {transaction.type: -transaction.amount}
+        )
+        await self.rollup_service.apply_deltas(
+            user_id, {RollupService.key_for(transaction): (-transaction.amount, -1)}
+        )
         await self.db.delete(transaction)
         await self.db.commit()
-
-        # Recalculate period totals
-        await self.budget_service.recalculate_period_totals(period_id)
+        await invalidate_user_analytics(user_id)
 
         return True
 
     async def bulk_create_transactions(
         self, user_id: UUID, transactions_data: List[TransactionCreate]
     ) -> List[Transaction]:
-        """Bulk create transactions"""
-        transactions = []
-
-        for transaction_data in transactions_data:
-            budget_period = await self.budget_service.get_or_create_period_for_date(
-                user_id, transaction_data.transacted_at
-            )
+        """Bulk create transactions with set-based period resolution, inserts and total updates"""
+        if not transactions_data:
+            return []
 
-            if transaction_data.type != TransactionType.INCOME:
-                transaction_data.amount = -abs(transaction_data.amount)
-
-            transaction = Transaction(
-                user_id=user_id, budget_period_id=budget_period.id, **transaction_data.model_dump()
+        try:
+            # Resolve every row's period against the user's period boundaries in one query
+            period_ids = await self.budget_service.resolve_periods_for_dates(
+                user_id, (transaction_data.transacted_at for transaction_data in transactions_data)
             )
-            transactions.append(transaction)
-
-        self.db.add_all(transactions)
-        await self.db.commit()
-
-        # Refresh all transactions
-        for transaction in transactions:
-            await self.db.refresh(transaction)
 
-        # Recalculate totals for all affected periods
-        affected_periods = set(t.budget_period_id for t in transactions)
-        for period_id in affected_periods:
-            await self.budget_service.recalculate_period_totals(period_id)
+            rows = []
+            for transaction_data in transactions_data:
+                if transaction_data.type != TransactionType.INCOME:
+                    transaction_data.amount = -abs(transaction_data.amount)
+                rows.append(
+                    {
+                        "user_id": user_id,
+                        "budget_period_id": period_ids[transaction_data.transacted_at],
+                        **transaction_data.model_dump(),
+                    }
+                )
+
+            # Multi-row INSERT ... RETURNING, batched by the driver
+            result = await self.db.scalars(insert(Transaction).returning(Transaction), rows)
+            transactions = result.all()
+
+            # Sum the new amounts per period and type, then update every affected period in one statement
+            period_deltas: Dict[UUID, Dict[str, Decimal]] = defaultdict(lambda: defaultdict(Decimal))
+            for transaction in transactions:
+                period_deltas[transaction.budget_period_id][transaction.type] += transaction.amount
+            await self.budget_service.apply_bulk_transaction_deltas(period_deltas)
+            await self.rollup_service.apply_deltas(user_id, RollupService.collect_deltas(transactions))
 
-        return transactions
+            await self.db.commit()
+            await invalidate_user_analytics(user_id)
+            return transactions
+        except Exception as e:
+            await self.db.rollback()
+            raise e
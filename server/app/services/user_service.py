@@ -15,6 +15,7 @@ from app.models.budget_period_models import BudgetPeriod
 from app.models.category_models import Category
 from app.models.financial_goal_models import FinancialGoal
 from app.models.transaction_models import Transaction
+from app.utils.user_cache import cache_user, get_cached_user, invalidate_cached_user
 
 
 class UserService:
@@ -25,6 +26,20 @@ class UserService:
         """Get user by ID"""
         return await self.db.get(User, user_id)
 
+    async def get_authenticated_user(self, user_id: UUID) -> Optional[User]:
+        """Get the user for an authenticated request, from the user cache when possible.
+
+        A cached user is detached from the session; use get_user_by_id to load one for writing.
+        """
+        user = await get_cached_user(user_id)
+        if user is not None:
+            return user
+
+        user = await self.get_user_by_id(user_id)
+        if user is not None:
+            await cache_user(user)
+        return user
+
     async def get_user_by_email(self, email: str) -> Optional[User]:
         """Get user by email"""
         query = select(User).where(User.email == email)
@@ -56,6 +71,7 @@ class UserService:
             setattr(user, field, value)
 
         await self.db.commit()
+        await invalidate_cached_user(user_id)
         await self.db.refresh(user)
         return user
 
@@ -70,6 +86,7 @@ class UserService:
 
         user.salary_day = salary_day
         await self.db.commit()
+        await invalidate_cached_user(user_id)
         await self.db.refresh(user)
         return user
 
@@ -81,6 +98,7 @@ class UserService:
 
         await self.db.delete(user)
         await self.db.commit()
+        await invalidate_cached_user(user_id)
         return True
 
     async def get_user_stats(self, user_id: UUID) -> dict:
@@ -0,0 +1,49 @@
+from typing import Any, Awaitable, Callable, Dict
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from app.utils.redis import redis_service
+
+# Seconds each analytics response stays cached. The dashboard embeds Trading212 data, which is only
+# cached for two minutes itself, so it expires with it
+ANALYTICS_CACHE_TTL: Dict[str, int] = {
+    "dashboard": 120,
+    "yearly": 3600,
+    "trends": 3600,
+    "categories": 3600,
+    "forecast": 3600,
+    "net_worth": 3600,
+}
+
+
+def _version_key(user_id: UUID) -> str:
+    return f"analytics:version:{user_id}"
+
+
+async def cached_analytics(user_id: UUID, name: str, compute: Callable[[], Awaitable[Any]], *args) -> Any:
+    """Serve an analytics result from the user's current cache version, computing and storing it on a miss.
+
+    Entries are keyed by the user's version counter, so a write only has to bump the counter to make
+    every cached result for that user unreachable; stale entries expire on their own.
+    """
+    key_prefix = ":".join(["analytics", str(user_id), name, *map(str, args)])
+    version, cached = await redis_service.get_versioned(_version_key(user_id), key_prefix)
+    if cached is not None:
+        return cached
+
+    result = await compute()
+    if version is not None:
+        if isinstance(result, list):
+            payload = [item.model_dump(mode="json") if isinstance(item, BaseModel) else item for item in result]
+        elif isinstance(result, BaseModel):
+            payload = result.model_dump(mode="json")
+        else:
+            payload = result
+        await redis_service.setex(f"{key_prefix}:{version}", ANALYTICS_CACHE_TTL[name], payload)
+    return result
+
+
+async def invalidate_user_analytics(user_id: UUID):
+    """Make every cached analytics result for the user stale; call after committing a write"""
+    await redis_service.incr(_version_key(user_id))
@@ -1,4 +1,5 @@
 from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Tuple
 
 from dateutil.relativedelta import relativedelta
@@ -22,6 +23,14 @@ def calculate_salary_period(salary_day: int, reference_date: datetime = None) ->
     return start_date, end_date
 
 
+def latest_salary_date(salary_day: int, today: date) -> date:
+    """Most recent salary date on or before today; in months shorter than salary_day it falls on the last day"""
+    this_month = today + relativedelta(day=salary_day)
+    if this_month <= today:
+        return this_month
+    return today + relativedelta(months=-1, day=salary_day)
+
+
 def get_financial_year_dates(year: int) -> Tuple[date, date]:
     """Get financial year start and end dates"""
     start_date = date(year, 1, 1)
@@ -34,3 +43,9 @@ def get_month_date_range(year: int, month: int) -> Tuple[date, date]:
     start_date = date(year, month, 1)
     end_date = start_date + relativedelta(months=1) - timedelta(days=1)
     return start_date, end_date
+
+
+@lru_cache(maxsize=1024)
+def format_period_name(started_at: datetime) -> str:
+    """Name a period "Month Name, Year" after the month it mostly covers, cached per period start"""
+    return (started_at + timedelta(days=28)).strftime("%B, %Y")
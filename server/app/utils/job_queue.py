@@ -0,0 +1,135 @@
+import json
+import logging
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional
+
+import redis.asyncio as redis
+
+from app.config import settings
+from app.utils.redis import redis_service
+
+logger = logging.getLogger(__name__)
+
+QUEUE_KEY = "jobs:queue"
+DELAYED_KEY = "jobs:delayed"  # Retries and delayed jobs, scored by when they become due
+PROCESSING_KEY = "jobs:processing"  # Reserved jobs, scored by when their lease expires
+DEAD_KEY = "jobs:dead"
+
+# Pop the next job and lease it in one step, so a worker dying mid-job leaves it in PROCESSING_KEY
+RESERVE_SCRIPT = """
+local payload = redis.call('RPOP', KEYS[1])
+if payload then
+    redis.call('ZADD', KEYS[2], ARGV[1], payload)
+end
+return payload
+"""
+
+# Move up to ARGV[2] members scored at or before ARGV[1] from a sorted set onto the queue
+PROMOTE_SCRIPT = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], '-inf', ARGV[1], 'LIMIT', 0, ARGV[2])
+for _, payload in ipairs(due) do
+    redis.call('ZREM', KEYS[1], payload)
+    redis.call('LPUSH', KEYS[2], payload)
+end
+return #due
+"""
+
+
+@dataclass
+class Job:
+    name: str
+    args: Dict[str, Any] = field(default_factory=dict)
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempts: int = 0
+    enqueued_at: float = field(default_factory=time.time)
+
+    def dumps(self) -> str:
+        return json.dumps(asdict(self), default=str)
+
+    @classmethod
+    def loads(cls, payload: str) -> "Job":
+        return cls(**json.loads(payload))
+
+
+class JobQueue:
+    """Redis-backed job queue with leases, delayed retries and de-duplication.
+
+    Jobs are at-least-once: a job whose worker dies is re-queued when its lease expires, so handlers
+    must be idempotent. Without Redis, enqueue returns None and callers run the work inline.
+    """
+
+    def __init__(self, client: Optional[redis.Redis] = None):
+        self._client = client
+
+    @property
+    def client(self) -> Optional[redis.Redis]:
+        return self._client if self._client is not None else redis_service.client
+
+    async def enqueue(
+        self,
+        name: str,
+        args: Optional[Dict[str, Any]] = None,
+        unique_key: Optional[str] = None,
+        unique_for: int = 3600,
+        delay: float = 0,
+    ) -> Optional[str]:
+        """Queue a job and return its id, or None when Redis is unavailable or unique_key was already queued"""
+        if not self.client:
+            return None
+
+        job = Job(name=name, args=args or {})
+        try:
+            if unique_key and not await self.client.set(f"jobs:unique:{unique_key}", job.id, nx=True, ex=unique_for):
+                return None
+            if delay:
+                await self.client.zadd(DELAYED_KEY, {job.dumps(): time.time() + delay})
+            else:
+                await self.client.lpush(QUEUE_KEY, job.dumps())
+        except redis.RedisError:
+            logger.warning("Could not enqueue job %s", name, exc_info=True)
+            return None
+        return job.id
+
+    async def reserve(self, lease_seconds: float = None) -> Optional[tuple]:
+        """Take the next job, leased for lease_seconds; returns (job, payload) or None when the queue is empty"""
+        lease_seconds = lease_seconds or settings.JOB_LEASE_SECONDS
+        payload = await self.client.eval(RESERVE_SCRIPT, 2, QUEUE_KEY, PROCESSING_KEY, time.time() + lease_seconds)
+        if payload is None:
+            return None
+        return Job.loads(payload), payload
+
+    async def ack(self, payload: str):
+        await self.client.zrem(PROCESSING_KEY, payload)
+
+    async def retry(self, job: Job, payload: str, error: str):
+        """Schedule a failed job again with exponential backoff, or dead-letter it after the last attempt"""
+        await self.client.zrem(PROCESSING_KEY, payload)
+        job.attempts += 1
+        if job.attempts >= settings.JOB_MAX_ATTEMPTS:
+            logger.error("Job %s (%s) failed %d times, dead-lettered: %s", job.name, job.id, job.attempts, error)
+            await self.client.lpush(DEAD_KEY, job.dumps())
+            return
+        backoff = settings.JOB_RETRY_BACKOFF * 2 ** (job.attempts - 1)
+        logger.warning("Job %s (%s) failed, retry %d in %.0fs: %s", job.name, job.id, job.attempts, backoff, error)
+        await self.client.zadd(DELAYED_KEY, {job.dumps(): time.time() + backoff})
+
+    async def promote_due(self, batch_size: int = 100) -> int:
+        """Queue delayed jobs that are due and re-queue jobs whose lease expired; returns how many moved"""
+        now = time.time()
+        moved = 0
+        for key in (DELAYED_KEY, PROCESSING_KEY):
+            moved += await self.client.eval(PROMOTE_SCRIPT, 2, key, QUEUE_KEY, now, batch_size)
+        return moved
+
+    async def stats(self) -> Dict[str, int]:
+        return {
+            "queued": await self.client.llen(QUEUE_KEY),
+            "delayed": await self.client.zcard(DELAYED_KEY),
+            "processing": await self.client.zcard(PROCESSING_KEY),
+            "dead": await self.client.llen(DEAD_KEY),
+        }
+
+
+job_queue = JobQueue()
@@ -0,0 +1,206 @@
+import logging
+import time
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Histogram bucket upper bounds, in seconds and in statements per request
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _labels(**labels: str) -> Labels:
+    return tuple(sorted(labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Labels, **extra: str) -> str:
+    pairs = list(labels) + list(extra.items())
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(str(value))}"' for key, value in pairs) + "}"
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self.values: Dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = _labels(**labels)
+        self.values[key] = self.values.get(key, 0) + amount
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        lines += [f"{self.name}{_format_labels(labels)} {value}" for labels, value in sorted(self.values.items())]
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = buckets
+        # labels -> (cumulative bucket counts, sum, count)
+        self.values: Dict[Labels, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = _labels(**labels)
+        counts, total, count = self.values.get(key) or ([0] * len(self.buckets), 0.0, 0)
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+        self.values[key] = (counts, total + value, count + 1)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total, count) in sorted(self.values.items()):
+            for bound, bucket_count in zip(self.buckets, counts):
+                lines.append(f"{self.name}_bucket{_format_labels(labels, le=str(bound))} {bucket_count}")
+            lines.append(f"{self.name}_bucket{_format_labels(labels, le='+Inf')} {count}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {count}")
+        return lines
+
+
+http_requests = Counter("http_requests_total", "HTTP requests by route template, method and status")
+http_latency = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template and method", LATENCY_BUCKETS
+)
+db_queries = Counter("db_queries_total", "SQL statements executed, by route template")
+db_query_time = Counter("db_query_duration_seconds_total", "Time spent executing SQL statements, by route template")
+db_queries_per_request = Histogram(
+    "db_queries_per_request", "SQL statements issued per request, by route template", QUERY_COUNT_BUCKETS
+)
+cache_requests = Counter("cache_requests_total", "Redis cache lookups by cache (key prefix) and result")
+
+
+@dataclass
+class RequestStats:
+    """SQL activity of the request being handled"""
+
+    queries: int = 0
+    query_time: float = 0.0
+    # Statement texts, only collected while a query budget is enforced
+    statements: Optional[List[str]] = None
+
+
+current_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+
+def install_query_hooks(engine: AsyncEngine):
+    """Attribute every statement the engine runs, and its duration, to the current request"""
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        # Kept on the statement's own execution context, so a failed statement leaves nothing behind on the connection
+        context._query_started_at = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started_at = context._query_started_at
+        stats = current_request_stats.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.query_time += time.perf_counter() - started_at
+            if stats.statements is not None:
+                stats.statements.append(statement)
+
+
+def report_query_budget(route: str, stats: RequestStats, budget: int):
+    """Warn about a request over its SQL statement budget, flagging statements repeated like an N+1"""
+    if stats.queries <= budget:
+        return
+
+    repeated = [
+        f"  {count}x {statement[:200]}"
+        for statement, count in StatementCounter(stats.statements or []).most_common()
+        if count > 1
+    ]
+    logger.warning(
+        "%s ran %d SQL statements (budget %d, %.1fms)%s",
+        route,
+        stats.queries,
+        budget,
+        stats.query_time * 1000,
+        "; repeated statements, possible N+1:\n" + "\n".join(repeated) if repeated else "",
+    )
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency and SQL statements per route template"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        budget = settings.SQL_QUERY_BUDGET
+        stats = RequestStats(statements=[] if budget else None)
+        token = current_request_stats.set(stats)
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            current_request_stats.reset(token)
+            elapsed = time.perf_counter() - started_at
+            # The route template keeps label cardinality bounded; unmatched paths share one label
+            route = getattr(scope.get("route"), "path", "unmatched")
+            method = scope["method"]
+
+            http_requests.inc(method=method, route=route, status=str(status_code))
+            http_latency.observe(elapsed, method=method, route=route)
+            db_queries.inc(stats.queries, route=route)
+            db_query_time.inc(stats.query_time, route=route)
+            db_queries_per_request.observe(stats.queries, route=route)
+            if budget:
+                report_query_budget(f"{method} {route}", stats, budget)
+
+
+def render_metrics(extra_gauges: Dict[str, Tuple[str, float]]) -> str:
+    """Render every metric in the Prometheus text exposition format.
+
+    extra_gauges maps a metric name to (help text, current value) for values read at scrape time.
+    """
+    lines = []
+    for metric in (http_requests, http_latency, db_queries, db_query_time, db_queries_per_request, cache_requests):
+        lines += metric.render()
+
+    lookups: Dict[str, Dict[str, float]] = {}
+    for labels, value in cache_requests.values.items():
+        label_map = dict(labels)
+        lookups.setdefault(label_map["cache"], {}).setdefault(label_map["result"], value)
+    lines += ["# HELP cache_hit_ratio Share of Redis cache lookups that were hits", "# TYPE cache_hit_ratio gauge"]
+    for cache, results in sorted(lookups.items()):
+        total = results.get("hit", 0) + results.get("miss", 0)
+        if total:
+            lines.append(f"cache_hit_ratio{_format_labels(_labels(cache=cache))} {results.get('hit', 0) / total}")
+
+    for name, (help_text, value) in extra_gauges.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} gauge", f"{name} {value}"]
+    return "\n".join(lines) + "\n"
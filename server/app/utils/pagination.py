@@ -0,0 +1,55 @@
+import base64
+import hashlib
+import json
+from datetime import datetime
+from typing import Any, NamedTuple
+from uuid import UUID
+
+
+class Cursor(NamedTuple):
+    """Keyset position of the last item on a page, plus the page number and total carried between pages"""
+
+    transacted_at: datetime
+    id: UUID
+    page: int
+    total: int
+    # filters_key of the query the cursor was issued for
+    filters: str = ""
+
+
+def filters_key(**filters: Any) -> str:
+    """Short stable digest of a list query's filters, so a cursor cannot be replayed against other ones"""
+    values = {name: None if value is None else str(value) for name, value in filters.items()}
+    canonical = json.dumps(values, sort_keys=True)
+    return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Encode a cursor into an opaque, URL-safe token"""
+    payload = {
+        "t": cursor.transacted_at.isoformat(),
+        "i": str(cursor.id),
+        "p": cursor.page,
+        "n": cursor.total,
+        "f": cursor.filters,
+    }
+    return base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str, filters: str = "") -> Cursor:
+    """Decode a token produced by encode_cursor, checking it was issued for the same filters"""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        cursor = Cursor(
+            transacted_at=datetime.fromisoformat(payload["t"]),
+            id=UUID(payload["i"]),
+            page=int(payload["p"]),
+            total=int(payload["n"]),
+            filters=str(payload["f"]),
+        )
+    except (ValueError, TypeError, KeyError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+    if cursor.filters != filters:
+        raise ValueError("Pagination cursor was issued for different filters")
+    return cursor
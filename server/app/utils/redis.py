@@ -1,8 +1,15 @@
 import redis.asyncio as redis
 import json
 import httpx
-from typing import Optional
+from typing import Any, Optional, Tuple
 from app.config import settings
+from app.utils.metrics import cache_requests
+
+# Read a version counter and the entry stored under "<prefix>:<version>" in one round trip
+VERSIONED_GET_SCRIPT = """
+local version = redis.call('GET', KEYS[1]) or '0'
+return {version, redis.call('GET', ARGV[1] .. ':' .. version)}
+"""
 
 
 class RedisService:
@@ -16,8 +23,10 @@ class RedisService:
             return None
         try:
             data = await self.client.get(key)
+            self._record_lookup(key, data)
             return json.loads(data) if data else None
         except (redis.RedisError, json.JSONDecodeError):
+            cache_requests.inc(cache=key.split(":")[0], result="error")
             return None
 
     async def setex(self, key: str, seconds: int, value):
@@ -28,6 +37,42 @@ class RedisService:
         except redis.RedisError:
             pass  # Fail silently for cache writes
 
+    async def get_versioned(self, version_key: str, key_prefix: str) -> Tuple[Optional[str], Any]:
+        """Return (version, cached value) for key_prefix under the current version_key value.
+
+        The version is None when Redis is unavailable, meaning the result must not be cached.
+        """
+        if not self.client:
+            return None, None
+        try:
+            version, data = await self.client.eval(VERSIONED_GET_SCRIPT, 1, version_key, key_prefix)
+            self._record_lookup(key_prefix, data)
+            return version, json.loads(data) if data else None
+        except (redis.RedisError, json.JSONDecodeError):
+            cache_requests.inc(cache=key_prefix.split(":")[0], result="error")
+            return None, None
+
+    async def delete(self, key: str):
+        if not self.client:
+            return
+        try:
+            await self.client.delete(key)
+        except redis.RedisError:
+            pass
+
+    async def incr(self, key: str):
+        if not self.client:
+            return
+        try:
+            await self.client.incr(key)
+        except redis.RedisError:
+            pass
+
+    @staticmethod
+    def _record_lookup(key: str, data):
+        # The key prefix names the cache (analytics, user, trading212) for the hit/miss metrics
+        cache_requests.inc(cache=key.split(":")[0], result="hit" if data else "miss")
+
     async def close(self):
         if self.client:
             await self.client.aclose()
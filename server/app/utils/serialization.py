@@ -0,0 +1,78 @@
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Iterable, List, Optional, Sequence
+from uuid import UUID
+
+import orjson
+from fastapi.responses import JSONResponse
+
+from app.schemas.category_schemas import CategoryResponse
+from app.schemas.response_schemas import PaginationMeta, ResponseMeta
+from app.schemas.transaction_schemas import TransactionResponse
+from app.utils.date_utils import format_period_name
+
+# Columns projected for TransactionWithCategory, in response field order
+TRANSACTION_ROW_FIELDS = list(TransactionResponse.model_fields)
+CATEGORY_ROW_FIELDS = list(CategoryResponse.model_fields)
+
+
+def _isoformat(value: datetime) -> str:
+    # Pydantic writes UTC as "Z" rather than "+00:00"
+    text = value.isoformat()
+    return text[:-6] + "Z" if text.endswith("+00:00") else text
+
+
+def _default(value: Any):
+    """Encode the types Pydantic would, the same way it does in JSON mode"""
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return _isoformat(value)
+    if isinstance(value, (date, UUID)):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=_default, option=orjson.OPT_UTC_Z)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response for content that is already plain data, encoded with orjson"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def transaction_rows_content(rows: Iterable[Sequence]) -> List[dict]:
+    """Shape TransactionService.get_transaction_rows rows like TransactionWithCategory, without validation"""
+    transaction_count = len(TRANSACTION_ROW_FIELDS)
+    category_end = transaction_count + len(CATEGORY_ROW_FIELDS)
+    items = []
+    for row in rows:
+        item = dict(zip(TRANSACTION_ROW_FIELDS, row[:transaction_count]))
+        item["category"] = dict(zip(CATEGORY_ROW_FIELDS, row[transaction_count:category_end]))
+        period_started_at = row[category_end]
+        item["period_name"] = format_period_name(period_started_at) if period_started_at else None
+        items.append(item)
+    return items
+
+
+def paginated_content(
+    items: List[Any],
+    page: int,
+    limit: int,
+    total: int,
+    message: Optional[str] = None,
+    next_cursor: Optional[str] = None,
+) -> dict:
+    """Plain-data equivalent of PaginatedApiResponse.create, for FastJSONResponse"""
+    meta = ResponseMeta(
+        pagination=PaginationMeta.create(page=page, limit=limit, total=total),
+        message=message,
+        next_cursor=next_cursor,
+    )
+    return {"result": items, "meta": meta.model_dump()}
@@ -1,31 +1,132 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Optional, Set
+
 import httpx
-from typing import Optional
+
 from app.config import settings
 from app.utils.redis import redis_service
 
-url = "https://live.trading212.com/api/v0/equity/account/cash"
+logger = logging.getLogger(__name__)
 
-payload = {}
+BASE_URL = "https://live.trading212.com/api/v0"
+ACCOUNT_CASH_PATH = "/equity/account/cash"
 
+# Data younger than FRESH_SECONDS is served as is; older data is served while a refresh runs
+# in the background, until it is STALE_SECONDS old and dropped from Redis
+FRESH_SECONDS = 120
+STALE_SECONDS = 3600
 
-async def get_trading_212_account_data(user_id: str) -> dict:
-    cache_key = f"trading212:account_data:{user_id}"
-
-    # Try cache first
-    cached_data = await redis_service.get(cache_key)
-    if cached_data:
-        return cached_data
-
-    async with httpx.AsyncClient() as client:
-        headers = {
-            "Accept": "application/json",
-            "Authorization": settings.TRADING212_API_KEY,
-        }
-        response = await client.get(url, headers=headers)
-        if response.status_code == 200:
+TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=10, keepalive_expiry=60)
+
+
+class CircuitBreaker:
+    """Stop calling an upstream after repeated failures, then let a single trial call through after a cooldown"""
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "half_open":
+            # Let one call through; it re-opens the breaker if it fails too
+            self.opened_at = time.monotonic()
+            return True
+        return state == "closed"
+
+    def record_success(self):
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+class Trading212Client:
+    """Shared Trading212 client: one pooled httpx client, single-flight fetches and stale-while-revalidate caching"""
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+        self.breaker = CircuitBreaker()
+
+    async def start(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(base_url=BASE_URL, timeout=TIMEOUT, limits=LIMITS)
+
+    async def close(self):
+        for task in list(self._background):
+            task.cancel()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def get_account_data(self, user_id: str) -> dict:
+        cache_key = f"trading212:account:{user_id}"
+
+        cached = await redis_service.get(cache_key)
+        if cached:
+            if time.time() - cached["fetched_at"] >= FRESH_SECONDS:
+                self._refresh_in_background(cache_key)
+            return cached["data"]
+
+        return await self._fetch_once(cache_key)
+
+    def _refresh_in_background(self, cache_key: str):
+        if cache_key in self._inflight:
+            return
+        task = asyncio.create_task(self._fetch_once(cache_key))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _fetch_once(self, cache_key: str) -> dict:
+        """Coalesce concurrent fetches for the same key into one upstream call"""
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(cache_key))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        # Shielded so a cancelled caller does not cancel the fetch others are waiting on
+        return await asyncio.shield(task)
+
+    async def _fetch(self, cache_key: str) -> dict:
+        if not self.breaker.allow():
+            return {}
+
+        await self.start()
+        headers = {"Accept": "application/json", "Authorization": settings.TRADING212_API_KEY}
+        try:
+            response = await self._client.get(ACCOUNT_CASH_PATH, headers=headers)
+            response.raise_for_status()
             data = response.json()
-            # Cache for 2 minutes
-            await redis_service.setex(cache_key, 120, data)
-            return data
-        else:
+        except (httpx.HTTPError, ValueError) as e:
+            self.breaker.record_failure()
+            logger.warning("Trading212 request failed (%s), circuit %s", type(e).__name__, self.breaker.state)
             return {}
+
+        self.breaker.record_success()
+        await redis_service.setex(cache_key, STALE_SECONDS, {"data": data, "fetched_at": time.time()})
+        return data
+
+
+trading212_client = Trading212Client()
+
+
+async def get_trading_212_account_data(user_id: str) -> dict:
+    return await trading212_client.get_account_data(user_id)
@@ -0,0 +1,98 @@
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import DateTime
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.models.user_models import User
+from app.utils.redis import redis_service
+
+# The in-process tier is not invalidated by writes handled in other workers, so it is kept short;
+# Redis is shared and invalidated on every write, so it can hold entries longer
+LOCAL_TTL_SECONDS = 30
+LOCAL_MAX_ENTRIES = 1024
+REDIS_TTL_SECONDS = 600
+
+
+class TTLCache:
+    """Small LRU cache whose entries also expire after a fixed number of seconds"""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: str):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+local_user_cache = TTLCache(LOCAL_TTL_SECONDS, LOCAL_MAX_ENTRIES)
+
+
+def _redis_key(user_id) -> str:
+    return f"user:{user_id}"
+
+
+def _to_fields(user: User) -> Dict[str, Any]:
+    return {column.key: getattr(user, column.key) for column in User.__table__.columns}
+
+
+def _from_fields(fields: Dict[str, Any]) -> User:
+    """Build a detached User, restoring the types JSON flattened to strings"""
+    values = {}
+    for column in User.__table__.columns:
+        value = fields.get(column.key)
+        if isinstance(value, str) and isinstance(column.type, UUID):
+            value = uuid.UUID(value)
+        elif isinstance(value, str) and isinstance(column.type, DateTime):
+            value = datetime.fromisoformat(value)
+        values[column.key] = value
+    return User(**values)
+
+
+async def get_cached_user(user_id) -> Optional[User]:
+    """Look the user up in the in-process cache, then Redis; None when neither has it"""
+    key = str(user_id)
+    fields = local_user_cache.get(key)
+    if fields is None:
+        fields = await redis_service.get(_redis_key(key))
+        if fields is None:
+            return None
+        local_user_cache.set(key, fields)
+    # A fresh instance per request, so handlers never share or mutate a cached object
+    return _from_fields(fields)
+
+
+async def cache_user(user: User):
+    fields = _to_fields(user)
+    local_user_cache.set(str(user.id), fields)
+    await redis_service.setex(_redis_key(user.id), REDIS_TTL_SECONDS, fields)
+
+
+async def invalidate_cached_user(user_id):
+    """Drop the user from both tiers; call after committing a write to the users row"""
+    local_user_cache.pop(str(user_id))
+    await redis_service.delete(_redis_key(user_id))
@@ -0,0 +1,140 @@
+"""Background worker: runs queued jobs and schedules the periodic ones.
+
+Run with `python -m app.worker`. Several workers can share one Redis: jobs are leased, retried with
+backoff and de-duplicated, and every handler is idempotent, so a job running twice does no harm.
+"""
+
+import asyncio
+import logging
+import signal
+import time
+from typing import Awaitable, Callable, Dict
+from uuid import UUID
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.services.budget_service import BudgetService
+from app.services.recurring_transaction_service import RecurringTransactionService
+from app.utils.job_queue import JobQueue, job_queue
+from app.utils.redis import redis_service
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[..., Awaitable[object]]
+HANDLERS: Dict[str, JobHandler] = {}
+
+
+def handler(name: str):
+    """Register a coroutine as the handler of a job name; it is called with the job's args"""
+
+    def register(func: JobHandler) -> JobHandler:
+        HANDLERS[name] = func
+        return func
+
+    return register
+
+
+@handler("materialize_recurring_transactions")
+async def materialize_recurring_transactions():
+    async with AsyncSessionLocal() as db:
+        return await RecurringTransactionService(db).materialize_due(batch_size=settings.RECURRING_BATCH_SIZE)
+
+
+@handler("roll_over_periods")
+async def roll_over_periods():
+    async with AsyncSessionLocal() as db:
+        return await BudgetService(db).roll_over_due_periods(batch_size=settings.RECURRING_BATCH_SIZE)
+
+
+@handler("rebuild_period_chain")
+async def rebuild_period_chain(user_id: str, period_ids: list = None):
+    async with AsyncSessionLocal() as db:
+        ids = [UUID(period_id) for period_id in period_ids] if period_ids is not None else None
+        periods = await BudgetService(db).rebuild_period_chain(UUID(user_id), ids)
+        return len(periods)
+
+
+# Job name -> seconds between runs, enqueued by the scheduler
+SCHEDULE = {
+    "materialize_recurring_transactions": settings.JOB_SCHEDULE_INTERVAL,
+    "roll_over_periods": settings.JOB_SCHEDULE_INTERVAL,
+}
+
+
+class Worker:
+    def __init__(self, queue: JobQueue = job_queue, concurrency: int = None):
+        self.queue = queue
+        self.concurrency = concurrency or settings.JOB_WORKER_CONCURRENCY
+        self.stopping = asyncio.Event()
+
+    def stop(self):
+        logger.info("Stopping worker, waiting for running jobs to finish")
+        self.stopping.set()
+
+    async def run_job(self, job, payload: str):
+        func = HANDLERS.get(job.name)
+        started = time.perf_counter()
+        try:
+            if func is None:
+                raise ValueError(f"No handler registered for job {job.name}")
+            result = await func(**job.args)
+        except Exception as e:
+            logger.exception("Job %s (%s) failed", job.name, job.id)
+            await self.queue.retry(job, payload, repr(e))
+            return
+        await self.queue.ack(payload)
+        logger.info("Job %s (%s) done in %.2fs: %s", job.name, job.id, time.perf_counter() - started, result)
+
+    async def consume(self):
+        """Run jobs one at a time until stopped, idling for JOB_POLL_INTERVAL while the queue is empty"""
+        while not self.stopping.is_set():
+            try:
+                reserved = await self.queue.reserve()
+            except Exception:
+                logger.exception("Could not reserve a job")
+                reserved = None
+            if reserved is None:
+                await self._sleep(settings.JOB_POLL_INTERVAL)
+                continue
+            await self.run_job(*reserved)
+
+    async def schedule(self):
+        """Re-queue due retries and expired leases, and enqueue each periodic job once per interval across workers"""
+        while not self.stopping.is_set():
+            try:
+                await self.queue.promote_due()
+                now = time.time()
+                for name, interval in SCHEDULE.items():
+                    bucket = int(now // interval)
+                    await self.queue.enqueue(name, unique_key=f"{name}:{bucket}", unique_for=interval)
+            except Exception:
+                logger.exception("Scheduler run failed")
+            await self._sleep(settings.JOB_POLL_INTERVAL)
+
+    async def run(self):
+        if self.queue.client is None:
+            raise SystemExit("REDIS_URL is not set, the worker needs Redis")
+        logger.info("Worker started with %d consumers", self.concurrency)
+        await asyncio.gather(self.schedule(), *(self.consume() for _ in range(self.concurrency)))
+
+    async def _sleep(self, seconds: float):
+        try:
+            await asyncio.wait_for(self.stopping.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def main():
+    worker = Worker()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, worker.stop)
+    try:
+        await worker.run()
+    finally:
+        await redis_service.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    asyncio.run(main())
@@ -0,0 +1,103 @@
+"""Compare CPU time of the Pydantic and fast serialization paths for a page of transactions.
+
+Usage: python -m scripts.benchmark_serialization [--rows 100] [--iterations 500]
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from app.models import BudgetPeriod, Category, Transaction
+from app.schemas import PaginatedApiResponse
+from app.schemas.transaction_schemas import TransactionWithCategory
+from app.utils.serialization import (
+    CATEGORY_ROW_FIELDS,
+    TRANSACTION_ROW_FIELDS,
+    dumps,
+    paginated_content,
+    transaction_rows_content,
+)
+
+
+def build_page(rows: int):
+    """A page of transactions as ORM objects, and as the rows get_transaction_rows would select"""
+    user_id = uuid4()
+    now = datetime.now(timezone.utc)
+    categories = [
+        Category(
+            id=uuid4(), user_id=user_id, name=f"Category {index}", type="expense", color="#336699",
+            icon="cart", is_default=False, created_at=now,
+        )
+        for index in range(8)
+    ]
+    periods = [
+        BudgetPeriod(id=uuid4(), user_id=user_id, started_at=now - timedelta(days=30 * index)) for index in range(2)
+    ]
+
+    transactions = []
+    for index in range(rows):
+        category, period = random.choice(categories), random.choice(periods)
+        transactions.append(
+            Transaction(
+                id=uuid4(), user_id=user_id, budget_period_id=period.id, category_id=category.id,
+                amount=Decimal(random.randint(100, 100000)) / 100, description=f"Transaction {index}",
+                type="expense", payment_method="card", tags=["groceries"], is_recurring=False,
+                recurring_frequency=None, receipt_url=None, transacted_at=now - timedelta(hours=index),
+                created_at=now, updated_at=None, category=category, budget_period=period,
+            )
+        )
+
+    page_rows = [
+        (
+            *(getattr(transaction, field) for field in TRANSACTION_ROW_FIELDS),
+            *(getattr(transaction.category, field) for field in CATEGORY_ROW_FIELDS),
+            transaction.budget_period.started_at,
+        )
+        for transaction in transactions
+    ]
+    return transactions, page_rows
+
+
+def pydantic_path(transactions):
+    response = PaginatedApiResponse[TransactionWithCategory].create(
+        items=transactions, page=1, limit=len(transactions), total=len(transactions) * 10
+    )
+    return response.model_dump_json().encode()
+
+
+def fast_path(rows):
+    content = paginated_content(
+        transaction_rows_content(rows), page=1, limit=len(rows), total=len(rows) * 10
+    )
+    return dumps(content)
+
+
+def measure(name: str, serialize, page, iterations: int) -> float:
+    serialize(page)  # Warm up caches before timing
+    started = time.process_time()
+    for _ in range(iterations):
+        serialize(page)
+    per_page = (time.process_time() - started) / iterations * 1000
+    print(f"{name:<36} {per_page:8.3f} ms CPU per page")
+    return per_page
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100, help="Transactions per page")
+    parser.add_argument("--iterations", type=int, default=500, help="Pages serialized per path")
+    args = parser.parse_args()
+
+    transactions, rows = build_page(args.rows)
+    print(f"{args.rows} rows per page, {args.iterations} iterations")
+    baseline = measure("pydantic (TransactionWithCategory)", pydantic_path, transactions, args.iterations)
+
+    fast = measure("fast path (orjson)", fast_path, rows, args.iterations)
+    print(f"  {baseline / fast:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
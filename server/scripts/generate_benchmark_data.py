@@ -0,0 +1,172 @@
+"""Generate synthetic users, periods and transactions at scale for benchmarks.
+
+Rows are built in memory and written with chunked multi-row INSERTs; period totals and rollups are then
+derived set-based, so millions of transactions take minutes rather than hours. Benchmark users have
+@bench.local emails, which --reset uses to remove them.
+
+Usage: python -m scripts.generate_benchmark_data --users 50 --years 3 [--transactions-per-month 80] [--reset]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import delete, insert, update
+from sqlalchemy.orm import aliased
+
+from app.database import AsyncSessionLocal
+from app.models import BudgetPeriod, Category, Transaction, User
+from app.services.budget_service import BudgetService
+from app.services.rollup_service import RollupService
+
+BENCH_EMAIL_DOMAIN = "bench.local"
+INSERT_CHUNK_SIZE = 5000
+
+# type -> (category names, amount range, share of a month's transactions)
+CATEGORY_MIX = {
+    "expense": (["Groceries", "Rent", "Transport", "Dining", "Utilities", "Shopping"], (5, 250), 0.85),
+    "saving": (["Emergency Fund", "Holiday"], (50, 400), 0.07),
+    "investment": (["Index Funds"], (100, 800), 0.05),
+    "adjustment": (["Adjustment"], (1, 50), 0.03),
+}
+PAYMENT_METHODS = ["card", "bank_transfer", "cash", "direct_debit"]
+
+
+def build_user(index: int, years: int, transactions_per_month: int, rng: random.Random):
+    """Build one user's rows: categories, a monthly period chain ending in an open period, and transactions"""
+    user = {
+        "id": uuid4(),
+        "email": f"bench-{index}-{uuid4().hex[:8]}@{BENCH_EMAIL_DOMAIN}",
+        "name": f"Benchmark User {index}",
+        "oauth_provider": "benchmark",
+        "oauth_id": f"bench-{index}",
+        "salary_day": 1,
+    }
+
+    categories = {"income": [{"id": uuid4(), "user_id": user["id"], "name": "Salary", "type": "income"}]}
+    for transaction_type, (names, _, _) in CATEGORY_MIX.items():
+        categories[transaction_type] = [
+            {"id": uuid4(), "user_id": user["id"], "name": name, "type": transaction_type} for name in names
+        ]
+
+    this_month = datetime.now(timezone.utc).replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+    months = years * 12
+    periods = []
+    for offset in range(months, -1, -1):
+        started_at = this_month - relativedelta(months=offset)
+        periods.append(
+            {
+                "id": uuid4(),
+                "user_id": user["id"],
+                "started_at": started_at,
+                "ended_at": None if offset == 0 else started_at + relativedelta(months=1) - timedelta(seconds=1),
+                "status": "active" if offset == 0 else "completed",
+                "brought_forward": Decimal("0"),
+            }
+        )
+    for previous, following in zip(periods, periods[1:]):
+        following["previous_period_id"] = previous["id"]
+
+    types = list(CATEGORY_MIX)
+    weights = [share for _, _, share in CATEGORY_MIX.values()]
+    transactions = []
+    for period in periods:
+        period_end = period["ended_at"] or datetime.now(timezone.utc)
+        seconds = int((period_end - period["started_at"]).total_seconds())
+        transactions.append(
+            transaction_row(user, period, categories["income"][0], Decimal(rng.randint(3500, 6500)), period["started_at"])
+        )
+        for transaction_type in rng.choices(types, weights, k=transactions_per_month - 1):
+            low, high = CATEGORY_MIX[transaction_type][1]
+            amount = -Decimal(rng.randint(low * 100, high * 100)) / 100
+            transacted_at = period["started_at"] + timedelta(seconds=rng.randrange(max(seconds, 1)))
+            category = rng.choice(categories[transaction_type])
+            transactions.append(transaction_row(user, period, category, amount, transacted_at, rng))
+
+    return user, [c for group in categories.values() for c in group], periods, transactions
+
+
+def transaction_row(user, period, category, amount, transacted_at, rng: random.Random = None) -> dict:
+    return {
+        "id": uuid4(),
+        "user_id": user["id"],
+        "budget_period_id": period["id"],
+        "category_id": category["id"],
+        "amount": amount,
+        "type": category["type"],
+        "description": category["name"],
+        "payment_method": rng.choice(PAYMENT_METHODS) if rng else "bank_transfer",
+        "transacted_at": transacted_at,
+        "is_recurring": False,
+    }
+
+
+async def insert_chunked(db, model, rows):
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        await db.execute(insert(model), rows[start : start + INSERT_CHUNK_SIZE])
+
+
+async def reset():
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(delete(User).where(User.email.like(f"%@{BENCH_EMAIL_DOMAIN}")))
+        await db.commit()
+        print(f"Removed {result.rowcount} benchmark users")
+
+
+async def generate(users: int, years: int, transactions_per_month: int, seed: int):
+    rng = random.Random(seed)
+    started = time.perf_counter()
+    total_transactions = 0
+
+    for index in range(users):
+        user, categories, periods, transactions = build_user(index, years, transactions_per_month, rng)
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(User), [user])
+            await insert_chunked(db, Category, categories)
+            # Oldest first, so each previous_period_id already exists; next links are set from them afterwards
+            await insert_chunked(db, BudgetPeriod, periods)
+            following = aliased(BudgetPeriod)
+            await db.execute(
+                update(BudgetPeriod)
+                .where(following.previous_period_id == BudgetPeriod.id, BudgetPeriod.user_id == user["id"])
+                .values(next_period_id=following.id)
+            )
+            await insert_chunked(db, Transaction, transactions)
+            await db.commit()
+
+            # Derive totals, carry forward and rollups from the inserted transactions
+            await BudgetService(db).rebuild_period_chain(user["id"])
+            await RollupService(db).rebuild_user_rollups(user["id"])
+
+        total_transactions += len(transactions)
+        print(f"User {index + 1}/{users}: {len(periods)} periods, {len(transactions)} transactions")
+
+    elapsed = time.perf_counter() - started
+    print(f"Generated {total_transactions} transactions in {elapsed:.1f}s ({total_transactions / elapsed:.0f}/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--years", type=int, default=2)
+    parser.add_argument("--transactions-per-month", type=int, default=80)
+    parser.add_argument("--seed", type=int, default=42, help="Random seed, for repeatable amounts and dates")
+    parser.add_argument("--reset", action="store_true", help="Remove existing benchmark users first")
+    args = parser.parse_args()
+
+    async def run():
+        if args.reset:
+            await reset()
+        if args.users:
+            await generate(args.users, args.years, args.transactions_per_month, args.seed)
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
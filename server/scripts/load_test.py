@@ -0,0 +1,220 @@
+"""Drive the API with a repeatable mix of requests and report throughput and latency percentiles.
+
+Runs against the benchmark users from scripts.generate_benchmark_data, authenticating with real access
+tokens. Without --base-url requests go to the app in process; with it, to a running server sharing the
+same database and SECRET_KEY. --output appends the report as a JSON line, for comparing releases.
+
+Usage: python -m scripts.load_test [--duration 30] [--concurrency 10] [--base-url http://localhost:8000]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from uuid import UUID
+
+import httpx
+from sqlalchemy import select
+
+from app.auth.jwt import create_access_token
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import BudgetPeriod, Category, User
+from scripts.generate_benchmark_data import BENCH_EMAIL_DOMAIN
+
+# Scenario -> relative weight in the request mix
+SCENARIOS = {
+    "dashboard": 4,
+    "transaction_listing": 4,
+    "bulk_create": 1,
+    "period_rebuild": 1,
+}
+BULK_CREATE_SIZE = 20
+
+
+@dataclass
+class BenchUser:
+    id: UUID
+    token: str
+    expense_category_ids: List[UUID]
+    period_ids: List[UUID]
+
+
+@dataclass
+class ScenarioStats:
+    latencies: List[float] = field(default_factory=list)
+    errors: int = 0
+
+    def report(self, elapsed: float) -> dict:
+        latencies = sorted(self.latencies)
+        return {
+            "requests": len(latencies),
+            "errors": self.errors,
+            "throughput_rps": round(len(latencies) / elapsed, 2),
+            "p50_ms": percentile(latencies, 50),
+            "p95_ms": percentile(latencies, 95),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": round(latencies[-1] * 1000, 2) if latencies else None,
+        }
+
+
+def percentile(sorted_values: List[float], percent: float) -> Optional[float]:
+    """Nearest-rank percentile, in milliseconds"""
+    if not sorted_values:
+        return None
+    rank = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+    return round(sorted_values[rank] * 1000, 2)
+
+
+async def load_users(limit: int) -> List[BenchUser]:
+    async with AsyncSessionLocal() as db:
+        users = (
+            await db.execute(
+                select(User.id).where(User.email.like(f"%@{BENCH_EMAIL_DOMAIN}")).order_by(User.email).limit(limit)
+            )
+        ).scalars().all()
+        bench_users = []
+        for user_id in users:
+            categories = await db.execute(
+                select(Category.id).where(Category.user_id == user_id, Category.type == "expense")
+            )
+            periods = await db.execute(
+                select(BudgetPeriod.id).where(BudgetPeriod.user_id == user_id).order_by(BudgetPeriod.started_at)
+            )
+            bench_users.append(
+                BenchUser(
+                    id=user_id,
+                    token=create_access_token({"sub": str(user_id)}),
+                    expense_category_ids=categories.scalars().all(),
+                    period_ids=periods.scalars().all(),
+                )
+            )
+    return bench_users
+
+
+def build_request(scenario: str, user: BenchUser, rng: random.Random) -> dict:
+    """Method, URL and body of one request of a scenario"""
+    if scenario == "dashboard":
+        return {"method": "GET", "url": "/api/v1/analytics/dashboard"}
+    if scenario == "transaction_listing":
+        return {"method": "GET", "url": "/api/v1/transactions/", "params": {"page": rng.randint(1, 5), "limit": 100}}
+    if scenario == "bulk_create":
+        now = datetime.now(timezone.utc)
+        body = [
+            {
+                "amount": str(rng.randint(100, 10000) / 100),
+                "transacted_at": (now - timedelta(days=rng.randint(0, 27))).isoformat(),
+                "type": "expense",
+                "category_id": str(rng.choice(user.expense_category_ids)),
+                "description": "Load test",
+            }
+            for _ in range(BULK_CREATE_SIZE)
+        ]
+        return {"method": "POST", "url": "/api/v1/transactions/bulk", "json": body}
+    if scenario == "period_rebuild":
+        body = {"period_ids": [str(period_id) for period_id in user.period_ids]}
+        return {"method": "POST", "url": "/api/v1/periods/rebuild", "json": body}
+    raise ValueError(f"Unknown scenario: {scenario}")
+
+
+async def worker(client, users, deadline, stats: Dict[str, ScenarioStats], rng: random.Random):
+    names, weights = list(SCENARIOS), list(SCENARIOS.values())
+    while time.perf_counter() < deadline:
+        scenario = rng.choices(names, weights)[0]
+        user = rng.choice(users)
+        request = build_request(scenario, user, rng)
+        started = time.perf_counter()
+        try:
+            response = await client.request(**request, headers={"Authorization": f"Bearer {user.token}"})
+            failed = response.status_code >= 400
+        except httpx.HTTPError:
+            failed = True
+        elapsed = time.perf_counter() - started
+        if failed:
+            stats[scenario].errors += 1
+        else:
+            stats[scenario].latencies.append(elapsed)
+
+
+async def run(args) -> dict:
+    users = await load_users(args.users)
+    if not users:
+        raise SystemExit("No benchmark users found, run python -m scripts.generate_benchmark_data first")
+
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=30)
+    else:
+        from app.main import app
+
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://loadtest", timeout=30)
+
+    stats = {scenario: ScenarioStats() for scenario in SCENARIOS}
+    async with client:
+        # Warm up connections and caches outside the measured window
+        warmup_deadline = time.perf_counter() + args.warmup
+        warmup_stats = {scenario: ScenarioStats() for scenario in SCENARIOS}
+        await asyncio.gather(
+            *(worker(client, users, warmup_deadline, warmup_stats, random.Random(i)) for i in range(args.concurrency))
+        )
+
+        started_at = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(worker(client, users, deadline, stats, random.Random(args.seed + i)) for i in range(args.concurrency))
+        )
+        elapsed = time.perf_counter() - started
+
+    total = ScenarioStats(
+        latencies=[latency for s in stats.values() for latency in s.latencies],
+        errors=sum(s.errors for s in stats.values()),
+    )
+    return {
+        "started_at": started_at.isoformat(),
+        "app_version": settings.APP_VERSION,
+        "target": args.base_url or "in-process",
+        "concurrency": args.concurrency,
+        "duration_s": round(elapsed, 2),
+        "users": len(users),
+        "scenarios": {scenario: s.report(elapsed) for scenario, s in stats.items()},
+        "total": total.report(elapsed),
+    }
+
+
+def print_report(report: dict):
+    print(
+        f"{report['target']}: {report['concurrency']} workers, {report['duration_s']}s, "
+        f"{report['users']} users, version {report['app_version']}"
+    )
+    print(f"{'scenario':<22}{'requests':>10}{'errors':>8}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for name, row in [*report["scenarios"].items(), ("total", report["total"])]:
+        print(
+            f"{name:<22}{row['requests']:>10}{row['errors']:>8}{row['throughput_rps']:>10}"
+            f"{row['p50_ms'] or '-':>10}{row['p95_ms'] or '-':>10}{row['p99_ms'] or '-':>10}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=30, help="Measured seconds")
+    parser.add_argument("--warmup", type=float, default=3, help="Unmeasured seconds before the run")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent workers")
+    parser.add_argument("--users", type=int, default=50, help="Benchmark users to spread requests over")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--base-url", help="Target a running server instead of the app in process")
+    parser.add_argument("--output", help="Append the report to this file as a JSON line")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print_report(report)
+    if args.output:
+        with open(args.output, "a") as output:
+            output.write(json.dumps(report) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ from app.models.transaction_models import Transaction
 from app.models.budget_period_models import BudgetPeriod
 from app.models.financial_goal_models import FinancialGoal
 from app.services.budget_service import BudgetService
+from app.services.rollup_service import RollupService
 import random
 from scripts.init_database import create_default_categories
 
@@ -140,6 +141,9 @@ async def create_sample_transactions(user_id, db: AsyncSession):
     for period_id in period_ids:
         await budget_service.recalculate_period_totals(period_id)
 
+    # Build the analytics rollups for the inserted transactions
+    await RollupService(db).rebuild_user_rollups(user_id)
+
     print(f"Created {len(transactions)} sample transactions")
 
 
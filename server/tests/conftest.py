@@ -0,0 +1,65 @@
+import os
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+
+from app.database import Base
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest.fixture
+def assert_max_queries():
+    """Context manager failing the test when the wrapped block runs more SQL statements than allowed.
+
+    Usage: ``with assert_max_queries(engine, 3) as statements: ...``
+    """
+
+    @contextmanager
+    def check(engine: AsyncEngine, limit: int) -> Iterator[List[str]]:
+        statements: List[str] = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+        assert len(statements) <= limit, f"{len(statements)} SQL statements, budget {limit}:\n\n" + "\n\n".join(
+            statements
+        )
+
+    return check
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def test_engine():
+    """Engine on TEST_DATABASE_URL with freshly created tables, shared by the cases of one module"""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture(scope="module")
+def no_redis_cache():
+    """Run without Redis so every call reaches the database"""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("app.utils.redis.redis_service.client", None)
+        yield
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def sessions(test_engine, no_redis_cache):
+    return async_sessionmaker(test_engine, expire_on_commit=False)
@@ -0,0 +1,259 @@
+"""Background job handlers and the Redis job queue.
+
+The database cases need TEST_DATABASE_URL (a disposable database, its tables are dropped and recreated) and
+the queue cases TEST_REDIS_URL (a disposable Redis, the jobs:* keys are cleared).
+"""
+
+import os
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+import redis.asyncio as redis
+from sqlalchemy import func, select
+
+from app.models import BudgetPeriod, Category, RecurringTransaction, Transaction, User
+from app.services.budget_service import BudgetService
+from app.services.recurring_transaction_service import RecurringTransactionService, next_occurrence
+from app.utils.date_utils import latest_salary_date
+from app.utils.job_queue import DEAD_KEY, DELAYED_KEY, QUEUE_KEY, JobQueue
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+TEST_REDIS_URL = os.getenv("TEST_REDIS_URL")
+
+needs_database = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+needs_redis = pytest.mark.skipif(not TEST_REDIS_URL, reason="TEST_REDIS_URL is not set")
+
+
+@pytest.mark.parametrize(
+    "start_date, due_date, frequency, expected",
+    [
+        (date(2026, 1, 5), date(2026, 1, 5), "daily", date(2026, 1, 6)),
+        (date(2026, 1, 5), date(2026, 1, 5), "weekly", date(2026, 1, 12)),
+        # Month ends clamp without drifting: the 31st stays the 31st after February
+        (date(2026, 1, 31), date(2026, 1, 31), "monthly", date(2026, 2, 28)),
+        (date(2026, 1, 31), date(2026, 2, 28), "monthly", date(2026, 3, 31)),
+        (date(2024, 2, 29), date(2024, 2, 29), "yearly", date(2025, 2, 28)),
+        (date(2024, 2, 29), date(2027, 2, 28), "yearly", date(2028, 2, 29)),
+    ],
+)
+def test_next_occurrence(start_date, due_date, frequency, expected):
+    assert next_occurrence(start_date, due_date, frequency) == expected
+
+
+def test_next_occurrence_rejects_unknown_frequency():
+    with pytest.raises(ValueError):
+        next_occurrence(date(2026, 1, 1), date(2026, 1, 1), "fortnightly")
+
+
+@pytest.mark.parametrize(
+    "salary_day, today, expected",
+    [
+        (25, date(2026, 10, 17), date(2026, 9, 25)),
+        (1, date(2026, 10, 1), date(2026, 10, 1)),
+        (31, date(2026, 2, 28), date(2026, 2, 28)),
+        (31, date(2026, 3, 5), date(2026, 2, 28)),
+    ],
+)
+def test_latest_salary_date(salary_day, today, expected):
+    assert latest_salary_date(salary_day, today) == expected
+
+
+async def create_user(session, salary_day: int = 1):
+    user = User(
+        email=f"{uuid4()}@example.com", name="Jobs Test", oauth_provider="google", oauth_id="jobs", salary_day=salary_day
+    )
+    session.add(user)
+    await session.flush()
+    category = Category(user_id=user.id, name="Rent", type="expense")
+    session.add(category)
+    await session.flush()
+    return user, category
+
+
+@needs_database
+@pytest.mark.asyncio(loop_scope="module")
+async def test_materialize_due_catches_up_once(sessions):
+    async with sessions() as session:
+        user, category = await create_user(session)
+        session.add(
+            BudgetPeriod(user_id=user.id, started_at=datetime(2026, 1, 1, tzinfo=timezone.utc), status="active")
+        )
+        session.add(
+            RecurringTransaction(
+                user_id=user.id,
+                category_id=category.id,
+                amount=Decimal("950.00"),
+                description="Rent",
+                type="expense",
+                frequency="monthly",
+                start_date=date(2026, 1, 31),
+                next_due_date=date(2026, 1, 31),
+            )
+        )
+        await session.commit()
+
+    for _ in range(2):
+        async with sessions() as session:
+            await RecurringTransactionService(session).materialize_due(today=date(2026, 4, 15))
+
+    async with sessions() as session:
+        transactions = (
+            await session.scalars(
+                select(Transaction).where(Transaction.user_id == user.id).order_by(Transaction.transacted_at)
+            )
+        ).all()
+        schedule = await session.scalar(select(RecurringTransaction).where(RecurringTransaction.user_id == user.id))
+        period = await session.scalar(select(BudgetPeriod).where(BudgetPeriod.user_id == user.id))
+
+    assert [transaction.transacted_at.date() for transaction in transactions] == [
+        date(2026, 1, 31),
+        date(2026, 2, 28),
+        date(2026, 3, 31),
+    ]
+    assert all(transaction.amount == Decimal("-950.00") and transaction.is_recurring for transaction in transactions)
+    assert schedule.next_due_date == date(2026, 4, 30)
+    assert period.total_expenses == Decimal("-2850.00")
+
+
+@needs_database
+@pytest.mark.asyncio(loop_scope="module")
+async def test_roll_over_due_periods_moves_later_transactions(sessions):
+    async with sessions() as session:
+        user, category = await create_user(session, salary_day=25)
+        income = Category(user_id=user.id, name="Salary", type="income")
+        session.add(income)
+        period = BudgetPeriod(
+            user_id=user.id, started_at=datetime(2026, 8, 25, tzinfo=timezone.utc), status="active"
+        )
+        session.add(period)
+        await session.flush()
+        for category_id, transaction_type, amount, day in (
+            (income.id, "income", Decimal("3000.00"), datetime(2026, 8, 25, tzinfo=timezone.utc)),
+            (category.id, "expense", Decimal("-1000.00"), datetime(2026, 9, 1, tzinfo=timezone.utc)),
+            (category.id, "expense", Decimal("-200.00"), datetime(2026, 9, 30, tzinfo=timezone.utc)),
+        ):
+            session.add(
+                Transaction(
+                    user_id=user.id,
+                    budget_period_id=period.id,
+                    category_id=category_id,
+                    type=transaction_type,
+                    amount=amount,
+                    transacted_at=day,
+                )
+            )
+        await session.commit()
+        await BudgetService(session).rebuild_period_chain(user.id)
+
+    for _ in range(2):
+        async with sessions() as session:
+            await BudgetService(session).roll_over_due_periods(today=date(2026, 10, 17))
+
+    async with sessions() as session:
+        periods = (
+            await session.scalars(
+                select(BudgetPeriod).where(BudgetPeriod.user_id == user.id).order_by(BudgetPeriod.started_at)
+            )
+        ).all()
+        moved = await session.scalar(
+            select(func.count()).select_from(Transaction).where(Transaction.budget_period_id == periods[-1].id)
+        )
+
+    assert len(periods) == 2
+    completed, current = periods
+    assert completed.status == "completed" and completed.next_period_id == current.id
+    assert current.started_at == datetime(2026, 9, 25, tzinfo=timezone.utc)
+    assert current.status == "active" and current.ended_at is None
+    assert moved == 1
+    assert completed.total_expenses == Decimal("-1000.00")
+    assert current.total_expenses == Decimal("-200.00")
+    assert completed.carried_forward == current.brought_forward == Decimal("2000.00")
+
+
+@needs_database
+@pytest.mark.asyncio(loop_scope="module")
+async def test_project_occurrences(sessions):
+    async with sessions() as session:
+        user, category = await create_user(session)
+        income = Category(user_id=user.id, name="Salary", type="income")
+        session.add(income)
+        await session.flush()
+        for category_id, transaction_type, frequency, start_date, next_due_date, end_date in (
+            (category.id, "expense", "monthly", date(2026, 1, 31), date(2026, 2, 28), None),
+            (category.id, "expense", "weekly", date(2026, 1, 1), date(2026, 3, 5), date(2026, 3, 12)),
+            (income.id, "income", "monthly", date(2026, 1, 25), date(2026, 2, 25), None),
+        ):
+            session.add(
+                RecurringTransaction(
+                    user_id=user.id,
+                    category_id=category_id,
+                    amount=Decimal("10.00"),
+                    description=frequency,
+                    type=transaction_type,
+                    frequency=frequency,
+                    start_date=start_date,
+                    next_due_date=next_due_date,
+                    end_date=end_date,
+                )
+            )
+        await session.commit()
+
+        service = RecurringTransactionService(session)
+        projected = await service.project_occurrences(user.id, 3)
+        bills = await service.project_occurrences(user.id, 3, until=date(2026, 3, 31), include_income=False)
+
+    by_rule = {}
+    for occurrence in projected:
+        by_rule.setdefault((occurrence.type, occurrence.frequency), []).append(occurrence.due_date)
+    assert by_rule == {
+        ("expense", "monthly"): [date(2026, 2, 28), date(2026, 3, 31), date(2026, 4, 30)],
+        ("expense", "weekly"): [date(2026, 3, 5), date(2026, 3, 12)],
+        ("income", "monthly"): [date(2026, 2, 25), date(2026, 3, 25), date(2026, 4, 25)],
+    }
+    assert [bill.due_date for bill in bills] == [date(2026, 2, 28), date(2026, 3, 5), date(2026, 3, 12), date(2026, 3, 31)]
+    assert all(bill.amount == Decimal("-10.00") and bill.category_name == "Rent" for bill in bills)
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def queue():
+    client = redis.from_url(TEST_REDIS_URL, decode_responses=True)
+    await client.delete(*(await client.keys("jobs:*")) or ["jobs:queue"])
+    yield JobQueue(client)
+    await client.aclose()
+
+
+@needs_redis
+@pytest.mark.asyncio(loop_scope="module")
+async def test_job_queue_deduplicates_and_retries(queue, monkeypatch):
+    monkeypatch.setattr("app.utils.job_queue.settings.JOB_RETRY_BACKOFF", 0)
+    monkeypatch.setattr("app.utils.job_queue.settings.JOB_MAX_ATTEMPTS", 2)
+
+    assert await queue.enqueue("rebuild", {"user_id": "1"}, unique_key="rebuild:1")
+    assert await queue.enqueue("rebuild", {"user_id": "1"}, unique_key="rebuild:1") is None
+    assert await queue.client.llen(QUEUE_KEY) == 1
+
+    job, payload = await queue.reserve(lease_seconds=60)
+    assert (job.name, job.args) == ("rebuild", {"user_id": "1"})
+    await queue.retry(job, payload, "boom")
+    assert await queue.client.zcard(DELAYED_KEY) == 1
+
+    assert await queue.promote_due() == 1
+    job, payload = await queue.reserve(lease_seconds=60)
+    assert job.attempts == 1
+    await queue.retry(job, payload, "boom")
+    assert await queue.stats() == {"queued": 0, "delayed": 0, "processing": 0, "dead": 1}
+    assert await queue.client.llen(DEAD_KEY) == 1
+
+
+@needs_redis
+@pytest.mark.asyncio(loop_scope="module")
+async def test_job_queue_requeues_expired_leases(queue):
+    await queue.enqueue("roll_over_periods")
+    job, payload = await queue.reserve(lease_seconds=-1)
+
+    assert await queue.promote_due() == 1
+    requeued, _ = await queue.reserve(lease_seconds=60)
+    assert requeued.id == job.id
@@ -0,0 +1,109 @@
+"""Cash-flow forecasts. The service case needs TEST_DATABASE_URL."""
+
+import os
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import numpy as np
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from app.models import BudgetPeriod, Category, RecurringTransaction, Transaction, User
+from app.services.forecast_service import ForecastService, carry_forward, ewma_baseline
+from app.services.rollup_service import RollupService
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+@pytest.mark.parametrize(
+    "brought_forward, net",
+    [(100.0, [-150.0, 50.0, 20.0]), (0.0, [10.0, -5.0, -20.0, 40.0]), (-30.0, [10.0, 50.0]), (500.0, [])],
+)
+def test_carry_forward_matches_period_by_period(brought_forward, net):
+    expected, carried = [], brought_forward
+    for amount in net:
+        carried = max(carried + amount, 0.0)
+        expected.append(carried)
+
+    assert carry_forward(brought_forward, np.array(net)).tolist() == pytest.approx(expected)
+
+
+def test_ewma_baseline_weights_recent_months():
+    history = np.array([[-100.0, 0.0], [-100.0, 0.0], [-400.0, 30.0]])
+    baseline = ewma_baseline(history, half_life=1.0)
+
+    assert baseline[0] == pytest.approx((-100 * 0.25 - 100 * 0.5 - 400) / 1.75)
+    assert baseline[1] == pytest.approx(30 / 1.75)
+    assert ewma_baseline(np.zeros((0, 2))).tolist() == [0.0, 0.0]
+
+
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+@pytest.mark.asyncio(loop_scope="module")
+async def test_forecast_periods(sessions):
+    this_month = date.today().replace(day=1)
+    async with sessions() as session:
+        user = User(email=f"{uuid4()}@example.com", name="Forecast", oauth_provider="google", oauth_id="forecast")
+        session.add(user)
+        await session.flush()
+        rent = Category(user_id=user.id, name="Rent", type="expense")
+        groceries = Category(user_id=user.id, name="Groceries", type="expense")
+        session.add_all([rent, groceries])
+        current = BudgetPeriod(
+            user_id=user.id,
+            started_at=datetime.combine(this_month, datetime.min.time(), tzinfo=timezone.utc),
+            expected_income=Decimal("3000.00"),
+            brought_forward=Decimal("250.00"),
+            status="active",
+        )
+        session.add(current)
+        await session.flush()
+
+        # Three months of history: rent from a recurring rule, groceries by hand
+        for months_back in (1, 2, 3):
+            transacted_at = datetime.combine(
+                this_month - relativedelta(months=months_back, day=10), datetime.min.time(), tzinfo=timezone.utc
+            )
+            for category, amount in ((rent, Decimal("-1000.00")), (groceries, Decimal("-300.00"))):
+                session.add(
+                    Transaction(
+                        user_id=user.id,
+                        budget_period_id=current.id,
+                        category_id=category.id,
+                        type="expense",
+                        amount=amount,
+                        transacted_at=transacted_at,
+                    )
+                )
+        session.add(
+            RecurringTransaction(
+                user_id=user.id,
+                category_id=rent.id,
+                amount=Decimal("1000.00"),
+                description="Rent",
+                type="expense",
+                frequency="monthly",
+                start_date=this_month - relativedelta(months=3, day=10),
+                next_due_date=this_month + relativedelta(months=1, day=10),
+            )
+        )
+        await session.commit()
+        await RollupService(session).rebuild_user_rollups(user.id)
+
+        forecasts = await ForecastService(session).forecast_periods(user.id, 4)
+
+    assert [forecast.started_at.date() for forecast in forecasts] == [
+        this_month + relativedelta(months=k) for k in range(1, 5)
+    ]
+    for forecast, following in zip(forecasts, forecasts[1:]):
+        assert following.brought_forward == forecast.carried_forward
+    for forecast in forecasts:
+        categories = {category.category_name: category.amount for category in forecast.categories}
+        # Rent comes from the rule once per period rather than from the rule and its history twice
+        assert categories["Rent"] == pytest.approx(Decimal("-1000"), abs=Decimal("30"))
+        assert categories["Groceries"] == pytest.approx(Decimal("-300"), abs=Decimal("30"))
+        assert forecast.actual_income == forecast.expected_income == Decimal("3000.00")
+        assert forecast.status == "projected"
+        assert forecast.carried_forward == pytest.approx(
+            forecast.brought_forward + forecast.actual_income + forecast.total_expenses, abs=Decimal("0.02")
+        )
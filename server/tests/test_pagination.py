@@ -0,0 +1,41 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.utils.pagination import Cursor, decode_cursor, encode_cursor, filters_key
+
+
+def test_cursor_round_trip():
+    """Test that a cursor decodes back to the position it was created from"""
+    filters = filters_key(limit=50, category_id=uuid4(), period_id=None)
+    cursor = Cursor(datetime(2025, 3, 14, 9, 30, tzinfo=timezone.utc), uuid4(), page=4, total=1234, filters=filters)
+
+    token = encode_cursor(cursor)
+
+    assert "=" not in token
+    assert decode_cursor(token, filters) == cursor
+
+
+def test_cursor_is_tied_to_its_filters():
+    """Test that a cursor reused with other filters is rejected instead of carrying a wrong total"""
+    category_id = uuid4()
+    filters = filters_key(limit=50, category_id=category_id, start_date=None)
+    cursor = Cursor(datetime(2025, 3, 14, tzinfo=timezone.utc), uuid4(), page=2, total=10, filters=filters)
+    token = encode_cursor(cursor)
+
+    assert filters_key(limit=50, category_id=category_id, start_date=None) == filters
+    for other in (
+        filters_key(limit=50, category_id=uuid4(), start_date=None),
+        filters_key(limit=20, category_id=category_id, start_date=None),
+        filters_key(limit=50, category_id=category_id, start_date="2025-01-01"),
+    ):
+        with pytest.raises(ValueError, match="different filters"):
+            decode_cursor(token, other)
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "e30"])
+def test_invalid_cursor_is_rejected(token):
+    """Test that malformed cursors raise ValueError"""
+    with pytest.raises(ValueError):
+        decode_cursor(token)
@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.services.budget_service import PeriodBoundaries
+
+
+def at(month: int, day: int) -> datetime:
+    return datetime(2026, month, day, tzinfo=timezone.utc)
+
+
+def test_find_period_tolerates_overlapping_ranges():
+    """Test that a date resolves to the latest-starting period containing it, even when ranges overlap"""
+    january, overlap, open_ended = uuid4(), uuid4(), uuid4()
+    boundaries = PeriodBoundaries(
+        [(open_ended, at(3, 1), None), (january, at(1, 1), at(2, 10)), (overlap, at(1, 25), at(2, 5))]
+    )
+
+    assert boundaries.find(at(1, 10)) == january
+    assert boundaries.find(at(2, 1)) == overlap
+    assert boundaries.find(at(2, 8)) == january
+    assert boundaries.find(at(2, 20)) is None
+    assert boundaries.find(at(12, 1)) == open_ended
+
+
+def test_overlaps_checks_closed_periods():
+    """Test that overlap detection sees long earlier periods, and added periods"""
+    boundaries = PeriodBoundaries([(uuid4(), at(1, 1), at(3, 31)), (uuid4(), at(2, 1), at(2, 10))])
+
+    assert boundaries.overlaps(at(3, 15), at(4, 15))
+    assert not boundaries.overlaps(at(4, 1), at(4, 30))
+
+    boundaries.add(uuid4(), at(4, 20), at(5, 20))
+    assert boundaries.overlaps(at(4, 1), at(4, 30))
+
+
+def test_add_keeps_the_index_of_a_full_rebuild():
+    """Test that periods added one by one index the same as building from all of them at once"""
+    ranges = [
+        (uuid4(), at(5, 1), None),
+        (uuid4(), at(1, 1), at(1, 31)),
+        (uuid4(), at(3, 1), at(4, 30)),
+        (uuid4(), at(2, 1), at(6, 30)),
+        (uuid4(), at(1, 15), at(2, 5)),
+    ]
+    boundaries = PeriodBoundaries()
+    for period in ranges:
+        boundaries.add(*period)
+    rebuilt = PeriodBoundaries(ranges)
+
+    assert (boundaries._starts, boundaries._max_ends) == (rebuilt._starts, rebuilt._max_ends)
+    for month in range(1, 8):
+        assert boundaries.find(at(month, 10)) == rebuilt.find(at(month, 10))
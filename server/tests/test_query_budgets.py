@@ -0,0 +1,168 @@
+"""SQL statement budgets per endpoint.
+
+Each case calls an endpoint against a seeded PostgreSQL database and fails when it issues more statements than
+its budget, so an added N+1 or lazy load shows up as a test failure. Lower a budget when a change makes an
+endpoint cheaper.
+
+Set TEST_DATABASE_URL to a disposable database to run them - its tables are dropped and recreated.
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.database import get_db
+from app.dependencies import get_current_user
+from app.main import app
+from app.models import BudgetPeriod, Category, FinancialGoal, Transaction, User
+from app.services.rollup_service import RollupService
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = [
+    pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"),
+    pytest.mark.asyncio(loop_scope="module"),
+]
+
+# (method, path template, statement budget); {period_id} and {transaction_id} are filled from the seed
+QUERY_BUDGETS = [
+    ("GET", "/api/v1/transactions/", 2),
+    ("GET", "/api/v1/transactions/{transaction_id}", 2),
+    ("POST", "/api/v1/transactions/", 5),
+    ("GET", "/api/v1/periods/", 1),
+    ("GET", "/api/v1/periods/current", 4),
+    ("GET", "/api/v1/periods/{period_id}", 4),
+    ("GET", "/api/v1/categories/", 1),
+    ("GET", "/api/v1/goals/", 1),
+    ("GET", "/api/v1/analytics/dashboard", 2),
+    ("GET", "/api/v1/analytics/trends", 1),
+    ("GET", "/api/v1/analytics/categories", 2),
+    ("GET", "/api/v1/analytics/yearly/{year}", 2),
+    ("GET", "/api/v1/analytics/net-worth", 1),
+]
+
+
+@pytest.fixture(scope="module")
+def no_external_services():
+    """Run without Redis or Trading212 so every request reaches the database"""
+
+    async def fake_account_data(user_id):
+        return {}
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr("app.services.analytics_service.get_trading_212_account_data", fake_account_data)
+        monkeypatch.setattr("app.utils.redis.redis_service.client", None)
+        yield
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def seeded(test_engine, no_external_services):
+    engine = test_engine
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+    async with sessions() as session:
+        user = User(email=f"{uuid4()}@example.com", name="Budget Test", oauth_provider="google", oauth_id="budget")
+        session.add(user)
+        await session.flush()
+
+        categories = {}
+        for transaction_type in ("income", "expense", "saving"):
+            categories[transaction_type] = Category(user_id=user.id, name=transaction_type.title(), type=transaction_type)
+            session.add(categories[transaction_type])
+        await session.flush()
+
+        # Six consecutive monthly periods, the last one open
+        now = datetime.now(timezone.utc)
+        periods = []
+        for month in range(5, -1, -1):
+            started_at = now - timedelta(days=30 * (month + 1))
+            periods.append(
+                {
+                    "id": uuid4(),
+                    "user_id": user.id,
+                    "started_at": started_at,
+                    "ended_at": None if month == 0 else started_at + timedelta(days=30) - timedelta(seconds=1),
+                    "status": "active" if month == 0 else "completed",
+                }
+            )
+        for previous, following in zip(periods, periods[1:]):
+            following["previous_period_id"] = previous["id"]
+        await session.execute(insert(BudgetPeriod), periods)
+
+        transactions = []
+        for period in periods:
+            for day in range(20):
+                transaction_type = ("income", "expense", "saving")[day % 3]
+                amount = Decimal(10 + day)
+                transactions.append(
+                    {
+                        "id": uuid4(),
+                        "user_id": user.id,
+                        "budget_period_id": period["id"],
+                        "category_id": categories[transaction_type].id,
+                        "amount": amount if transaction_type == "income" else -amount,
+                        "transacted_at": period["started_at"] + timedelta(days=day),
+                        "type": transaction_type,
+                    }
+                )
+        await session.execute(insert(Transaction), transactions)
+        session.add(FinancialGoal(user_id=user.id, name="Holiday", target_amount=Decimal("500")))
+        await session.commit()
+        await RollupService(session).rebuild_user_rollups(user.id)
+
+    async def override_get_db():
+        async with sessions() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: user
+    yield engine, user, {
+        "period_id": periods[-2]["id"],
+        "period_ids": [period["id"] for period in periods],
+        "transaction_id": transactions[0]["id"],
+        "year": now.year,
+        "category_id": categories["expense"].id,
+    }
+    app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("method,path,budget", QUERY_BUDGETS, ids=[f"{m} {p}" for m, p, _ in QUERY_BUDGETS])
+async def test_endpoint_query_budget(seeded, assert_max_queries, method, path, budget):
+    engine, user, ids = seeded
+    body = None
+    if method == "POST":
+        body = {
+            "amount": "12.34",
+            "transacted_at": datetime.now(timezone.utc).isoformat(),
+            "type": "expense",
+            "category_id": str(ids["category_id"]),
+        }
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        with assert_max_queries(engine, budget):
+            response = await client.request(method, path.format(**ids), json=body)
+
+    assert response.status_code < 400, response.text
+
+
+async def test_rebuild_period_chain_query_budget(seeded, assert_max_queries):
+    engine, user, ids = seeded
+    period_ids = [str(period_id) for period_id in ids["period_ids"]]
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        # One aggregate read and one UPDATE whatever the length of the chain
+        with assert_max_queries(engine, 2):
+            response = await client.post("/api/v1/periods/rebuild", json={"period_ids": period_ids})
+
+    assert response.status_code == 200, response.text
+    rebuilt = {period["id"]: period for period in response.json()["result"]}
+    assert set(rebuilt) == set(period_ids)
+    # The seeded periods are chained oldest first
+    for previous_id, period_id in zip(period_ids, period_ids[1:]):
+        assert Decimal(rebuilt[period_id]["brought_forward"]) == Decimal(rebuilt[previous_id]["carried_forward"])
@@ -0,0 +1,203 @@
+"""Query-plan regression tests for the transaction, period and analytics hot paths.
+
+Each case runs a service method against a seeded PostgreSQL database, captures the SQL it issues and
+EXPLAINs every SELECT with sequential scans disabled. A hot query that can only be answered by scanning
+a whole table (a Seq Scan, or an index scan without an index condition) fails the test.
+
+Set TEST_DATABASE_URL to a disposable database to run them - its tables are dropped and recreated.
+"""
+
+import os
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import List
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import BudgetPeriod, Category, FinancialGoal, Transaction, User
+from app.services.analytics_service import AnalyticsService
+from app.services.budget_service import BudgetService
+from app.services.rollup_service import RollupService
+from app.services.transaction_service import TransactionService
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = [
+    pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set"),
+    pytest.mark.asyncio(loop_scope="module"),
+]
+
+# Tables that grow with usage and must never be scanned in full on a hot path
+HOT_TABLES = {"transactions", "budget_periods", "transaction_rollups", "financial_goals", "recurring_transactions"}
+
+TRANSACTION_TYPES = ["income", "expense", "saving", "investment", "adjustment"]
+
+
+@dataclass
+class Seed:
+    user_id: UUID
+    period_ids: List[UUID]
+    current_period_id: UUID
+
+
+async def _seed(session: AsyncSession) -> Seed:
+    """Create a few users with two years of monthly periods and transactions each"""
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    seeds = []
+
+    for _ in range(3):
+        user = User(email=f"{uuid4()}@example.com", name="Plan Test", oauth_provider="google", oauth_id="plan")
+        session.add(user)
+        await session.flush()
+
+        categories = {}
+        for transaction_type in TRANSACTION_TYPES:
+            category = Category(user_id=user.id, name=transaction_type.title(), type=transaction_type)
+            session.add(category)
+            categories[transaction_type] = category
+        await session.flush()
+
+        periods = []
+        for month in range(24, -1, -1):
+            started_at = now - timedelta(days=30 * (month + 1))
+            is_current = month == 0
+            periods.append(
+                {
+                    "id": uuid4(),
+                    "user_id": user.id,
+                    "started_at": started_at,
+                    "ended_at": None if is_current else started_at + timedelta(days=30),
+                    "status": "active" if is_current else "completed",
+                }
+            )
+        await session.execute(insert(BudgetPeriod), periods)
+
+        transactions = []
+        for period in periods:
+            for _ in range(60):
+                transaction_type = rng.choice(TRANSACTION_TYPES)
+                amount = Decimal(rng.randint(100, 100000)) / 100
+                transactions.append(
+                    {
+                        "id": uuid4(),
+                        "user_id": user.id,
+                        "budget_period_id": period["id"],
+                        "category_id": categories[transaction_type].id,
+                        "amount": amount if transaction_type == "income" else -amount,
+                        "transacted_at": period["started_at"] + timedelta(days=rng.randint(0, 29)),
+                        "type": transaction_type,
+                    }
+                )
+        await session.execute(insert(Transaction), transactions)
+
+        session.add(FinancialGoal(user_id=user.id, name="Emergency Fund", target_amount=Decimal("1000")))
+        await session.commit()
+
+        await RollupService(session).rebuild_user_rollups(user.id)
+        seeds.append(Seed(user.id, [p["id"] for p in periods], periods[-1]["id"]))
+
+    return seeds[0]
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def seeded_engine(test_engine):
+    engine = test_engine
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        seed = await _seed(session)
+
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("ANALYZE")
+
+    return engine, seed
+
+
+@pytest.fixture(autouse=True)
+def no_trading212(monkeypatch):
+    async def fake_account_data(user_id):
+        return {}
+
+    monkeypatch.setattr("app.services.analytics_service.get_trading_212_account_data", fake_account_data)
+
+
+def _full_scans(plan: dict) -> List[str]:
+    """Collect nodes that read a hot table without using an index condition"""
+    problems = []
+    relation = plan.get("Relation Name")
+    if relation in HOT_TABLES:
+        node_type = plan["Node Type"]
+        if node_type == "Seq Scan":
+            problems.append(f"Seq Scan on {relation}")
+        elif node_type in ("Index Scan", "Index Only Scan") and "Index Cond" not in plan:
+            problems.append(f"{node_type} on {relation} using {plan['Index Name']} without an index condition")
+
+    for child in plan.get("Plans", []):
+        problems.extend(_full_scans(child))
+    return problems
+
+
+HOT_PATHS = {
+    "transactions.list": lambda db, seed: TransactionService(db).get_transactions(seed.user_id),
+    "transactions.list_by_period": lambda db, seed: TransactionService(db).get_transactions(
+        seed.user_id, period_id=seed.period_ids[3]
+    ),
+    "transactions.list_after_cursor": lambda db, seed: TransactionService(db).get_transactions(
+        seed.user_id, after=(datetime.now(timezone.utc) - timedelta(days=300), uuid4())
+    ),
+    "transactions.count": lambda db, seed: TransactionService(db).count_transactions(seed.user_id),
+    "periods.list": lambda db, seed: BudgetService(db).get_budget_periods(seed.user_id),
+    "periods.current": lambda db, seed: BudgetService(db).get_current_period(seed.user_id),
+    "periods.for_date": lambda db, seed: BudgetService(db).get_or_create_period_for_date(
+        seed.user_id, datetime.now(timezone.utc) - timedelta(days=200)
+    ),
+    "periods.summary": lambda db, seed: BudgetService(db).get_period_summary(seed.period_ids[3], seed.user_id),
+    "periods.verify_totals": lambda db, seed: BudgetService(db).verify_period_totals(seed.period_ids[3]),
+    "analytics.dashboard": lambda db, seed: AnalyticsService(db).get_dashboard_summary(seed.user_id),
+    "analytics.trends": lambda db, seed: AnalyticsService(db).get_spending_trends(seed.user_id, 24),
+    "analytics.categories": lambda db, seed: AnalyticsService(db).get_category_breakdown(
+        seed.user_id, seed.period_ids[3]
+    ),
+    "analytics.net_worth": lambda db, seed: AnalyticsService(db).get_net_worth_series(seed.user_id),
+    "analytics.yearly_periods": lambda db, seed: AnalyticsService(db)._get_year_periods(
+        seed.user_id, datetime.now(timezone.utc).year
+    ),
+    "analytics.yearly_categories": lambda db, seed: AnalyticsService(db)._get_yearly_category_breakdown(
+        seed.user_id, datetime.now(timezone.utc).year
+    ),
+}
+
+
+@pytest.mark.parametrize("hot_path", HOT_PATHS)
+async def test_hot_path_queries_use_indexes(seeded_engine, hot_path):
+    engine, seed = seeded_engine
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            await HOT_PATHS[hot_path](session, seed)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    assert statements, f"{hot_path} issued no queries"
+
+    problems = []
+    async with engine.connect() as conn:
+        await conn.exec_driver_sql("SET enable_seqscan = off")
+        for statement, parameters in statements:
+            result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            plan = result.scalar()[0]["Plan"]
+            problems.extend(f"{problem}\n{statement}" for problem in _full_scans(plan))
+
+    assert not problems, "\n\n".join(problems)
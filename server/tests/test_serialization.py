@@ -0,0 +1,73 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from app.models import BudgetPeriod, Category, Transaction
+from app.schemas import PaginatedApiResponse
+from app.schemas.transaction_schemas import TransactionWithCategory
+from app.utils.serialization import (
+    CATEGORY_ROW_FIELDS,
+    TRANSACTION_ROW_FIELDS,
+    dumps,
+    paginated_content,
+    transaction_rows_content,
+)
+
+
+def make_transactions():
+    user_id = uuid4()
+    created_at = datetime(2026, 1, 2, 9, 30, 15, 123456, tzinfo=timezone.utc)
+    category = Category(
+        id=uuid4(), user_id=user_id, name="Food", type="expense", color="#ff0000", icon=None,
+        is_default=False, created_at=created_at,
+    )
+    period = BudgetPeriod(id=uuid4(), user_id=user_id, started_at=datetime(2026, 1, 25, tzinfo=timezone.utc))
+    transactions = []
+    for index, budget_period in enumerate([period, None]):
+        transactions.append(
+            Transaction(
+                id=uuid4(), user_id=user_id, budget_period_id=period.id, category_id=category.id,
+                amount=Decimal("12.30"), description=f"Lunch {index}", type="expense", payment_method="card",
+                tags=["work"] if index else None, is_recurring=False, recurring_frequency=None, receipt_url=None,
+                transacted_at=datetime(2026, 2, 1, 12, tzinfo=timezone.utc), created_at=created_at, updated_at=None,
+                category=category, budget_period=budget_period,
+            )
+        )
+    return transactions
+
+
+def as_row(transaction: Transaction) -> tuple:
+    """The row TransactionService.get_transaction_rows selects for a transaction"""
+    return (
+        *(getattr(transaction, field) for field in TRANSACTION_ROW_FIELDS),
+        *(getattr(transaction.category, field) for field in CATEGORY_ROW_FIELDS),
+        transaction.budget_period.started_at if transaction.budget_period else None,
+    )
+
+
+def test_fast_path_matches_pydantic_output():
+    """Test that projected rows encode to the same JSON as the validated Pydantic response"""
+    transactions = make_transactions()
+
+    expected = json.loads(
+        PaginatedApiResponse[TransactionWithCategory]
+        .create(items=transactions, page=2, limit=2, total=5, next_cursor="abc")
+        .model_dump_json()
+    )
+    actual = json.loads(
+        dumps(
+            paginated_content(
+                transaction_rows_content([as_row(t) for t in transactions]),
+                page=2,
+                limit=2,
+                total=5,
+                next_cursor="abc",
+            )
+        )
+    )
+
+    assert actual["result"] == expected["result"]
+    expected["meta"].pop("timestamp")
+    actual["meta"].pop("timestamp")
+    assert actual["meta"] == expected["meta"]
@@ -0,0 +1,128 @@
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from app.schemas.transaction_schemas import StatementImportResult
+from app.services.statement_import_service import DefaultCategories, StatementImportService
+
+
+async def _chunks(data: bytes, size: int):
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def _collect(records):
+    return [record async for record in records]
+
+
+@pytest.mark.asyncio
+async def test_csv_records_survive_chunk_boundaries():
+    """Test that CSV rows, quoted newlines and multi-byte characters parse the same at any chunk size"""
+    data = 'Date,Amount,Category,Description\n2024-03-01,12.50,Café,"two\nlines"\n\n2024-03-02,-3,Rent,x\n'.encode()
+
+    expected = await _collect(StatementImportService._csv_records(_chunks(data, len(data))))
+
+    assert expected == [
+        (2, {"transacted_at": "2024-03-01", "amount": "12.50", "category": "Café", "description": "two\nlines"}),
+        (5, {"transacted_at": "2024-03-02", "amount": "-3", "category": "Rent", "description": "x"}),
+    ]
+    for size in (1, 3, 7):
+        assert await _collect(StatementImportService._csv_records(_chunks(data, size))) == expected
+
+
+@pytest.mark.asyncio
+async def test_ofx_records_parse_sgml_transactions():
+    """Test that unclosed SGML tags inside STMTTRN blocks become transaction fields"""
+    data = (
+        b"OFXHEADER:100\n<OFX><BANKTRANLIST>\n<STMTTRN>\n<TRNTYPE>POS\n<DTPOSTED>20240315120000[0:GMT]\n"
+        b"<TRNAMT>-9.99\n<NAME>Coffee\n<MEMO>Card\n</STMTTRN>\n</BANKTRANLIST></OFX>"
+    )
+
+    records = await _collect(StatementImportService._ofx_records(_chunks(data, 5)))
+
+    assert records == [
+        (
+            1,
+            {
+                "transacted_at": "20240315120000[0:GMT]",
+                "amount": "-9.99",
+                "description": "Coffee - Card",
+                "payment_method": "pos",
+            },
+        )
+    ]
+    assert StatementImportService._parse_date(records[0][1]["transacted_at"]).isoformat() == "2024-03-15T12:00:00+00:00"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("with_income_default", [True, False])
+async def test_mixed_ofx_statement_types_rows_by_sign(with_income_default):
+    """Test that credits and debits of one statement import as income and expense, each under its default"""
+    data = (
+        b"<OFX><BANKTRANLIST>\n<STMTTRN>\n<DTPOSTED>20240315\n<TRNAMT>-9.99\n<NAME>Coffee\n</STMTTRN>\n"
+        b"<STMTTRN>\n<DTPOSTED>20240325\n<TRNAMT>2500.00\n<NAME>Salary\n</STMTTRN>\n"
+        b"<STMTTRN>\n<DTPOSTED>20240326\n<TRNAMT>4.50\n<NAME>Coffee refund\n</STMTTRN>\n</BANKTRANLIST></OFX>"
+    )
+    service = StatementImportService(None)
+    result = StatementImportResult(format="ofx")
+    expense, income = (uuid4(), "expense"), (uuid4(), "income")
+    defaults = DefaultCategories(outgoing=expense, income=income if with_income_default else None)
+
+    transactions = await _collect(service._transactions(service._ofx_records(_chunks(data, 16)), {}, defaults, result))
+
+    credit_category = income[0] if with_income_default else expense[0]
+    assert [(t.type, t.amount, t.category_id) for t in transactions] == [
+        ("expense", Decimal("9.99"), expense[0]),
+        ("income", Decimal("2500.00"), credit_category),
+        ("income", Decimal("4.50"), credit_category),
+    ]
+    assert (result.rows_processed, result.failed) == (3, 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size, committed", [(1, 1), (10, 0)])
+async def test_import_reports_committed_batches_when_the_stream_breaks(monkeypatch, batch_size, committed):
+    """Test that an unterminated quote after a committed batch returns the partial result instead of raising"""
+    data = b'Date,Amount,Category\n2024-03-01,-12.50,Rent\n2024-03-02,-3,"Rent\n'
+    service = StatementImportService(None)
+    category = (uuid4(), "expense")
+
+    async def load_categories(user_id):
+        return {"rent": [category]}
+
+    async def bulk_create_transactions(user_id, batch):
+        return batch
+
+    monkeypatch.setattr(service, "_load_categories", load_categories)
+    monkeypatch.setattr(service.transaction_service, "bulk_create_transactions", bulk_create_transactions)
+
+    if not committed:
+        with pytest.raises(ValueError, match="Unterminated"):
+            await service.import_statement(uuid4(), _chunks(data, 8), "csv", batch_size=batch_size)
+        return
+
+    result = await service.import_statement(uuid4(), _chunks(data, 8), "csv", batch_size=batch_size)
+
+    assert (result.imported, len(result.batches)) == (1, 1)
+    assert result.error == "Unterminated quoted field starting on line 3"
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("-9.99", "-9.99"),
+        ("+12", "12"),
+        ("£1,234.56", "1234.56"),
+        ("(12.50)", "-12.50"),
+        ("$(1,000.00)", "-1000.00"),
+    ],
+)
+def test_parse_amount(value, expected):
+    assert StatementImportService._parse_amount(value) == Decimal(expected)
+
+
+@pytest.mark.parametrize("value", ["1.234,56", "12,50", "1,23.4", "1.2.3", "(-5)", "", "abc"])
+def test_parse_amount_rejects_ambiguous_separators(value):
+    with pytest.raises(ValueError):
+        StatementImportService._parse_amount(value)
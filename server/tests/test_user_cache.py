@@ -0,0 +1,28 @@
+from app.utils.user_cache import TTLCache
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test that the oldest untouched entry is dropped once the cache is full"""
+    cache = TTLCache(ttl=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    """Test that entries are not returned after their TTL"""
+    now = [1000.0]
+    monkeypatch.setattr("app.utils.user_cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(ttl=30, max_entries=10)
+    cache.set("a", 1)
+
+    now[0] += 29
+    assert cache.get("a") == 1
+    now[0] += 2
+    assert cache.get("a") is None